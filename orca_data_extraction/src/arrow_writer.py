@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Provides the ArrowWriter class, which writes StructureData instances to a
+Parquet file (or an Arrow IPC stream) in row groups.
+
+Unlike the CSV and JSON files, in which every value is a string, the data
+columns are typed (float64, or float32 to halve their size), and the
+filename columns are dictionary-encoded, so the file can be loaded for
+analysis without parsing any text. The columns are laid out in advance from
+the input specification and named as in the CSV file (see csv_writer), and
+the values are taken directly from the DataSections rather than from the
+JSON records. Rows are kept in memory only until a row group is full, so the
+memory used does not grow with the number of files.
+
+This needs the optional dependency pyarrow, which is only imported when an
+ArrowWriter is created.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+from orca_data_extraction.src.csv_writer import (
+    get_column_values, get_data_columns)
+
+# Formats written by ArrowWriter, and the extensions of their files.
+ARROW_FORMATS = {'parquet': '.parquet', 'arrow': '.arrows'}
+# Types of the data columns.
+FLOAT_TYPES = ('float64', 'float32')
+# Default number of rows in each row group (or record batch).
+DEFAULT_ROW_GROUP_SIZE = 10000
+# Columns which hold the filenames rather than data.
+FILENAME_COLUMNS = ('script_input_filename', 'orca_out_filename')
+
+
+class ArrowWriter:
+    """
+    Writes StructureData instances to a Parquet file or an Arrow IPC stream,
+    one row per instance.
+
+    Attributes
+    ----------
+    __columns : list
+        List of the data columns (see csv_writer.get_data_columns).
+    __schema : pyarrow.Schema
+        Schema of the file.
+    __writer : pyarrow.parquet.ParquetWriter or pyarrow.ipc.RecordBatchWriter
+        Writer for the row groups (or record batches).
+    __sink : pyarrow.NativeFile or None
+        File written by the Arrow IPC writer (None for Parquet).
+    __row_group_size : int
+        Number of rows in each row group.
+    __rows : list
+        List of the values of each column in the rows not yet written.
+    __row_count : int
+        Number of rows written so far (including those not yet flushed).
+
+    Methods
+    -------
+    write
+        Adds the data from a StructureData instance as the next row.
+    close
+        Writes the remaining rows and closes the file.
+    get_row_count
+        Gives the number of rows written so far.
+    __flush
+        Writes the rows kept in memory as a row group.
+    """
+    def __init__(self, filename, section_specs, file_format='parquet',
+                 row_group_size=DEFAULT_ROW_GROUP_SIZE, float_type='float64'):
+        """
+        Creates the file and lays out its columns.
+
+        Parameters
+        ----------
+        filename : str
+            Filename of the file to write.
+        section_specs : list
+            List of tuples of the section name, the DataSection subclass and
+            its inputs, as given by StructureDataBuilder.get_section_specs.
+        file_format : str
+            'parquet' for a Parquet file, or 'arrow' for an Arrow IPC stream.
+        row_group_size : int
+            Number of rows in each row group (or record batch).
+        float_type : str
+            Type of the data columns, one of FLOAT_TYPES.
+
+        Raises
+        ------
+        ValueError
+            If file_format, row_group_size or float_type is not valid.
+        ImportError
+            If pyarrow is not installed.
+        """
+        if file_format not in ARROW_FORMATS:
+            raise ValueError(f'Unknown format {file_format!r}; expected one '
+                             f'of {", ".join(ARROW_FORMATS)}.')
+        if float_type not in FLOAT_TYPES:
+            raise ValueError(f'Unknown float type {float_type!r}; expected '
+                             f'one of {", ".join(FLOAT_TYPES)}.')
+        if row_group_size < 1:
+            raise ValueError('The row group size must be at least 1.')
+        # pyarrow is only needed for this writer.
+        import pyarrow as pa
+
+        self.__columns = get_data_columns(section_specs)
+        filename_type = pa.dictionary(pa.int32(), pa.string())
+        value_type = pa.float64() if float_type == 'float64' \
+            else pa.float32()
+        self.__schema = pa.schema(
+            [pa.field(column, filename_type) for column in FILENAME_COLUMNS] +
+            [pa.field(column, value_type) for column, _, _, _ in
+             self.__columns])
+        self.__sink = None
+        if file_format == 'parquet':
+            import pyarrow.parquet as pq
+            # Only the filenames are dictionary-encoded; this rarely helps
+            # for the values.
+            self.__writer = pq.ParquetWriter(
+                filename, self.__schema, use_dictionary=list(FILENAME_COLUMNS))
+        else:
+            import pyarrow.ipc
+            # The stream format (rather than the file format) allows each
+            # record batch to have its own dictionaries.
+            self.__sink = pa.OSFile(filename, 'wb')
+            self.__writer = pyarrow.ipc.new_stream(self.__sink, self.__schema)
+        self.__row_group_size = row_group_size
+        self.__rows = [[] for _ in range(len(self.__schema))]
+        self.__row_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, sd):
+        """
+        Adds the data from a StructureData instance as the next row, which is
+        written once its row group is full. Values which are missing or are
+        not numbers are written as nulls.
+
+        Parameters
+        ----------
+        sd : StructureData
+            StructureData instance from an ORCA .out file.
+        """
+        self.__rows[0].append(sd.get_input_filename())
+        self.__rows[1].append(sd.get_out_filename())
+        for column_values, value in zip(
+                self.__rows[len(FILENAME_COLUMNS):],
+                get_column_values(sd, self.__columns)):
+            column_values.append(_to_float(value))
+        self.__row_count += 1
+        if len(self.__rows[0]) >= self.__row_group_size:
+            self.__flush()
+
+    def close(self):
+        """Writes the rows kept in memory and closes the file."""
+        self.__flush()
+        self.__writer.close()
+        if self.__sink is not None:
+            self.__sink.close()
+
+    def get_row_count(self):
+        """
+        Gives the number of rows written so far.
+
+        Returns
+        -------
+        int
+            __row_count attribute.
+        """
+        return self.__row_count
+
+    def __flush(self):
+        """Writes the rows kept in memory as a row group (or record batch)."""
+        if not self.__rows[0]:
+            return
+        import pyarrow as pa
+
+        arrays = [
+            pa.array(values, type=pa.string()).dictionary_encode()
+            for values in self.__rows[:len(FILENAME_COLUMNS)]
+        ] + [
+            pa.array(values, type=value_type)
+            for values, value_type in zip(
+                self.__rows[len(FILENAME_COLUMNS):],
+                self.__schema.types[len(FILENAME_COLUMNS):])
+        ]
+        batch = pa.RecordBatch.from_arrays(arrays, schema=self.__schema)
+        if self.__sink is None:
+            self.__writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self.__writer.write_batch(batch)
+        self.__rows = [[] for _ in range(len(self.__schema))]
+
+
+def _to_float(value):
+    """Gives a value as a float, or None if it is missing or not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+An abstract class for DataSection subclasses that find atomic charges.
+
+ORCA prints atomic charges (e.g. Mulliken or Loewdin) as a table with one line
+per atom, of the form "  0 P :    0.303926". Rather than searching this table
+once for each atom label, the whole table is parsed once into a dictionary
+mapping atom labels to charges, from which all the inputs are then served.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import re
+from abc import ABC
+
+from orca_data_extraction.src.data_section_with_inputs import DataSectionWithInputs
+
+
+class AtomicCharges(DataSectionWithInputs, ABC):
+    """
+    A subclass of DataSectionWithInputs for tables of atomic charges.
+
+    Subclasses specify the table to be parsed with the _block_start,
+    _block_end and _block_occurrence class attributes.
+
+    Attributes
+    ----------
+    _charge_type : str
+        Class attribute: the type of charge (e.g. 'Mulliken'), used in error
+        messages.
+    _charge_regex : re.Pattern
+        Class attribute: regular expression that matches one line of an
+        atomic charge table.
+
+    Methods
+    -------
+    _find_data
+        Parses the charge table once and finds the charge of each input atom.
+    _search
+        Gives the charge of a single atom.
+    _parse_table
+        Parses the charge table into a dict mapping atom labels to charges.
+    """
+    # Class attributes.
+    _charge_type = ''
+    # Note: the element symbol may be directly followed by the colon, e.g.
+    # for two-letter elements ("  12 Cl:   -0.123456").
+    _charge_regex = re.compile(
+        r"""
+        ^(\ *)
+        ([\d]+)             # atom number
+        (\ +)
+        ([A-Za-z]+)         # element symbol
+        (\ *:)
+        (\ *)               # whitespace
+        (-?[\d]+[.][\d]+)   # charge
+        """,
+        flags=re.VERBOSE | re.MULTILINE
+    )
+
+    def _find_data(self):
+        """
+        Parses the charge table once and finds the charge of each atom in
+        _inputs; any atoms that are not found are reported together.
+
+        Returns
+        -------
+        search_results : dict
+            A dictionary containing the atom labels from _inputs as keys and
+            strings of their charges as values (None if not found).
+        """
+        charges = self._get_parsed(self._parse_table)
+        search_results = {}
+        missing = []
+        for atom_label in self._inputs:
+            search_results[atom_label] = charges.get(atom_label)
+            if search_results[atom_label] is None:
+                missing.append(atom_label)
+        if missing:
+            verb = 'was' if len(missing) == 1 else 'were'
+            print(f'Error: {", ".join(missing)} {verb} not found '
+                  f'in {self._out_filename} ({self._charge_type} Charges).')
+        return search_results
+
+    def _search(self, atom_label):
+        """
+        Gives the charge of a single atom.
+
+        Parameters
+        ----------
+        atom_label : str
+            String of the desired atom label.
+
+        Returns
+        -------
+        str or None
+            A string of a number corresponding to the charge of the atom, or
+            None if it was not found.
+        """
+        return self._get_parsed(self._parse_table).get(atom_label)
+
+    def _parse_table(self):
+        """
+        Parses the charge table into a dict mapping atom labels to charges.
+
+        Returns
+        -------
+        dict
+            Dictionary containing atom labels (e.g. '0 P') as keys and strings
+            of the corresponding charges as values. Empty if the table could
+            not be found.
+        """
+        block = self._get_block()
+        if block is None:
+            return {}
+        return {
+            f'{match.group(2)} {match.group(4)}': match.group(7)
+            for match in self._charge_regex.finditer(block)
+        }
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Builds StructureData instances for many ORCA .out files, in parallel.
+
+The build_structure_data function spreads the .out files over a pool of
+processes (one per CPU by default) and gives the results back in the same
+order as the filenames it was given, as soon as each one (and every one before
+it) is finished. Only a limited number of files are queued at any time, so a
+batch of tens of thousands of files never has every result held in memory at
+once unless the caller keeps them.
+
+Any error raised while building a particular file is given in its result
+instead of stopping the rest of the batch.
+
+If a cache directory is given, StructureData instances for .out files which
+have not changed since a previous run are taken from the cache (see
+extraction_cache), and the cache is pruned once the batch is finished.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+from orca_data_extraction.src.extraction_cache import prune_cache
+from orca_data_extraction.src.file_discovery import (
+    get_out_filename, iter_out_files)
+
+# Number of files queued per worker process, so that workers are never left
+# waiting while the results before theirs are being handled.
+FILES_PER_JOB = 4
+
+# StructureDataBuilder used by each worker process (see _init_worker).
+_worker_builder = None
+
+
+def find_out_files(directory='.'):
+    """
+    Gives the names of all the .out files (including compressed ones) in a
+    directory, in sorted order
+    (see file_discovery.iter_out_files to search subdirectories as well, or
+    to start processing the files before they have all been found).
+
+    Parameters
+    ----------
+    directory : str
+        Path of the directory to search.
+
+    Returns
+    -------
+    list
+        List of the paths of the .out files; these are just the filenames
+        when directory is the current working directory.
+    """
+    return list(iter_out_files([directory]))
+
+
+def build_structure_data(input_filename, out_filenames, jobs=None,
+                         cache_dir=None, read_mode='text', index_dir=None):
+    """
+    Builds a StructureData instance for each of a series of .out files.
+
+    Parameters
+    ----------
+    input_filename : str
+        String of filename of the input JSON file that contains lists of
+        desired atom labels for each type of data.
+    out_filenames : iterable
+        Filenames of the .out files, or for .out files which are not on
+        disk (e.g. members of archives), tuples of the filename and the
+        contents, as given by file_discovery.discover_out_files. These are
+        read as they are needed, so they may still be being found or read
+        while the first files are processed.
+    jobs : int or None
+        Number of processes to use; by default, one per CPU. If this is 1,
+        the files are built one at a time in this process.
+    cache_dir : str or None
+        Path of the directory used to cache StructureData instances; by
+        default, no cache is used.
+    read_mode : str
+        How the .out files are read (see out_file_reader.READ_MODES).
+    index_dir : str or None
+        Directory of the sidecar indexes for the 'indexed' read mode; by
+        default, each is kept next to its .out file.
+
+    Yields
+    ------
+    tuple
+        Tuple of the .out filename, its StructureData instance (None if it
+        could not be built) and a string describing the error that occurred
+        (None if it was built successfully), in the order of out_filenames.
+    """
+    yield from _build_all(input_filename, out_filenames, jobs, cache_dir,
+                          read_mode, index_dir)
+    if cache_dir is not None:
+        prune_cache(cache_dir)
+
+
+def _build_all(input_filename, out_filenames, jobs, cache_dir, read_mode,
+               index_dir):
+    """
+    Builds a StructureData instance for each of a series of .out files (see
+    build_structure_data), in order.
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if jobs < 2:
+        builder = StructureDataBuilder(input_filename, cache_dir, read_mode,
+                                       index_dir=index_dir)
+        for out_file in out_filenames:
+            yield _build(builder, out_file)
+        return
+
+    out_filenames = iter(out_filenames)
+    with ProcessPoolExecutor(max_workers=jobs,
+                             initializer=_init_worker,
+                             initargs=(input_filename, cache_dir,
+                                       read_mode, index_dir)) as executor:
+        pending = deque()
+
+        def submit(out_file):
+            pending.append((get_out_filename(out_file),
+                            executor.submit(_build_in_worker, out_file)))
+
+        for out_file in out_filenames:
+            submit(out_file)
+            if len(pending) >= jobs * FILES_PER_JOB:
+                break
+        while pending:
+            out_filename, future = pending.popleft()
+            try:
+                result = future.result()
+            except Exception as error:
+                # E.g. the worker process was killed.
+                result = (out_filename, None, _describe(error))
+            next_file = next(out_filenames, None)
+            if next_file is not None:
+                submit(next_file)
+            yield result
+
+
+def _build(builder, out_file):
+    """
+    Builds the StructureData instance for one .out file, catching any error.
+
+    Parameters
+    ----------
+    builder : StructureDataBuilder
+        Builder for the StructureData instance.
+    out_file : str or tuple
+        Filename of the .out file, or a tuple of its filename and contents.
+
+    Returns
+    -------
+    tuple
+        Tuple of the .out filename, its StructureData instance (or None) and
+        a string describing the error (or None).
+    """
+    out_filename = get_out_filename(out_file)
+    out_data = None if isinstance(out_file, str) else out_file[1]
+    try:
+        return out_filename, builder.build(out_filename, out_data), None
+    except Exception as error:
+        return out_filename, None, _describe(error)
+
+
+def _describe(error):
+    """
+    Describes an exception as a string, e.g. 'IndexError: list index out of
+    range'. Strings are used rather than the exceptions themselves since they
+    can always be sent between processes.
+    """
+    return f'{type(error).__name__}: {error}'
+
+
+def _init_worker(input_filename, cache_dir, read_mode, index_dir):
+    """
+    Creates the StructureDataBuilder for a worker process, so that the input
+    file is read once per process rather than once per .out file.
+    """
+    global _worker_builder
+    _worker_builder = StructureDataBuilder(input_filename, cache_dir,
+                                           read_mode, index_dir=index_dir)
+
+
+def _build_in_worker(out_file):
+    """Builds the StructureData instance for one .out file in a worker."""
+    return _build(_worker_builder, out_file)
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Provides read_blocks, which reads only the desired blocks of an ORCA .out
+file in a single pass, holding a bounded amount of the file in memory.
+
+This is used for .out files which are too large to be read into memory as a
+whole (e.g. long molecular dynamics runs or trajectories). The file is read
+in fixed-size chunks, each of which is cut at its last line break so that a
+header is never split between two chunks. The headers found in each chunk
+drive a small state machine for every block that is wanted (as given by
+DataSection.get_blocks): a block is opened at its header and closed at the
+first trailing marker after it. For a block counted from the start of the
+file, the capture stops once it is closed; for one counted from the end
+(e.g. the final geometry), each closed block replaces the one before it.
+If every block is counted from the start, the rest of the file is not read
+once they have all been found.
+Only the text of open blocks and of the blocks which have been kept is held
+in memory, so the memory used depends on the size of these blocks rather
+than that of the file.
+
+The kept blocks are then joined in their original order, so that they can be
+indexed and parsed in the same way as the whole file (see SectionIndex): each
+block is then the only one, or the first or last one, of its kind. The
+BlockStream class, which finds the blocks, is also used to read the parts of
+a file that lie before its tail (see tail_reader).
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import re
+from collections import deque
+
+from orca_data_extraction.src.section_index import SECTION_HEADERS
+
+# Number of characters read from the file at a time.
+CHUNK_SIZE = 1 << 20
+
+
+class _BlockCapture:
+    """
+    Follows the occurrences of one block in a stream of header matches, and
+    keeps the text of the occurrence that is wanted.
+
+    As for section_index.locate_block, the block begins with its header and
+    ends with the first trailing marker after it (inclusive), and blocks
+    counted from the end only include those which are followed by a
+    trailing marker.
+
+    Attributes
+    ----------
+    __start_header : str
+        Header that begins the block.
+    __end_header : str
+        Marker that ends the block.
+    __occurrence : int
+        Which occurrence of the block is wanted, indexed as for a list.
+    __starts_seen : int
+        Number of occurrences of __start_header seen so far.
+    __open_starts : list
+        Offsets of the headers of the blocks which have not been closed yet
+        and may still be wanted.
+    __closed : deque
+        Tuples of the start and end offsets and the text of the most recent
+        closed blocks (only the first wanted one, for blocks counted from the
+        start).
+    """
+    def __init__(self, start_header, end_header, occurrence):
+        """
+        Parameters
+        ----------
+        start_header : str
+            Header that begins the block.
+        end_header : str
+            Marker that ends the block.
+        occurrence : int
+            Which occurrence of start_header begins the block, indexed as for
+            a list (i.e. 0 is the first and -1 is the last).
+        """
+        self.__start_header = start_header
+        self.__end_header = end_header
+        self.__occurrence = occurrence
+        self.__starts_seen = 0
+        self.__open_starts = []
+        self.__closed = deque(maxlen=max(-occurrence, 1))
+
+    def on_header(self, header, offset, get_text):
+        """
+        Updates the state of the capture for a header found in the file.
+
+        Parameters
+        ----------
+        header : str
+            The header that was found.
+        offset : int
+            Offset of the header in the file.
+        get_text : callable
+            Function giving the text of the file between two offsets, which
+            must still be held in memory (see get_retain_from).
+        """
+        if header == self.__start_header:
+            if self.__occurrence < 0 or \
+                    self.__starts_seen == self.__occurrence:
+                self.__open_starts.append(offset)
+            self.__starts_seen += 1
+        if header == self.__end_header and self.__open_starts:
+            still_open = []
+            for start in self.__open_starts:
+                if offset >= start + len(self.__start_header):
+                    end = offset + len(self.__end_header)
+                    self.__closed.append((start, end, get_text(start, end)))
+                else:
+                    still_open.append(start)
+            self.__open_starts = still_open
+
+    def is_done(self):
+        """
+        Gives whether the wanted block has been found for certain, which is
+        only the case for blocks counted from the start of the file.
+        """
+        return self.__occurrence >= 0 and bool(self.__closed)
+
+    def get_retain_from(self):
+        """
+        Gives the offset from which the text of the file must be held in
+        memory for this capture, or None if no block is open.
+        """
+        return min(self.__open_starts, default=None)
+
+    def get_block(self):
+        """
+        Gives the wanted block, as a tuple of its start and end offsets and
+        its text, or None if it was not found.
+        """
+        if self.__occurrence >= 0:
+            return self.__closed[0] if self.__closed else None
+        if len(self.__closed) < -self.__occurrence:
+            return None
+        return self.__closed[0]
+
+
+class BlockStream:
+    """
+    Finds the desired blocks in the text of a .out file, which is given to
+    it in order, one chunk of whole lines at a time.
+
+    Attributes
+    ----------
+    __captures : list
+        List of the _BlockCapture instances for the desired blocks.
+    __anchors : re.Pattern
+        Regular expression which matches any of the headers.
+    __prefixes : dict
+        Dictionary mapping each header to the headers which are prefixes of
+        it (including itself).
+    __retained : deque
+        Tuples of the offset and text of the chunks which are held in memory.
+    __offset : int
+        Offset of the end of the text given so far.
+    __header_counts : dict
+        Dictionary mapping each header to the number of times it has been
+        found so far.
+
+    Methods
+    -------
+    feed
+        Finds the headers in the next chunk of text.
+    is_done
+        Gives whether every desired block has been found for certain.
+    has_open_blocks
+        Gives whether any desired block has begun but not yet ended.
+    get_header_count
+        Gives the number of times a header has been found so far.
+    get_offset
+        Gives the offset of the end of the text given so far.
+    get_found_blocks
+        Gives the desired blocks which were found.
+    """
+    def __init__(self, blocks, headers=SECTION_HEADERS):
+        """
+        Parameters
+        ----------
+        blocks : iterable
+            Tuples of the header, trailing marker and occurrence of each block
+            (see DataSection.get_blocks).
+        headers : tuple
+            Tuple of strings of the other headers that are searched for,
+            which should be those indexed by SectionIndex so that the same
+            occurrences of each header are found.
+        """
+        blocks = tuple(dict.fromkeys(blocks))
+        self.__captures = [_BlockCapture(*block) for block in blocks]
+        all_headers = tuple(dict.fromkeys(
+            headers +
+            tuple(header for block in blocks for header in block[:2])))
+        # As in SectionIndex, longer headers are matched first, and each match
+        # counts as an occurrence of every header which is a prefix of it.
+        self.__anchors = re.compile('|'.join(
+            re.escape(header)
+            for header in sorted(all_headers, key=len, reverse=True)))
+        self.__prefixes = {
+            header: [h for h in all_headers if header.startswith(h)]
+            for header in all_headers
+        }
+        self.__retained = deque()
+        self.__offset = 0
+        self.__header_counts = dict.fromkeys(all_headers, 0)
+
+    def feed(self, text):
+        """
+        Finds the headers in the next chunk of text, and updates the blocks.
+
+        Parameters
+        ----------
+        text : str
+            The next chunk of the text, which should end with a line break
+            (unless it is the end of the file) so that no header is split.
+        """
+        self.__retained.append((self.__offset, text))
+        for match in self.__anchors.finditer(text):
+            for header in self.__prefixes[match.group()]:
+                self.__header_counts[header] += 1
+                for capture in self.__captures:
+                    capture.on_header(header, self.__offset + match.start(),
+                                      self.__get_text)
+        self.__offset += len(text)
+        # Text before the earliest open block is no longer needed.
+        retain_from = min((capture.get_retain_from()
+                           for capture in self.__captures
+                           if capture.get_retain_from() is not None),
+                          default=self.__offset)
+        while self.__retained:
+            chunk_offset, chunk = self.__retained[0]
+            if chunk_offset + len(chunk) > retain_from:
+                break
+            self.__retained.popleft()
+
+    def __get_text(self, start, end):
+        """Gives the text between two offsets from the retained chunks."""
+        chunks = [(chunk_offset, chunk)
+                  for chunk_offset, chunk in self.__retained
+                  if chunk_offset < end and chunk_offset + len(chunk) > start]
+        text = ''.join(chunk for _, chunk in chunks)
+        return text[start - chunks[0][0]:end - chunks[0][0]]
+
+    def is_done(self):
+        """
+        Gives whether every desired block has been found for certain, i.e.
+        they are all counted from the start of the file and have been found,
+        so that the rest of the file need not be read.
+        """
+        return all(capture.is_done() for capture in self.__captures)
+
+    def has_open_blocks(self):
+        """
+        Gives whether any desired block has begun but not yet ended in the
+        text given so far.
+        """
+        return any(capture.get_retain_from() is not None
+                   for capture in self.__captures)
+
+    def get_header_count(self, header):
+        """
+        Gives the number of times a header (one of those searched for) has
+        been found in the text given so far.
+        """
+        return self.__header_counts.get(header, 0)
+
+    def get_offset(self):
+        """Gives the offset of the end of the text given so far."""
+        return self.__offset
+
+    def get_found_blocks(self):
+        """
+        Gives the desired blocks which were found in the text given so far.
+
+        Returns
+        -------
+        list
+            List of tuples of the start and end offsets and the text of each
+            block, sorted by their offsets.
+        """
+        return sorted(block for block in
+                      (capture.get_block() for capture in self.__captures)
+                      if block is not None)
+
+
+def join_blocks(found_blocks):
+    """
+    Joins blocks of text from a file in order, merging those which overlap
+    and putting a line break between the others.
+
+    Parameters
+    ----------
+    found_blocks : list
+        List of tuples of the start and end offsets and the text of each
+        block, sorted by their offsets.
+
+    Returns
+    -------
+    str
+        The joined text.
+    """
+    pieces = []
+    end = None
+    for block_start, block_end, block_text in found_blocks:
+        if end is not None and block_start < end:
+            if block_end > end:
+                pieces.append(block_text[end - block_start:])
+                end = block_end
+            continue
+        if end is not None:
+            pieces.append('\n')
+        pieces.append(block_text)
+        end = block_end
+    return ''.join(pieces)
+
+
+def read_blocks(file_object, blocks, headers=SECTION_HEADERS,
+                chunk_size=CHUNK_SIZE):
+    """
+    Reads the desired blocks of a .out file in one pass and joins them into
+    a shortened version of its contents.
+
+    Parameters
+    ----------
+    file_object : file object
+        The .out file, opened in text mode.
+    blocks : iterable
+        Tuples of the header, trailing marker and occurrence of each block
+        (see DataSection.get_blocks).
+    headers : tuple
+        Tuple of strings of the other headers that are searched for (see
+        BlockStream).
+    chunk_size : int
+        Number of characters read from the file at a time.
+
+    Returns
+    -------
+    str
+        Text of the blocks which were found, in the order in which they occur
+        in the file (see join_blocks).
+    """
+    stream = BlockStream(blocks, headers)
+    carry = ''
+    while not stream.is_done():
+        text = file_object.read(chunk_size)
+        if not text:
+            stream.feed(carry)
+            break
+        text = carry + text
+        # Only whole lines are searched, so that no header is split.
+        cut = text.rfind('\n') + 1
+        text, carry = text[:cut], text[cut:]
+        if text:
+            stream.feed(text)
+    return join_blocks(stream.get_found_blocks())
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
-The BondLengths class calculates or searches for and stores bond length data
-from an ORCA .out file.
+The BondLengths class calculates and stores bond length data from an ORCA
+.out file.
 """
 __author__ = "Peter Waddell"
 __copyright__ = "Copyright 2024"
@@ -12,26 +12,29 @@ __maintainer__ = "Peter Waddell"
 __email__ = "pmwaddell9@gmail.com"
 __status__ = "Prototype"
 
-import math
+from orca_data_extraction.src.geometric_parameters import (
+    GeometricParameters, calc_distances)
 
-from orca_data_extraction.src.data_section_with_inputs import DataSectionWithInputs
-from orca_data_extraction.src.final_geom import FinalGeometry
 
-
-class BondLengths(DataSectionWithInputs):
+class BondLengths(GeometricParameters):
     """
-    Finds and stores bond length data from an ORCA .out file.
+    Calculates and stores bond length data from an ORCA .out file.
+
+    Of course, these can be any two atoms whose coordinates appear in the
+    .out file; they do not have to be bound to each other in any way. The
+    lengths are in Ångstroms.
 
     Methods
     -------
-    _search
-        Search the .out file for bond length data.
-    __calc_atom_angle
-        Manually calcs the "bond length" of the 2 atoms in the input bond tuple.
-    get_datum
-        Gives the bond length from _data for a certain bond.
+    _calculate
+        Calculates the bond lengths of all the bond tuples at once.
     """
-    def __init__(self, out_filename, outfile_contents, inputs):
+    # Class attributes.
+    _parameter_type = 'bond'
+    _tuple_length = 2
+
+    def __init__(self, out_filename, outfile_contents, inputs,
+                 section_index=None, final_geom=None):
         """
         Parameters
         ----------
@@ -41,97 +44,17 @@ class BondLengths(DataSectionWithInputs):
             String containing the full text of the ORCA .out file.
         inputs : tuple
             Tuple of 'bond tuples' (i.e. tuples of two strings of atom labels,
-            e.g. ('1 H', '0 O')) for which bond length data will be searched.
+            e.g. ('1 H', '0 O')) for which bond lengths will be calculated.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
+        final_geom : FinalGeometry
+            FinalGeometry instance for the same .out file, which is used for
+            the coordinates of all the atoms (so it can be shared with other
+            DataSections). If not given, one is created for this instance.
         """
-        super().__init__(out_filename, outfile_contents, inputs)
+        super().__init__(out_filename, outfile_contents, inputs,
+                         section_index, final_geom)
         self._section_name = 'Bond Lengths'
 
-    def _search(self, bond_tuple):
-        return self.__calc_atom_distance(bond_tuple)
-
-    def __calc_atom_distance(self, bond_tuple):
-        """
-        Manually calcs the distance between two atoms in the input bond tuple.
-
-        Of course, these can be any two atoms whose coordinates appear in the
-        .out file; they do not have to be bound to each other in any way.
-
-        Parameters
-        ----------
-        bond_tuple : tuple
-            Tuple containing two atom labels, representing the desired bond.
-
-        Returns
-        -------
-        str
-            String containing the distance between the two atoms in Angstroms,
-            as calculated from sqrt((x1-x2)^2 + (y1-y2)^2 + (z1-z2)^2).
-
-        Raises
-        ------
-        TypeError
-            This occurs when one of the atom labels in the input bond tuple
-            does not have corresponding data in _input_geoms.
-        """
-        final_geom = \
-            FinalGeometry(out_filename=self._out_filename,
-                          outfile_contents=self._outfile_contents,
-                          inputs=(bond_tuple[0], bond_tuple[1]))
-
-        atom0, atom1 = bond_tuple[0], bond_tuple[1]
-        # I've decided DRY here is more trouble than its worth...
-        try:
-            atom0_x = float(final_geom.get_datum(atom0)['x'])
-            atom0_y = float(final_geom.get_datum(atom0)['y'])
-            atom0_z = float(final_geom.get_datum(atom0)['z'])
-        except TypeError:
-            print(f'Manual calculation failed for bond {atom0}-{atom1}:'
-                  f'{atom0} geometry data not found.')
-            return None
-        try:
-            atom1_x = float(final_geom.get_datum(atom1)['x'])
-            atom1_y = float(final_geom.get_datum(atom1)['y'])
-            atom1_z = float(final_geom.get_datum(atom1)['z'])
-        except TypeError:
-            print(f'Manual calculation failed for bond {atom0}-{atom1}:'
-                  f'{atom1} geometry data not found.')
-            return None
-        return str(
-            round(math.sqrt(((atom0_x - atom1_x) ** 2) +
-                             ((atom0_y - atom1_y) ** 2) +
-                             ((atom0_z - atom1_z) ** 2)), 5)
-        )
-
-    def get_datum(self, bond_tuple):
-        """
-        Gives the bond length from _data for a certain bond.
-
-        Parameters
-        ----------
-        bond_tuple : tuple
-            Tuple containing two atom labels, representing the desired bond.
-
-        Returns
-        -------
-        str
-            String consisting of the length of the corresponding
-            bond in Angstroms.
-
-        Raises
-        ------
-        KeyError
-            This occurs when the input 'bond' tuple can't be found as a key in
-            the dict containing the bond length data.
-        """
-        # In order to find the bond length no matter which atom is listed first
-        # in the bond tuple, this override is necessary.
-        try:
-            return self._data[bond_tuple]
-        except KeyError:
-            try:
-                flipped_bond_tuple = (bond_tuple[1], bond_tuple[0])
-                return self._data[flipped_bond_tuple]
-            except KeyError:
-                print(f'ERROR: {bond_tuple} not found in '
-                      f'{self._out_filename} (Bond Lengths).')
-                return None
+    def _calculate(self, coordinates, indices):
+        return calc_distances(coordinates, indices)
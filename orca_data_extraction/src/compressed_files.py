@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Detects and decompresses compressed ORCA .out files (e.g. .out.gz archived to
+save space), so that they can be read like any other .out file (see
+out_file_reader).
+
+The compression is detected from the first bytes of the file rather than its
+extension, and the file is decompressed as it is read, so no uncompressed
+copy is ever written. gzip, xz and bz2 are read with the standard library;
+zstd needs the optional dependency zstandard, which is only imported when a
+zstd-compressed file is read.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import bz2
+import gzip
+import lzma
+
+# Magic bytes at the start of the files of each type of compression.
+COMPRESSION_MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'\xfd7zXZ\x00', 'xz'),
+    (b'BZh', 'bz2'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+)
+# Extensions usually given to compressed .out files.
+COMPRESSED_EXTENSIONS = ('.gz', '.xz', '.bz2', '.zst')
+
+
+def detect_compression(file_object):
+    """
+    Detects the compression of a file from its magic bytes.
+
+    Parameters
+    ----------
+    file_object : file object
+        The file, opened in binary mode at its start; it is left at its
+        start.
+
+    Returns
+    -------
+    str or None
+        'gzip', 'xz', 'bz2' or 'zstd', or None if the file is not compressed
+        (or not in one of these formats).
+    """
+    magic_bytes = file_object.read(max(len(magic) for magic, _ in
+                                       COMPRESSION_MAGIC))
+    file_object.seek(0)
+    for magic, compression in COMPRESSION_MAGIC:
+        if magic_bytes.startswith(magic):
+            return compression
+    return None
+
+
+def open_decompressed(file_object, compression):
+    """
+    Gives a file object from which the decompressed contents of a compressed
+    file are read, as they are decompressed. Closing it does not close
+    file_object.
+
+    Parameters
+    ----------
+    file_object : file object
+        The compressed file, opened in binary mode at its start.
+    compression : str
+        Compression of the file, as given by detect_compression.
+
+    Returns
+    -------
+    file object
+        Readable binary file object of the decompressed contents.
+
+    Raises
+    ------
+    ValueError
+        If compression is not one of the types in COMPRESSION_MAGIC.
+    ImportError
+        If the file is compressed with zstd and zstandard is not installed.
+    """
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=file_object)
+    if compression == 'xz':
+        return lzma.LZMAFile(file_object)
+    if compression == 'bz2':
+        return bz2.BZ2File(file_object)
+    if compression == 'zstd':
+        try:
+            # zstandard is only needed for zstd-compressed files.
+            import zstandard
+        except ImportError as error:
+            raise ImportError('zstandard is needed to read zstd-compressed '
+                              '.out files; install it with pip or conda.',
+                              name='zstandard') from error
+        # Files written by concatenating several frames are read whole.
+        return zstandard.ZstdDecompressor().stream_reader(
+            file_object, read_across_frames=True, closefd=False)
+    raise ValueError(f'Unknown compression {compression!r}; expected one of '
+                     f'{", ".join(c for _, c in COMPRESSION_MAGIC)}.')
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Provides the CSVWriter class, which writes StructureData instances to a CSV
+file one row at a time.
+
+The columns of the CSV file are laid out in advance from the input
+specification (see StructureDataBuilder.get_section_specs) rather than from
+the data, so each row can be written as soon as its .out file has been
+processed, and nothing needs to be kept in memory afterwards. The columns
+are named in the same way as with pandas.json_normalize on the JSON records
+(see orca_out_to_json.make_json_record), e.g. "final_geometry.0_p.x", and
+the first column is the row number, as written by pandas.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import csv
+import os
+
+from orca_data_extraction.src.orca_out_to_json import (
+    format_column_name, format_section_name, make_json_record)
+
+
+def get_csv_columns(section_specs):
+    """
+    Gives the names of the columns of the CSV file for a set of sections.
+
+    Parameters
+    ----------
+    section_specs : list
+        List of tuples of the section name, the DataSection subclass and its
+        inputs (None for subclasses that do not take inputs), as given by
+        StructureDataBuilder.get_section_specs.
+
+    Returns
+    -------
+    columns : list
+        List of the column names, in order (without the row number column).
+    """
+    return ['script_input_filename', 'orca_out_filename'] + [
+        column for column, _, _, _ in get_data_columns(section_specs)]
+
+
+def get_data_columns(section_specs):
+    """
+    Gives the columns of the data for a set of sections, with where the value
+    of each column is found in a StructureData instance (e.g. for writers
+    which take the values directly from the DataSections, see arrow_writer).
+
+    Parameters
+    ----------
+    section_specs : list
+        List of tuples of the section name, the DataSection subclass and its
+        inputs, as given by StructureDataBuilder.get_section_specs.
+
+    Returns
+    -------
+    columns : list
+        List of tuples of the column name, the section name, the key of the
+        datum in the data of the section, and the key of the value in the
+        datum (None if the data of the section are not dicts), in order.
+    """
+    columns = []
+    for section_name, data_section, inputs in section_specs:
+        section_key = format_section_name(section_name)
+        datum_labels = data_section.get_datum_labels()
+        for data_label in data_section.get_data_labels(inputs or ()):
+            label = str(data_label) if type(data_label) == tuple \
+                else data_label
+            column = f'{section_key}.{format_column_name(label)}'
+            if datum_labels is None:
+                columns.append((column, section_name, data_label, None))
+            else:
+                columns.extend(
+                    (f'{column}.{datum_label}', section_name, data_label,
+                     datum_label)
+                    for datum_label in datum_labels)
+    return columns
+
+
+def get_column_values(sd, columns):
+    """
+    Gives the values of the data columns for a StructureData instance.
+
+    Parameters
+    ----------
+    sd : StructureData
+        StructureData instance from an ORCA .out file.
+    columns : list
+        List of the data columns, as given by get_data_columns.
+
+    Returns
+    -------
+    values : list
+        List of the value of each column (as found by the DataSections, i.e.
+        usually strings), or None for values which were not found or whose
+        section is not in sd.
+    """
+    data_sections = sd.get_data_sections()
+    section_data = {}
+    values = []
+    for _, section_name, data_label, datum_label in columns:
+        if section_name not in section_data:
+            data_section = data_sections.get(section_name)
+            section_data[section_name] = {} if data_section is None \
+                else data_section.get_data()
+        value = section_data[section_name].get(data_label)
+        if datum_label is not None and value is not None:
+            value = value.get(datum_label)
+        values.append(value)
+    return values
+
+
+def flatten_record(record, prefix=''):
+    """
+    Flattens a nested JSON record into a single dict, whose keys are the keys
+    of the nested dicts joined by '.' (as with pandas.json_normalize).
+
+    Parameters
+    ----------
+    record : dict
+        Dictionary which may contain other dictionaries as values.
+    prefix : str
+        Prefix for the keys of record (used for the nested dicts).
+
+    Returns
+    -------
+    flat_record : dict
+        Dictionary without nested dicts.
+    """
+    flat_record = {}
+    for key, value in record.items():
+        if type(value) is dict:
+            flat_record.update(flatten_record(value, f'{prefix}{key}.'))
+        else:
+            flat_record[f'{prefix}{key}'] = value
+    return flat_record
+
+
+class CSVWriter:
+    """
+    Writes StructureData instances to a CSV file, one row per instance.
+
+    Attributes
+    ----------
+    __writer : csv.DictWriter
+        Writer for the rows of the CSV file.
+    __row_count : int
+        Number of rows written so far.
+
+    Methods
+    -------
+    write
+        Writes the data from a StructureData instance as the next row.
+    get_row_count
+        Gives the number of rows written so far.
+    """
+    def __init__(self, file_object, columns):
+        """
+        Writes the header of the CSV file.
+
+        Parameters
+        ----------
+        file_object : file object
+            Text file opened for writing (with newline='').
+        columns : list
+            List of the column names, as given by get_csv_columns.
+        """
+        # The first column holds the row number, without a header (as
+        # written by pandas).
+        self.__writer = csv.DictWriter(file_object, fieldnames=[''] + columns,
+                                       extrasaction='ignore',
+                                       lineterminator=os.linesep)
+        self.__writer.writeheader()
+        self.__row_count = 0
+
+    def write(self, sd):
+        """
+        Writes the data from a StructureData instance as the next row. Data
+        which do not have a column are left out, and columns without data are
+        left empty.
+
+        Parameters
+        ----------
+        sd : StructureData
+            StructureData instance from an ORCA .out file.
+        """
+        row = flatten_record(make_json_record(sd))
+        row[''] = self.__row_count
+        self.__writer.writerow(row)
+        self.__row_count += 1
+
+    def get_row_count(self):
+        """
+        Gives the number of rows written so far.
+
+        Returns
+        -------
+        int
+            __row_count attribute.
+        """
+        return self.__row_count
@@ -20,6 +20,8 @@ __status__ = "Prototype"
 
 from abc import ABC, abstractmethod
 
+from orca_data_extraction.src.section_index import locate_block, get_text
+
 
 class DataSection(ABC):
     """
@@ -29,18 +31,58 @@ class DataSection(ABC):
     ----------
     _out_filename : str
         Name of the ORCA .out file that will be searched.
-    _outfile_contents : str
-        String containing the full text of the ORCA .out file.
+    _outfile_contents : str, bytes or mmap.mmap
+        Contents of the ORCA .out file, either as a string or as a bytes-like
+        buffer (e.g. a memory map of the file), of which only the blocks that
+        are parsed are decoded.
     _data : dict
         Dictionary containing the desired data, with relevant categories as
         keys (e.g. atom labels, bond tuples, polarizability parameters, etc.)
         and their corresponding values as values. Conventionally both are strs.
+        These are found the first time they are needed (see load).
+    _section_index : SectionIndex or None
+        Index of the offsets of the section headers in the .out file, used to
+        find the block of text that contains the desired data. If None, the
+        block is located directly (see section_index.locate_block).
+    _block_start : str or None
+        Class attribute: header that begins the block of text containing the
+        desired data (None if the subclass does not search a block itself).
+    _block_end : str or None
+        Class attribute: marker that ends the block of text.
+    _block_occurrence : int
+        Class attribute: which occurrence of the block holds the desired data,
+        indexed as for a list (i.e. 0 is the first and -1 is the last).
+    _data_labels : tuple
+        Class attribute: the keys of _data, for subclasses whose keys do not
+        depend on inputs.
+    _datum_labels : tuple or None
+        Class attribute: the keys of each datum, for subclasses whose data are
+        dicts (e.g. of coordinates); None if the data are strings.
 
     Methods
     -------
+    __getstate__
+        Gives the state used to pickle this instance, without the contents of
+        the .out file.
     _find_data
         Searches the .out file for the desired data, which is used to store
         these data in the _data attribute.
+    _get_block
+        Gives the text of the block that contains the desired data.
+    _get_parsed
+        Gives the result of parsing the block, shared by all DataSections
+        for the same file.
+    load
+        Finds the data, if they have not been found already.
+    parse
+        Parses the block that contains the desired data, without reporting
+        data that are missing.
+    get_blocks
+        Gives the blocks of text that are searched for the desired data.
+    get_data_labels
+        Gives the keys that _data will have, without searching a .out file.
+    get_datum_labels
+        Gives the keys that each datum will have, if the data are dicts.
     get_data
         Getter method that returns the _data attribute.
     get_datum
@@ -49,23 +91,64 @@ class DataSection(ABC):
         Getter method that returns the name of the DataSection subclass.
     get_out_filename
         Getter method that returns name of the .out file that the data is from.
+    set_out_filename
+        Setter method for the name of the .out file that the data is from.
     """
     # Class attributes.
     _std_error_msg = 'ERROR: not found'
+    _block_start = None
+    _block_end = None
+    _block_occurrence = -1
+    _data_labels = ()
+    _datum_labels = None
 
-    def __init__(self, out_filename, outfile_contents):
+    def __init__(self, out_filename, outfile_contents, section_index=None):
         """
         Parameters
         ----------
         out_filename : str
             Name of the ORCA .out file that will be searched.
-        outfile_contents : str
-            String containing the full text of the ORCA .out file.
+        outfile_contents : str, bytes or mmap.mmap
+            Contents of the ORCA .out file (see _outfile_contents).
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents. This should be
+            shared between all DataSections for the same file; if it is not
+            given, the block containing the data is located directly.
         """
         self._section_name = ''
         self._out_filename = out_filename
         self._outfile_contents = outfile_contents
-        self._data = self._find_data()
+        self._section_index = section_index
+        self.__data = None
+
+    @property
+    def _data(self):
+        """
+        The desired data, which are found (see _find_data) the first time they
+        are needed rather than when the instance is created, so that sections
+        which are never used cost nothing.
+        """
+        self.load()
+        return self.__data
+
+    def __getstate__(self):
+        """
+        Gives the state used to pickle this instance (e.g. to send it back
+        from a worker process). The data are found first if they have not
+        been already, and then the contents of the .out file and the section
+        index are left out, since they are only needed to find _data and are
+        much larger than it.
+
+        Returns
+        -------
+        dict
+            Dictionary of the attributes of this instance.
+        """
+        self.load()
+        state = self.__dict__.copy()
+        state['_outfile_contents'] = None
+        state['_section_index'] = None
+        return state
 
     @abstractmethod
     def _find_data(self):
@@ -77,6 +160,125 @@ class DataSection(ABC):
         """
         pass
 
+    def _get_block(self, occurrence=None):
+        """
+        Gives the text of the block that contains the desired data, as
+        specified by the _block_start, _block_end and _block_occurrence
+        class attributes.
+
+        Parameters
+        ----------
+        occurrence : int or None
+            Which occurrence of the block to give, indexed as for a list (e.g.
+            -2 for the second-to-last); by default _block_occurrence is used.
+            This allows falling back to an earlier block when the usual one
+            is incomplete.
+
+        Returns
+        -------
+        str or None
+            Text of the block, or None if it could not be found.
+        """
+        if occurrence is None:
+            occurrence = self._block_occurrence
+        if self._section_index is not None:
+            return self._section_index.get_block(
+                self._block_start, self._block_end, occurrence)
+        span = locate_block(self._outfile_contents, self._block_start,
+                            self._block_end, occurrence)
+        if span is None:
+            return None
+        return get_text(self._outfile_contents, span[0], span[1])
+
+    def _get_parsed(self, parse):
+        """
+        Gives the result of parse (a method that parses the block of this
+        DataSection). When there is a section index, the result is stored in
+        it so that other DataSections for the same file which parse the same
+        block (e.g. BondLengths and FinalGeometry) can reuse it.
+
+        Parameters
+        ----------
+        parse : callable
+            Bound method with no arguments that parses the block.
+
+        Returns
+        -------
+        The result of parse.
+        """
+        if self._section_index is None:
+            return parse()
+        key = (parse.__qualname__, self._block_start, self._block_end,
+               self._block_occurrence)
+        return self._section_index.get_parsed(key, parse)
+
+    @classmethod
+    def get_blocks(cls):
+        """
+        Gives the blocks of text that are searched for the desired data, so
+        that only these need to be read from a .out file (see block_stream).
+
+        Returns
+        -------
+        tuple
+            Tuple of tuples of the header, trailing marker and occurrence of
+            each block (empty if the subclass does not search a block).
+        """
+        if cls._block_start is None:
+            return ()
+        return ((cls._block_start, cls._block_end, cls._block_occurrence),)
+
+    @classmethod
+    def get_data_labels(cls, inputs=()):
+        """
+        Gives the keys that _data will have, without searching a .out file
+        (e.g. to lay out the columns of a table before any files are read).
+
+        Parameters
+        ----------
+        inputs : tuple
+            Tuple of the inputs, for subclasses that take inputs.
+
+        Returns
+        -------
+        tuple
+            Tuple of the keys of _data, in order.
+        """
+        return cls._data_labels
+
+    @classmethod
+    def get_datum_labels(cls):
+        """
+        Gives the keys that each datum will have, for subclasses whose data
+        are dicts (e.g. of coordinates).
+
+        Returns
+        -------
+        tuple or None
+            Tuple of the keys of each datum, in order, or None if the data
+            are not dicts.
+        """
+        return cls._datum_labels
+
+    def load(self):
+        """
+        Finds the data now, if they have not been found already (e.g. so that
+        the contents of the .out file can be closed afterwards).
+        """
+        if self.__data is None:
+            self.__data = self._find_data()
+
+    def parse(self):
+        """
+        Parses the block that contains the desired data into the section
+        index, e.g. so that every table of a .out file can be stored (see
+        table_cache), without reporting data that are missing (which is
+        left to the DataSections that are built). By default, the data are
+        found as by load; subclasses which report missing data whatever
+        their inputs override this.
+        """
+        self.load()
+
     def get_data(self):
         """
         Getter method that returns the _data attribute.
@@ -134,3 +336,16 @@ class DataSection(ABC):
             String of the filename of the ORCA .out file.
         """
         return self._out_filename
+
+    def set_out_filename(self, out_filename):
+        """
+        Sets the filename of the ORCA .out file associated with this instance
+        (e.g. when its data were stored for a copy of the file, see
+        extraction_cache).
+
+        Parameters
+        ----------
+        out_filename : str
+            String of the filename of the ORCA .out file.
+        """
+        self._out_filename = out_filename
@@ -40,10 +40,13 @@ class DataSectionWithInputs(DataSection, ABC):
     _search
         Abstract method which defines how each subclass of this class should
         go about searching the .out file for its particular type of data.
+    get_data_labels
+        Gives the keys that _data will have for a set of inputs.
     get_inputs
         Returns a copy of the _inputs attribute.
     """
-    def __init__(self, out_filename, outfile_contents, inputs):
+    def __init__(self, out_filename, outfile_contents, inputs,
+                 section_index=None):
         """
         Parameters
         ----------
@@ -55,9 +58,11 @@ class DataSectionWithInputs(DataSection, ABC):
             A tuple of information (e.g. strings of atom labels, or of tuples
             that contain strings of atom labels) which signify which pieces of
             information should be searched for.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
         """
         self._inputs = inputs
-        super().__init__(out_filename, outfile_contents)
+        super().__init__(out_filename, outfile_contents, section_index)
 
     def _find_data(self):
         """
@@ -88,6 +93,24 @@ class DataSectionWithInputs(DataSection, ABC):
         """
         pass
 
+    @classmethod
+    def get_data_labels(cls, inputs=()):
+        """
+        Gives the keys that _data will have for a set of inputs, without
+        searching a .out file: each distinct input, in order.
+
+        Parameters
+        ----------
+        inputs : tuple
+            Tuple of the inputs.
+
+        Returns
+        -------
+        tuple
+            Tuple of the keys of _data, in order.
+        """
+        return tuple(dict.fromkeys(inputs))
+
     def get_inputs(self):
         """
         Returns the inputs used for this instance.
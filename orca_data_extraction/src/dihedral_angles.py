@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+The DihedralAngles class calculates and stores dihedral angle data from an
+ORCA .out file.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+from orca_data_extraction.src.geometric_parameters import (
+    GeometricParameters, calc_dihedrals)
+
+
+class DihedralAngles(GeometricParameters):
+    """
+    Calculates and stores dihedral angle data from an ORCA .out file.
+
+    The dihedral (torsion) angles are signed, in degrees between -180 and 180,
+    about the bond between the second and third atoms of each tuple (see
+    geometric_parameters.calc_dihedrals). Listing the atoms of a tuple in the
+    reverse order gives the same angle, so either order can be used with
+    get_datum.
+
+    Methods
+    -------
+    _calculate
+        Calculates the dihedral angles of all the dihedral tuples at once.
+    """
+    # Class attributes.
+    _parameter_type = 'dihedral angle'
+    _tuple_length = 4
+
+    def __init__(self, out_filename, outfile_contents, inputs,
+                 section_index=None, final_geom=None):
+        """
+        Parameters
+        ----------
+        out_filename : str
+            Name of the ORCA .out file that will be searched.
+        outfile_contents : str
+            String containing the full text of the ORCA .out file.
+        inputs : tuple
+            Tuple of 'dihedral tuples' (i.e. tuples of four strings of atom
+            labels, e.g. ('3 H', '2 C', '1 C', '0 P')) for which dihedral
+            angles will be calculated.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
+        final_geom : FinalGeometry
+            FinalGeometry instance for the same .out file, which is used for
+            the coordinates of all the atoms (so it can be shared with other
+            DataSections). If not given, one is created for this instance.
+        """
+        super().__init__(out_filename, outfile_contents, inputs,
+                         section_index, final_geom)
+        self._section_name = 'Dihedral Angles'
+
+    def _calculate(self, coordinates, indices):
+        return calc_dihedrals(coordinates, indices)
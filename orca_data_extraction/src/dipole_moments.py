@@ -30,9 +30,19 @@ class DipoleMoments(DataSection):
     Methods
     -------
     _find_data
+        Gives the dipole moment data.
+    parse
+        Parses the block without reporting missing data.
+    _parse_block
         Search the .out file for polarizability data, return as dict.
     """
-    def __init__(self, out_filename, outfile_contents):
+    # Class attributes.
+    _block_start = 'DIPOLE MOMENT'
+    _block_end = 'Rotational spectrum'
+    _block_occurrence = 0
+    _data_labels = ('X', 'Y', 'Z', 'Tot')
+
+    def __init__(self, out_filename, outfile_contents, section_index=None):
         """
         Parameters
         ----------
@@ -40,6 +50,8 @@ class DipoleMoments(DataSection):
             Name of the ORCA .out file that will be searched.
         outfile_contents : str
             String containing the full text of the ORCA .out file.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
         """
         # Note: \ must be used for all whitespace I want to count
         # when using verbose regular expressions.
@@ -58,24 +70,53 @@ class DipoleMoments(DataSection):
             (Magnitude\ \(a.u.\))
             (.*?)
             (-?[\d]+[.][\d]+)   # total dipole moment
-            (.*?)
-            (Rotational\ spectrum)
-            # above: prevents accidental matches later in the .out file
             """,
             flags=re.VERBOSE | re.DOTALL
         )
-        super().__init__(out_filename, outfile_contents)
+        super().__init__(out_filename, outfile_contents, section_index)
         self._section_name = 'Dipole Moments'
 
     def _find_data(self):
         """
-        Search the .out file for dipole moment data, return as dict.
+        Gives the dipole moment data, which are parsed once per file (see
+        _parse_block).
 
         Returns
         -------
         dict
+            Dictionary of the dipole moment data (see _parse_block), with
+            None as each value if they were not found.
+        """
+        data = self._get_parsed(self._parse_block)
+        # This is reported here rather than when the block is parsed, so
+        # that it is also reported when the parsed tables are taken from a
+        # table_cache.
+        if data is None:
+            print(f'Dipole moments data not found in '
+                  f'{self._out_filename} data.')
+            return dict.fromkeys(self._data_labels)
+        return data
+
+    def parse(self):
+        """
+        Parses the dipole moment data into the section index, without reporting
+        them if they are missing (see DataSection.parse).
+        """
+        self._get_parsed(self._parse_block)
+
+    def _parse_block(self):
+        """
+        Search the .out file for dipole moment data, return as dict.
+
+        The result is shared by other instances for the same file, and can
+        be stored with the other parsed tables of the file (see table_cache).
+
+        Returns
+        -------
+        dict or None
             Dictionary containing dipole moment parameters as keys and the
-            corresponding dipole moments (in AU) as values (as strings).
+            corresponding dipole moments (in AU) as values (as strings), or
+            None if they were not found.
 
         Raises
         ------
@@ -84,14 +125,16 @@ class DipoleMoments(DataSection):
             for, and returns NoneType. Then, .group(n) gives this error.
         """
         try:
-            result = self._regex.search(self._outfile_contents)
+            # The header and trailing marker are located first (see the
+            # _block_start and _block_end attributes), so a missing section is
+            # reported without running the regex, which is then only tried at
+            # the header at the start of the block.
+            block = self._get_block()
+            result = None if block is None else self._regex.match(block)
             X = result.group(5)
             Y = result.group(7)
             Z = result.group(9)
             Tot = result.group(13)
             return {'X': X, 'Y': Y, 'Z': Z, 'Tot': Tot}
         except AttributeError:
-            print(f'Dipole moments data not found in '
-                  f'{self._out_filename} data.')
-            return {'X': None, 'Y': None,
-                    'Z': None, 'Tot': None}
+            return None
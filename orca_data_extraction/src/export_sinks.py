@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Structures the outputs to which the data extracted from ORCA .out files are
+written.
+
+The ExportSink abstract class provides an interface for writing StructureData
+instances to an output one at a time, as each .out file is processed, so that
+the same instances can be written to any number of outputs (see fan_out) and
+the .out files only have to be processed once. Each subclass wraps one of the
+writers of the orca_out_to_* scripts, and SINK_TYPES maps the name of each
+type of output to its subclass; other outputs can be added by subclassing
+ExportSink.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import json
+from abc import ABC, abstractmethod
+
+from orca_data_extraction.src.arrow_writer import (
+    ARROW_FORMATS, DEFAULT_ROW_GROUP_SIZE, ArrowWriter)
+from orca_data_extraction.src.csv_writer import CSVWriter, get_csv_columns
+from orca_data_extraction.src.file_fingerprint import input_spec_hash
+from orca_data_extraction.src.input_reader_json import InputReaderJSON
+from orca_data_extraction.src.ndjson_writer import NDJSONWriter
+from orca_data_extraction.src.orca_out_to_json import make_json_record
+from orca_data_extraction.src.results_store import (
+    FILES_PER_COMMIT, ResultsStore)
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+from orca_data_extraction.src.xlsx_writer import XLSXWriter
+
+
+class ExportSink(ABC):
+    """
+    Writes StructureData instances to an output, one at a time.
+
+    Instances may be written from a different thread than the one that
+    created them (see fan_out), but only from one thread at a time.
+
+    Attributes
+    ----------
+    _output_filename : str
+        Filename of the output.
+    _extension : str
+        Class attribute: extension added to the name of the output.
+
+    Methods
+    -------
+    write
+        Writes the data from a StructureData instance to the output.
+    close
+        Finishes writing the output.
+    get_output_filename
+        Gives the filename of the output.
+    """
+    # Class attributes.
+    _extension = ''
+
+    def __init__(self, output_name):
+        """
+        Parameters
+        ----------
+        output_name : str
+            Name of the output, without its extension.
+        """
+        self._output_filename = output_name + self._extension
+
+    @abstractmethod
+    def write(self, sd):
+        """
+        Writes the data from a StructureData instance to the output.
+
+        Parameters
+        ----------
+        sd : StructureData
+            StructureData instance from an ORCA .out file.
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """Finishes writing the output, once every instance is written."""
+        pass
+
+    def get_output_filename(self):
+        """
+        Gives the filename of the output.
+
+        Returns
+        -------
+        str
+            _output_filename attribute.
+        """
+        return self._output_filename
+
+
+class CSVSink(ExportSink):
+    """Writes a CSV file, as orca_out_to_csv does (see csv_writer)."""
+    # Class attributes.
+    _extension = '.csv'
+
+    def __init__(self, output_name, section_specs):
+        """
+        Parameters
+        ----------
+        output_name : str
+            Name of the CSV file, without its extension.
+        section_specs : list
+            List of tuples of the section name, the DataSection subclass and
+            its inputs, as given by StructureDataBuilder.get_section_specs.
+        """
+        super().__init__(output_name)
+        self.__csv_file = open(self._output_filename, 'w', newline='')
+        self.__csv_writer = CSVWriter(self.__csv_file,
+                                      get_csv_columns(section_specs))
+
+    def write(self, sd):
+        self.__csv_writer.write(sd)
+
+    def close(self):
+        self.__csv_file.close()
+
+
+class JSONSink(ExportSink):
+    """
+    Writes a JSON file, as orca_out_to_json does, but one record at a time:
+    the file is the same as that written by create_json_from_sds, but the
+    records are not kept in memory.
+    """
+    # Class attributes.
+    _extension = '.json'
+
+    def __init__(self, output_name):
+        """
+        Parameters
+        ----------
+        output_name : str
+            Name of the JSON file, without its extension.
+        """
+        super().__init__(output_name)
+        self.__json_file = open(self._output_filename, 'w')
+        self.__json_file.write('[')
+        self.__record_count = 0
+
+    def write(self, sd):
+        # Each record is indented as it would be by json.dump(..., indent=2)
+        # as an item of the list.
+        record = json.dumps(make_json_record(sd), indent=2)
+        self.__json_file.write(
+            (',\n  ' if self.__record_count else '\n  ') +
+            record.replace('\n', '\n  '))
+        self.__record_count += 1
+
+    def close(self):
+        self.__json_file.write('\n]' if self.__record_count else ']')
+        self.__json_file.close()
+
+
+class NDJSONSink(ExportSink):
+    """Writes a newline-delimited JSON file (see ndjson_writer)."""
+    # Class attributes.
+    _extension = '.jsonl'
+
+    def __init__(self, output_name):
+        """
+        Parameters
+        ----------
+        output_name : str
+            Name of the newline-delimited JSON file, without its extension.
+        """
+        super().__init__(output_name)
+        self.__ndjson_file = open(self._output_filename, 'w')
+        self.__ndjson_writer = NDJSONWriter(self.__ndjson_file)
+
+    def write(self, sd):
+        self.__ndjson_writer.write(sd)
+
+    def close(self):
+        self.__ndjson_file.close()
+
+
+class XLSXSink(ExportSink):
+    """Writes an .xlsx workbook, as orca_out_to_excel does (see xlsx_writer)."""
+    # Class attributes.
+    _extension = '.xlsx'
+
+    def __init__(self, output_name, section_specs, split_sections=False):
+        """
+        Parameters
+        ----------
+        output_name : str
+            Name of the workbook, without its extension.
+        section_specs : list
+            List of tuples of the section name, the DataSection subclass and
+            its inputs, as given by StructureDataBuilder.get_section_specs.
+        split_sections : bool
+            If True, each section is written on a sheet of its own.
+        """
+        super().__init__(output_name)
+        self.__xlsx_writer = XLSXWriter(self._output_filename, section_specs,
+                                        split_sections)
+
+    def write(self, sd):
+        self.__xlsx_writer.write(sd)
+
+    def close(self):
+        self.__xlsx_writer.close()
+
+
+class ParquetSink(ExportSink):
+    """
+    Writes a Parquet file (or Arrow IPC stream), as orca_out_to_parquet does
+    (see arrow_writer).
+    """
+    def __init__(self, output_name, section_specs, file_format='parquet',
+                 row_group_size=DEFAULT_ROW_GROUP_SIZE, float_type='float64'):
+        """
+        Parameters
+        ----------
+        output_name : str
+            Name of the file, without its extension.
+        section_specs : list
+            List of tuples of the section name, the DataSection subclass and
+            its inputs, as given by StructureDataBuilder.get_section_specs.
+        file_format : str
+            'parquet' or 'arrow' (see ArrowWriter).
+        row_group_size : int
+            Number of rows in each row group.
+        float_type : str
+            Type of the data columns (see ArrowWriter).
+
+        Raises
+        ------
+        ValueError
+            If file_format, row_group_size or float_type is not valid.
+        """
+        if file_format not in ARROW_FORMATS:
+            raise ValueError(f'Unknown format {file_format!r}; expected one '
+                             f'of {", ".join(ARROW_FORMATS)}.')
+        super().__init__(output_name)
+        self._output_filename = output_name + ARROW_FORMATS[file_format]
+        self.__arrow_writer = ArrowWriter(self._output_filename, section_specs,
+                                          file_format, row_group_size,
+                                          float_type)
+
+    def write(self, sd):
+        self.__arrow_writer.write(sd)
+
+    def close(self):
+        self.__arrow_writer.close()
+
+
+class SQLiteSink(ExportSink):
+    """
+    Stores the data in an SQLite database, as orca_out_to_sqlite does (see
+    results_store), replacing any stored data of the same .out files.
+    """
+    # Class attributes.
+    _extension = '.sqlite'
+
+    def __init__(self, output_name, spec_hash):
+        """
+        Parameters
+        ----------
+        output_name : str
+            Name of the database, without its extension.
+        spec_hash : str
+            Hash of the input specification (see file_fingerprint).
+        """
+        super().__init__(output_name)
+        self.__spec_hash = spec_hash
+        # The database is opened by the thread that writes to it (see
+        # __get_results_store), since an SQLite connection can only be used
+        # by the thread that opened it.
+        self.__results_store = None
+        self.__stored_count = 0
+
+    def write(self, sd):
+        self.__get_results_store().put(sd)
+        self.__stored_count += 1
+        if self.__stored_count % FILES_PER_COMMIT == 0:
+            self.__results_store.commit()
+
+    def close(self):
+        self.__get_results_store().close()
+
+    def __get_results_store(self):
+        """Gives the ResultsStore, opening the database if necessary."""
+        if self.__results_store is None:
+            self.__results_store = ResultsStore(self._output_filename,
+                                                self.__spec_hash)
+        return self.__results_store
+
+
+# Types of output, by the name used to choose them (e.g. on the command line).
+SINK_TYPES = {
+    'csv': CSVSink,
+    'json': JSONSink,
+    'ndjson': NDJSONSink,
+    'excel': XLSXSink,
+    'parquet': ParquetSink,
+    'sqlite': SQLiteSink,
+}
+
+
+def make_sink(sink_type, output_name, input_filename, split_sections=False,
+              row_group_size=DEFAULT_ROW_GROUP_SIZE, float_type='float64'):
+    """
+    Creates an ExportSink of one of the types in SINK_TYPES, for the data
+    specified by an input file.
+
+    Parameters
+    ----------
+    sink_type : str
+        Name of the type of output (a key of SINK_TYPES).
+    output_name : str
+        Name of the output, without its extension.
+    input_filename : str
+        Filename of the input JSON file, from which the columns of the
+        output are laid out.
+    split_sections : bool
+        For 'excel', whether each section is written on a sheet of its own.
+    row_group_size : int
+        For 'parquet', the number of rows in each row group.
+    float_type : str
+        For 'parquet', the type of the data columns.
+
+    Returns
+    -------
+    ExportSink
+        The new ExportSink.
+
+    Raises
+    ------
+    ValueError
+        If sink_type is not one of SINK_TYPES.
+    ImportError
+        If an optional dependency of the output (e.g. pyarrow for 'parquet')
+        is not installed.
+    """
+    if sink_type not in SINK_TYPES:
+        raise ValueError(f'Unknown output type {sink_type!r}; expected one of '
+                         f'{", ".join(SINK_TYPES)}.')
+    if sink_type == 'json':
+        return JSONSink(output_name)
+    if sink_type == 'ndjson':
+        return NDJSONSink(output_name)
+    if sink_type == 'sqlite':
+        return SQLiteSink(output_name, input_spec_hash(
+            InputReaderJSON(input_filename).get_input_spec()))
+    section_specs = StructureDataBuilder(input_filename).get_section_specs()
+    if sink_type == 'csv':
+        return CSVSink(output_name, section_specs)
+    if sink_type == 'excel':
+        return XLSXSink(output_name, section_specs, split_sections)
+    return ParquetSink(output_name, section_specs,
+                       row_group_size=row_group_size, float_type=float_type)
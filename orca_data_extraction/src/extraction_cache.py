@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Provides the ExtractionCache class, which stores extracted data on disk.
+
+Extracting the data from an ORCA .out file which has not changed since the
+last run gives the same result, so the StructureData instance is stored in a
+cache directory and reused. Entries are found by:
+
+1. The stat key of the .out file (path, size and modification time), so an
+   unchanged file is recognized without reading it at all.
+2. The hash of the contents of the .out file, so a file which was copied,
+   moved or touched (but not changed) is recognized after reading it once.
+   This is only calculated when the cache holds a file of the same size, so
+   a new file is not read once to hash it and again to extract its data;
+   when the data are extracted by reading the whole file, it is hashed as it
+   is read (see out_file_reader). Otherwise (e.g. only the end of the file
+   was read, or its tables were in the table cache), the file is never read
+   just to hash it: the entry is stored under its stat key only, so it is
+   not found for copies of the file.
+
+Both keys also include the hash of the input specification and the version of
+the extraction code, so entries are never reused for different inputs or for
+data extracted by a different version.
+
+Entries are written to a temporary file and then renamed into place, so any
+number of processes can read and write the same cache directory at once: a
+reader sees either a complete entry or none. Old entries can be removed with
+prune_cache. Since entries are pickles, the cache directory should only be
+writable by trusted users.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+import pickle
+import time
+
+from orca_data_extraction.src.file_fingerprint import (
+    content_hash, hash_parts, stat_key)
+from orca_data_extraction.src.file_utils import write_atomic
+from orca_data_extraction.src.structure_data import StructureData
+
+# Version of the extraction code; this must be changed whenever a change to
+# the code would change the extracted data (or the attributes of the stored
+# instances), so that old entries are not used.
+EXTRACTION_VERSION = '0.1.3'
+# Default limits for prune_cache: 2 GiB in total and 30 days since last use.
+DEFAULT_MAX_SIZE = 2 * 1024 ** 3
+DEFAULT_MAX_AGE = 30 * 24 * 60 * 60
+
+
+class ExtractionCache:
+    """
+    Stores StructureData instances on disk, keyed by the fingerprint of their
+    .out file and of the input specification.
+
+    Attributes
+    ----------
+    __cache_dir : str
+        Path of the cache directory.
+    __spec_hash : str
+        Hash of the input specification (see file_fingerprint).
+    __content_hashes : dict
+        Dictionary mapping the paths of .out files looked up with get to
+        their content hashes, so that these are not calculated twice.
+
+    Methods
+    -------
+    get
+        Gives the stored StructureData instance for a .out file, if any.
+    put
+        Stores the StructureData instance for a .out file.
+    __object_key
+        Gives the key of the entry for a content hash.
+    __stat_path
+        Gives the path of the entry that maps a stat key to an object key.
+    __size_path
+        Gives the path of the entry that marks a size of the stored files.
+    __object_path
+        Gives the path of the entry that holds a StructureData instance.
+    __load
+        Loads the StructureData instance stored under an object key.
+    __write
+        Writes an entry atomically.
+    """
+    def __init__(self, cache_dir, spec_hash):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Path of the cache directory, which is created if necessary.
+        spec_hash : str
+            Hash of the input specification (see file_fingerprint).
+        """
+        self.__cache_dir = cache_dir
+        self.__spec_hash = spec_hash
+        self.__content_hashes = {}
+
+    def get(self, out_filename):
+        """
+        Gives the stored StructureData instance for a .out file. The file is
+        only read if its stat key is not in the cache and a file of the same
+        size is.
+
+        Parameters
+        ----------
+        out_filename : str
+            Path of the .out file.
+
+        Returns
+        -------
+        StructureData or None
+            The stored StructureData instance, with out_filename as the
+            filename of its .out file (it may have been stored for a copy of
+            the file), or None if there is none.
+        """
+        try:
+            key = stat_key(out_filename)
+        except OSError:
+            return None
+        try:
+            with open(self.__stat_path(key)) as file_object:
+                object_key = file_object.read()
+        except OSError:
+            object_key = None
+        sd = self.__load(object_key) if object_key else None
+        if sd is not None:
+            return _with_out_filename(sd, out_filename)
+
+        # The file may still have the same contents as one in the cache, but
+        # only if one of the same size is stored.
+        if not os.path.exists(self.__size_path(key[1])):
+            return None
+        try:
+            digest = content_hash(out_filename)
+        except OSError:
+            return None
+        self.__content_hashes[out_filename] = digest
+        object_key = self.__object_key(digest)
+        sd = self.__load(object_key)
+        if sd is None:
+            return None
+        write_atomic(self.__stat_path(key), object_key.encode('utf-8'))
+        return _with_out_filename(sd, out_filename)
+
+    def put(self, out_filename, sd, digest=None):
+        """
+        Stores the StructureData instance for a .out file, unless the file
+        has changed since the stat key of the instance was taken (see
+        StructureData.get_stat_key).
+
+        Parameters
+        ----------
+        out_filename : str
+            Path of the .out file.
+        sd : StructureData
+            The StructureData instance built from the .out file.
+        digest : str or None
+            Hash of the contents of the .out file, if it was hashed as it was
+            read (see out_file_reader). If it was not, and was not hashed by
+            get either, the file is not read again to hash it: the instance
+            is stored under its stat key only.
+        """
+        content_digest = self.__content_hashes.pop(out_filename, None)
+        digest = digest or content_digest
+        try:
+            key = sd.get_stat_key()
+            if key is None:
+                key = stat_key(out_filename)
+            # The file may have been changed while it was being read.
+            if stat_key(out_filename) != key:
+                return
+        except OSError:
+            return
+        if digest is None:
+            object_key = hash_parts('stat', *key, self.__spec_hash,
+                                    EXTRACTION_VERSION)
+        else:
+            object_key = self.__object_key(digest)
+        write_atomic(self.__object_path(object_key),
+                     pickle.dumps(sd, protocol=pickle.HIGHEST_PROTOCOL))
+        write_atomic(self.__stat_path(key), object_key.encode('utf-8'))
+        if digest is not None:
+            write_atomic(self.__size_path(key[1]), b'')
+
+    def __object_key(self, digest):
+        """Gives the key of the entry for a content hash."""
+        return hash_parts(digest, self.__spec_hash, EXTRACTION_VERSION)
+
+    def __stat_path(self, key):
+        """Gives the path of the entry that maps a stat key to an object."""
+        stat_hash = hash_parts(*key, self.__spec_hash, EXTRACTION_VERSION)
+        return os.path.join(self.__cache_dir, 'stats', stat_hash[:2],
+                            stat_hash)
+
+    def __size_path(self, size):
+        """
+        Gives the path of the entry that marks that a file of a size is
+        stored, so that only files of that size are hashed by get.
+        """
+        size_hash = hash_parts(size, self.__spec_hash, EXTRACTION_VERSION)
+        return os.path.join(self.__cache_dir, 'sizes', size_hash[:2],
+                            size_hash)
+
+    def __object_path(self, object_key):
+        """Gives the path of the entry that holds a StructureData instance."""
+        return os.path.join(self.__cache_dir, 'objects', object_key[:2],
+                            object_key + '.pickle')
+
+    def __load(self, object_key):
+        """
+        Gives the StructureData instance stored under object_key, or None if
+        there is none (or it cannot be loaded, e.g. it was just pruned).
+        """
+        path = self.__object_path(object_key)
+        try:
+            with open(path, 'rb') as file_object:
+                sd = pickle.load(file_object)
+            # Entries are pruned by the time they were last used.
+            os.utime(path)
+        except Exception:
+            return None
+        return sd
+
+
+def prune_cache(cache_dir, max_size=DEFAULT_MAX_SIZE,
+                max_age=DEFAULT_MAX_AGE):
+    """
+    Removes entries from a cache directory: first those which have not been
+    used for max_age seconds, then the least recently used entries until the
+    total size of the rest is at most max_size bytes.
+
+    Parameters
+    ----------
+    cache_dir : str
+        Path of the cache directory.
+    max_size : int or None
+        Maximum total size of the entries in bytes (None for no limit).
+    max_age : float or None
+        Maximum time since an entry was last used in seconds (None for no
+        limit).
+    """
+    oldest_allowed = None if max_age is None else time.time() - max_age
+    entries = []
+    for root, _, filenames in os.walk(cache_dir):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if oldest_allowed is not None and stat.st_mtime < oldest_allowed:
+                _remove(path)
+            elif filename.endswith(('.pickle', '.npz')):
+                entries.append((stat.st_mtime, stat.st_size, path))
+    if max_size is None:
+        return
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size:
+            break
+        _remove(path)
+        total_size -= size
+
+
+def _with_out_filename(sd, out_filename):
+    """
+    Gives a StructureData instance loaded from the cache with out_filename as
+    the filename of its .out file and of each of its DataSections.
+    """
+    data_sections = sd.get_data_sections()
+    for data_section in data_sections.values():
+        data_section.set_out_filename(out_filename)
+    return StructureData(out_filename, sd.get_input_filename(), data_sections,
+                         sd.get_stat_key())
+
+
+def _remove(path):
+    """Removes a file, if it has not already been removed."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Provides the FanOut class, which writes each StructureData instance to any
+number of outputs (see export_sinks) at the same time.
+
+Each ExportSink is written by a thread of its own, which takes the instances
+from a queue in the order in which they were given, so a slow output (e.g. a
+large .xlsx workbook, or an SQLite database on a network drive) does not hold
+up the others or the processing of the .out files; the queues are bounded, so
+the instances waiting to be written do not take up more and more memory if an
+output falls behind. Most of the time spent by the writers is in compressing,
+encoding and writing files, during which the GIL is usually released.
+
+If an output fails, the error is kept and the instances for that output are
+discarded, so that the other outputs are still written.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import queue
+import threading
+
+# Default number of instances which can wait to be written to each output.
+DEFAULT_QUEUE_SIZE = 64
+# Put in a queue after the last instance, to end its thread.
+_END = None
+
+
+class FanOut:
+    """
+    Writes StructureData instances to several ExportSinks, each in a thread of
+    its own.
+
+    Attributes
+    ----------
+    __sinks : list
+        List of the ExportSinks.
+    __queues : list
+        List of the queue of instances waiting to be written to each sink.
+    __threads : list
+        List of the thread which writes to each sink.
+    __errors : list
+        List of the exception raised by each sink, or None.
+
+    Methods
+    -------
+    write
+        Passes a StructureData instance to every sink.
+    close
+        Waits for every instance to be written and closes the sinks.
+    get_errors
+        Gives each sink which failed and the exception it raised.
+    __run_sink
+        Writes the instances in the queue of a sink, then closes it.
+    """
+    def __init__(self, sinks, queue_size=DEFAULT_QUEUE_SIZE):
+        """
+        Starts the thread of each sink.
+
+        Parameters
+        ----------
+        sinks : list
+            List of the ExportSinks to which the instances are written.
+        queue_size : int
+            Number of instances which can wait to be written to each sink
+            before write blocks.
+        """
+        self.__sinks = list(sinks)
+        self.__queues = [queue.Queue(queue_size) for _ in self.__sinks]
+        self.__errors = [None for _ in self.__sinks]
+        self.__threads = [
+            threading.Thread(target=self.__run_sink, args=(i,), daemon=True)
+            for i in range(len(self.__sinks))
+        ]
+        for thread in self.__threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, sd):
+        """
+        Passes a StructureData instance to every sink; this only blocks if a
+        sink has queue_size instances waiting to be written.
+
+        Parameters
+        ----------
+        sd : StructureData
+            StructureData instance from an ORCA .out file.
+        """
+        for sink_queue in self.__queues:
+            sink_queue.put(sd)
+
+    def close(self):
+        """
+        Waits for every instance to be written, and for every sink to be
+        closed.
+        """
+        for sink_queue in self.__queues:
+            sink_queue.put(_END)
+        for thread in self.__threads:
+            thread.join()
+
+    def get_errors(self):
+        """
+        Gives each sink which failed and the exception it raised.
+
+        Returns
+        -------
+        list
+            List of tuples of each ExportSink which failed and its exception.
+        """
+        return [(sink, error) for sink, error in zip(self.__sinks,
+                                                     self.__errors)
+                if error is not None]
+
+    def __run_sink(self, i):
+        """
+        Writes the instances in the queue of a sink until the end of the
+        queue, then closes the sink. After an error, the remaining instances
+        are taken from the queue but not written.
+
+        Parameters
+        ----------
+        i : int
+            Index of the sink (in __sinks).
+        """
+        sink = self.__sinks[i]
+        sink_queue = self.__queues[i]
+        while True:
+            sd = sink_queue.get()
+            if sd is _END:
+                break
+            if self.__errors[i] is None:
+                try:
+                    sink.write(sd)
+                except Exception as error:
+                    self.__errors[i] = error
+        try:
+            sink.close()
+        except Exception as error:
+            if self.__errors[i] is None:
+                self.__errors[i] = error
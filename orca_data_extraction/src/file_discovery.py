@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Finds the ORCA .out files to be processed: in one or more directories,
+optionally including their subdirectories, from a manifest listing their
+paths, and/or in tar or zip archives.
+
+The paths are given by generators, one at a time as they are found, so that
+build_structure_data can start processing the first files while the rest of
+a large tree (e.g. thousands of job directories on a slow network
+filesystem) is still being searched. Directories are read with os.scandir,
+which gives the type of each entry without another system call per file, and
+the entries of each directory are given in sorted order, so the order of the
+files is the same from one run to the next.
+
+Which files are included is decided by shell-style patterns (see fnmatch): a
+pattern without a "/" is matched against the name of each file (e.g.
+"*_opt.out"), and one with a "/" against its path relative to the directory
+being searched (e.g. "*/freq/*.out"). Patterns to exclude are also matched
+against each subdirectory, so that excluded subdirectories are not searched.
+
+The members of an archive are read without unpacking it (see
+iter_archive_members): a tar archive (uncompressed, or compressed as a whole
+with gzip, xz, bz2 or zstd, see compressed_files) is read once from start to
+end, and a zip archive member by member. Each member is given as a tuple of
+its path (the path of the archive joined to its name in the archive, e.g.
+"campaign.tar.gz/job1/opt.out") and its contents, which build_structure_data
+passes to the builder instead of a filename; the members may themselves be
+compressed. The archive is read by a thread of its own, a few members ahead
+of those being processed, so that reading and decompressing it overlaps with
+the processing of the members.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+import posixpath
+import queue
+import sys
+import tarfile
+import threading
+import zipfile
+from fnmatch import fnmatchcase
+
+from orca_data_extraction.src.compressed_files import (
+    COMPRESSED_EXTENSIONS, detect_compression, open_decompressed)
+
+# Patterns of the files which are included by default: .out files, and
+# compressed .out files (see compressed_files).
+DEFAULT_INCLUDE = ('*.out',) + tuple(f'*.out{extension}'
+                                     for extension in COMPRESSED_EXTENSIONS)
+# Number of members of an archive which are read ahead of those being
+# processed.
+PREFETCH_MEMBERS = 16
+# Put in the queue of members after the last one.
+_END = None
+
+
+def iter_out_files(directories=('.',), recursive=False,
+                   include=DEFAULT_INCLUDE, exclude=()):
+    """
+    Gives the paths of the .out files (including compressed ones, or other
+    files matching include) in some directories, one at a time as they are
+    found.
+
+    Parameters
+    ----------
+    directories : iterable
+        Paths of the directories to search.
+    recursive : bool
+        If True, the subdirectories of each directory are also searched
+        (after its files); symbolic links to directories are not followed.
+    include : iterable
+        Patterns, at least one of which each file must match.
+    exclude : iterable
+        Patterns which files and subdirectories must not match.
+
+    Yields
+    ------
+    str
+        Path of each file, joined to the directory in which it was found;
+        files in the current working directory (".") are given by name only.
+    """
+    include = tuple(include)
+    exclude = tuple(exclude)
+    for directory in directories:
+        # Each item is the path of a directory and its path relative to the
+        # directory being searched (using "/", for matching).
+        pending = [(directory, '')]
+        while pending:
+            path, relative_path = pending.pop()
+            subdirectories = []
+            try:
+                with os.scandir(path) as entries:
+                    entries = sorted(entries, key=lambda entry: entry.name)
+            except OSError as error:
+                print(f'Could not search {path} and it threw '
+                      f'{type(error).__name__}: {error}\n')
+                continue
+            for entry in entries:
+                entry_path = entry.name if path == '.' \
+                    else os.path.join(path, entry.name)
+                entry_relative_path = relative_path + entry.name
+                if _matches(entry.name, entry_relative_path, exclude):
+                    continue
+                try:
+                    if entry.is_file():
+                        if _matches(entry.name, entry_relative_path,
+                                    include):
+                            yield entry_path
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(
+                            (entry_path, entry_relative_path + '/'))
+                except OSError:
+                    # E.g. the entry was removed while searching.
+                    continue
+            # Reversed, so that the subdirectories are taken off the stack in
+            # sorted order.
+            pending.extend(reversed(subdirectories))
+
+
+def read_manifest(manifest_filename):
+    """
+    Gives the paths of the .out files listed in a manifest, one per line, as
+    they are read. Blank lines and lines starting with "#" are skipped.
+
+    Parameters
+    ----------
+    manifest_filename : str
+        Filename of the manifest, or "-" to read it from stdin (e.g. from
+        the output of find).
+
+    Yields
+    ------
+    str
+        Path of each .out file, as it is written in the manifest.
+    """
+    if manifest_filename == '-':
+        yield from _read_paths(sys.stdin)
+        return
+    with open(manifest_filename) as manifest:
+        yield from _read_paths(manifest)
+
+
+def iter_archive_members(archive_filename, include=DEFAULT_INCLUDE,
+                         exclude=(), prefetch=PREFETCH_MEMBERS):
+    """
+    Gives the .out files (including compressed ones, or other files matching
+    include) in a tar or zip archive, in the order in which they are stored,
+    as they are read by a separate thread.
+
+    Parameters
+    ----------
+    archive_filename : str
+        Filename of the archive.
+    include : iterable
+        Patterns, at least one of which each member must match (see
+        iter_out_files; a pattern with a "/" is matched against the name of
+        the member in the archive).
+    exclude : iterable
+        Patterns which members, and the directories they are in, must not
+        match.
+    prefetch : int
+        Number of members which are read ahead of those being processed.
+
+    Yields
+    ------
+    tuple
+        Tuple of the path of each member (the filename of the archive joined
+        to its name in the archive) and its contents, as bytes.
+    """
+    members = queue.Queue(prefetch)
+    stop = threading.Event()
+
+    def put(item):
+        """
+        Puts an item in the queue once there is room for it, unless the
+        members are no longer wanted; gives whether it was put.
+        """
+        while not stop.is_set():
+            try:
+                members.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read_members():
+        """Reads the members into the queue, then _END (or the error)."""
+        try:
+            for member in _read_archive(archive_filename, tuple(include),
+                                        tuple(exclude)):
+                if not put(member):
+                    return
+            put(_END)
+        except Exception as error:
+            put(error)
+
+    threading.Thread(target=read_members, daemon=True).start()
+    try:
+        while True:
+            member = members.get()
+            if member is _END:
+                break
+            if isinstance(member, Exception):
+                print(f'Could not read {archive_filename} and it threw '
+                      f'{type(member).__name__}: {member}\n')
+                break
+            yield member
+    finally:
+        # E.g. if the caller stops early, so the thread is not left waiting.
+        stop.set()
+
+
+def discover_out_files(args):
+    """
+    Gives the .out files chosen by the arguments of a script (see
+    script_args): those listed in the manifest (if any), then those in the
+    archives given with --archive, then those in the directories given with
+    --root (by default, the current working directory, unless there is a
+    manifest or an archive).
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments of the script, with the attributes manifest, archives,
+        roots, recursive, include and exclude.
+
+    Yields
+    ------
+    str or tuple
+        Path of each .out file, or for a member of an archive, a tuple of its
+        path and contents (see iter_archive_members).
+    """
+    include = args.include or DEFAULT_INCLUDE
+    exclude = args.exclude or ()
+    if args.manifest is not None:
+        yield from read_manifest(args.manifest)
+    for archive_filename in args.archives or ():
+        yield from iter_archive_members(archive_filename, include, exclude)
+    if args.roots or (args.manifest is None and not args.archives):
+        yield from iter_out_files(args.roots or ['.'], args.recursive,
+                                  include, exclude)
+
+
+def get_out_filename(out_file):
+    """
+    Gives the path of a .out file given by discover_out_files.
+
+    Parameters
+    ----------
+    out_file : str or tuple
+        Path of the .out file, or a tuple of its path and contents.
+
+    Returns
+    -------
+    str
+        Path of the .out file.
+    """
+    return out_file if isinstance(out_file, str) else out_file[0]
+
+
+def _matches(name, relative_path, patterns):
+    """
+    Checks whether a file or directory matches any of some patterns: those
+    with a "/" are matched against its relative path, the rest against its
+    name.
+    """
+    return any(fnmatchcase(relative_path if '/' in pattern else name, pattern)
+               for pattern in patterns)
+
+
+def _read_archive(archive_filename, include, exclude):
+    """
+    Reads the members of a tar or zip archive which match the patterns (see
+    iter_archive_members).
+    """
+    if zipfile.is_zipfile(archive_filename):
+        with zipfile.ZipFile(archive_filename) as archive:
+            for info in archive.infolist():
+                member_name = posixpath.normpath(info.filename)
+                if not info.is_dir() and \
+                        _is_wanted(member_name, include, exclude):
+                    yield (os.path.join(archive_filename, member_name),
+                           archive.read(info))
+        return
+    with open(archive_filename, 'rb') as file_object:
+        compression = detect_compression(file_object)
+        # The archive is read as a stream (mode "r|"), once from start to
+        # end, rather than seeking back and forth in it.
+        stream = file_object if compression is None \
+            else open_decompressed(file_object, compression)
+        with stream, tarfile.open(fileobj=stream, mode='r|') as archive:
+            for member in archive:
+                # E.g. "./job1/opt.out" is given as "job1/opt.out".
+                member_name = posixpath.normpath(member.name)
+                if member.isfile() and \
+                        _is_wanted(member_name, include, exclude):
+                    yield (os.path.join(archive_filename, member_name),
+                           archive.extractfile(member).read())
+
+
+def _is_wanted(member_name, include, exclude):
+    """
+    Checks whether a member of an archive matches the patterns to include,
+    and neither it nor any of the directories it is in matches those to
+    exclude.
+    """
+    parts = member_name.split('/')
+    for i, part in enumerate(parts):
+        if _matches(part, '/'.join(parts[:i + 1]), exclude):
+            return False
+    return _matches(parts[-1], member_name, include)
+
+
+def _read_paths(lines):
+    """Gives the paths in the lines of a manifest (see read_manifest)."""
+    for line in lines:
+        path = line.strip()
+        if path and not path.startswith('#'):
+            yield path
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Functions which identify .out files and input specifications by fingerprints.
+
+These are used to tell whether the data extracted from an ORCA .out file can
+be reused (see extraction_cache): the stat key of a file changes whenever the
+file is modified, the content hash changes only when its contents do, and the
+input spec hash changes whenever the requested data do. A file which is read
+from start to end anyway (e.g. to extract its data) can be hashed as it is
+read, through a HashingFile, rather than read again.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import hashlib
+import io
+import json
+import os
+
+# Size of the chunks in which files are read when hashing them.
+CHUNK_SIZE = 1 << 20
+
+
+def stat_key(path):
+    """
+    Gives a key which identifies a file by its path, size and modification
+    time, without reading it. A member of an archive (whose path is that of
+    the archive joined to its name in the archive, see
+    file_discovery.iter_archive_members) is identified by its path and the
+    size and modification time of the archive.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    tuple
+        Tuple of the absolute path, the size in bytes and the modification
+        time in nanoseconds.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be accessed.
+    """
+    try:
+        stat = os.stat(path)
+    except NotADirectoryError:
+        # Part of the path is a file, i.e. an archive.
+        archive_path = path
+        while not os.path.isfile(archive_path):
+            parent = os.path.dirname(archive_path)
+            if parent in ('', archive_path):
+                raise
+            archive_path = parent
+        stat = os.stat(archive_path)
+    return os.path.abspath(path), stat.st_size, stat.st_mtime_ns
+
+
+def content_hash(path):
+    """
+    Gives the SHA-256 hash of the contents of a file, which is read in chunks.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the contents of the file.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be read.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as file_object:
+        for chunk in iter(lambda: file_object.read(CHUNK_SIZE), b''):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+class HashingFile(io.RawIOBase):
+    """
+    Binary file which hashes the contents of another file as they are read
+    from it, giving the same digest as content_hash once the whole file has
+    been read from its start (parts which are read again, e.g. after seeking
+    back to the start, are only hashed once).
+
+    Attributes
+    ----------
+    __file_object : file object
+        The file being read, opened in binary mode.
+    __sha256 : hashlib sha256 object
+        Hash of the contents from the start of the file up to __hashed.
+    __position : int
+        Current position in the file.
+    __hashed : int
+        Number of bytes from the start of the file that have been hashed.
+
+    Methods
+    -------
+    readinto
+        Reads bytes from the file into a buffer, hashing any that have not
+        been hashed yet.
+    seek
+        Moves to a new position in the file.
+    get_digest
+        Gives the digest of the contents, if the whole file has been read.
+    """
+    def __init__(self, file_object):
+        """
+        Parameters
+        ----------
+        file_object : file object
+            The file to read, opened in binary mode at its start.
+        """
+        super().__init__()
+        self.__file_object = file_object
+        self.__sha256 = hashlib.sha256()
+        self.__position = 0
+        self.__hashed = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def fileno(self):
+        return self.__file_object.fileno()
+
+    def tell(self):
+        return self.__position
+
+    def readinto(self, buffer):
+        """
+        Reads bytes from the file into a buffer, hashing those which follow
+        on from the part of the file hashed so far.
+
+        Parameters
+        ----------
+        buffer : writable bytes-like object
+            Buffer into which the bytes are read.
+
+        Returns
+        -------
+        int
+            Number of bytes read (0 at the end of the file).
+        """
+        size = self.__file_object.readinto(buffer)
+        end = self.__position + size
+        if self.__position <= self.__hashed < end:
+            with memoryview(buffer) as view:
+                self.__sha256.update(
+                    view[self.__hashed - self.__position:size])
+            self.__hashed = end
+        self.__position = end
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        self.__position = self.__file_object.seek(offset, whence)
+        return self.__position
+
+    def get_digest(self):
+        """
+        Gives the SHA-256 hash of the contents of the file (see
+        content_hash), if the whole file has been read.
+
+        Returns
+        -------
+        str or None
+            Hexadecimal digest of the contents of the file, or None if not
+            all of it has been read.
+        """
+        if self.__hashed != os.fstat(self.fileno()).st_size:
+            return None
+        return self.__sha256.hexdigest()
+
+
+def input_spec_hash(input_spec):
+    """
+    Gives the SHA-256 hash of an input specification, which does not depend
+    on the order of its keys or on whether its inputs are tuples or lists.
+
+    Parameters
+    ----------
+    input_spec : dict
+        Dictionary of the inputs for each DataSection (e.g. as given by
+        InputReader.get_input_spec).
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the input specification.
+    """
+    normalized = json.dumps(input_spec, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
+def hash_parts(*parts):
+    """
+    Gives the SHA-256 hash of the string representations of parts, e.g. to
+    name the entry for a key in a cache directory.
+
+    Parameters
+    ----------
+    *parts
+        Parts of the key (e.g. those of a stat key and a version).
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the parts.
+    """
+    return hashlib.sha256(
+        '\0'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
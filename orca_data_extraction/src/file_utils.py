@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Provides write_atomic, which writes a file so that it is never read while it
+is partly written.
+
+This is used for files which other runs may read at the same time, such as
+the entries of the cache directory (see extraction_cache and table_cache) and
+sidecar indexes (see sidecar_index).
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+import tempfile
+
+
+def write_atomic(path, contents):
+    """
+    Writes contents to a file atomically: a temporary file in the same
+    directory is written and then renamed to path, so a reader sees either
+    the whole file or none. If the file cannot be written (e.g. the directory
+    is read-only), nothing is done.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file, whose directory is made if it does not exist.
+    contents : bytes
+        Contents of the file.
+    """
+    directory = os.path.dirname(path) or '.'
+    try:
+        os.makedirs(directory, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=directory,
+                                                      suffix='.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file_object:
+            file_object.write(contents)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
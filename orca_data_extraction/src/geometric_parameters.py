@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Vectorized calculation of distances, angles and dihedral angles between atoms.
+
+The calc_distances, calc_angles and calc_dihedrals functions take an N×3 array
+of atomic coordinates and an array of indices into its rows, with one row of
+indices per pair, triple or quadruple of atoms, and calculate every value in a
+single NumPy operation. This means that thousands of geometric parameters can
+be calculated for a structure without any per-parameter Python arithmetic.
+Angles and dihedral angles which are undefined (e.g. because two of the atoms
+are the same) are given as NaN, without dividing by zero.
+
+The GeometricParameters abstract class is used for the DataSection subclasses
+(e.g. BondLengths and BondAngles) which calculate these values from the
+coordinates of a FinalGeometry.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import math
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from orca_data_extraction.src.data_section_with_inputs import DataSectionWithInputs
+from orca_data_extraction.src.final_geom import FinalGeometry
+
+# Length (in the units of the coordinates) below which a vector between atoms
+# is taken to be zero, e.g. for atoms listed twice in a tuple, or for the
+# component of a bond perpendicular to a collinear one.
+ZERO_LENGTH = 1e-8
+
+
+def calc_distances(coordinates, indices):
+    """
+    Calculates the distances between pairs of atoms.
+
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        N×3 array of atomic coordinates.
+    indices : numpy.ndarray
+        M×2 array of integers, where each row gives the rows of coordinates
+        of the two atoms.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of the M distances (in the units of coordinates).
+    """
+    indices = np.asarray(indices, dtype=np.intp).reshape(-1, 2)
+    vectors = coordinates[indices[:, 0]] - coordinates[indices[:, 1]]
+    return np.sqrt(np.einsum('ij,ij->i', vectors, vectors))
+
+
+def calc_angles(coordinates, indices):
+    """
+    Calculates the angles between triples of atoms, i.e. the angle at the
+    second atom of each triple.
+
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        N×3 array of atomic coordinates.
+    indices : numpy.ndarray
+        M×3 array of integers, where each row gives the rows of coordinates
+        of the three atoms.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of the M angles in degrees (between 0 and 180), or NaN for
+        triples in which the second atom is at the same position as one of
+        the others.
+    """
+    indices = np.asarray(indices, dtype=np.intp).reshape(-1, 3)
+    atoms0, atoms1, atoms2 = (coordinates[indices[:, i]] for i in range(3))
+    vectors_01 = atoms0 - atoms1
+    vectors_12 = atoms1 - atoms2
+    lengths_01 = np.sqrt(np.einsum('ij,ij->i', vectors_01, vectors_01))
+    lengths_12 = np.sqrt(np.einsum('ij,ij->i', vectors_12, vectors_12))
+    degenerate = (lengths_01 < ZERO_LENGTH) | (lengths_12 < ZERO_LENGTH)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cosines = np.einsum('ij,ij->i', vectors_01, vectors_12) / (
+            lengths_01 * lengths_12)
+    # Rounding errors can put the cosine just outside [-1, 1] for linear
+    # arrangements of atoms.
+    angles = 180 - np.degrees(np.arccos(np.clip(cosines, -1, 1)))
+    angles[degenerate] = np.nan
+    return angles
+
+
+def calc_dihedrals(coordinates, indices):
+    """
+    Calculates the dihedral (torsion) angles of quadruples of atoms, i.e. the
+    angle about the bond between the second and third atoms of each quadruple.
+
+    The sign follows the IUPAC convention: the angle is positive when, looking
+    along the bond from the second atom to the third, the bond to the first
+    atom must be rotated clockwise to eclipse the bond to the fourth atom.
+
+    Parameters
+    ----------
+    coordinates : numpy.ndarray
+        N×3 array of atomic coordinates.
+    indices : numpy.ndarray
+        M×4 array of integers, where each row gives the rows of coordinates
+        of the four atoms.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of the M dihedral angles in degrees (between -180 and 180), or
+        NaN for quadruples in which the second and third atoms are at the
+        same position, or either outer atom is in line with them.
+    """
+    indices = np.asarray(indices, dtype=np.intp).reshape(-1, 4)
+    atoms0, atoms1, atoms2, atoms3 = (coordinates[indices[:, i]]
+                                      for i in range(4))
+    vectors_10 = atoms0 - atoms1
+    vectors_12 = atoms2 - atoms1
+    vectors_23 = atoms3 - atoms2
+    central_lengths = np.sqrt(np.einsum('ij,ij->i', vectors_12, vectors_12))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vectors_12 = vectors_12 / central_lengths[:, np.newaxis]
+    # Components of the outer bonds perpendicular to the central bond.
+    perp_0 = vectors_10 - np.einsum(
+        'ij,ij->i', vectors_10, vectors_12)[:, np.newaxis] * vectors_12
+    perp_3 = vectors_23 - np.einsum(
+        'ij,ij->i', vectors_23, vectors_12)[:, np.newaxis] * vectors_12
+    x = np.einsum('ij,ij->i', perp_0, perp_3)
+    y = np.einsum('ij,ij->i', np.cross(vectors_12, perp_0), perp_3)
+    dihedrals = np.degrees(np.arctan2(y, x))
+    degenerate = (
+        (central_lengths < ZERO_LENGTH) |
+        (np.sqrt(np.einsum('ij,ij->i', perp_0, perp_0)) < ZERO_LENGTH) |
+        (np.sqrt(np.einsum('ij,ij->i', perp_3, perp_3)) < ZERO_LENGTH)
+    )
+    dihedrals[degenerate] = np.nan
+    return dihedrals
+
+
+class GeometricParameters(DataSectionWithInputs, ABC):
+    """
+    A subclass of DataSectionWithInputs for values calculated from the final
+    geometry of the structure (e.g. bond lengths and bond angles).
+
+    The inputs are tuples of atom labels. These are converted into an array of
+    the rows of the atoms in the coordinates of _final_geom, and then every
+    value is calculated at once by _calculate.
+
+    Attributes
+    ----------
+    _parameter_type : str
+        Class attribute: the type of value (e.g. 'bond angle'), used in error
+        messages.
+    _tuple_length : int
+        Class attribute: the number of atom labels in each input tuple.
+    _final_geom : FinalGeometry
+        FinalGeometry instance whose coordinates are used for the calculations.
+
+    Methods
+    -------
+    _find_data
+        Calculates the values for all the input tuples at once.
+    _search
+        Calculates the value for a single input tuple.
+    _calc_data
+        Calculates the values for a series of atom tuples.
+    _calculate
+        Abstract method which calculates the values from the coordinates and
+        an array of the rows of the atoms in each tuple.
+    get_blocks
+        Gives the blocks of text searched by FinalGeometry.
+    get_datum
+        Gives the value for a tuple, whichever end its atoms are listed from.
+    """
+    # Class attributes.
+    _parameter_type = ''
+    _tuple_length = 0
+
+    def __init__(self, out_filename, outfile_contents, inputs,
+                 section_index=None, final_geom=None):
+        """
+        Parameters
+        ----------
+        out_filename : str
+            Name of the ORCA .out file that will be searched.
+        outfile_contents : str
+            String containing the full text of the ORCA .out file.
+        inputs : tuple
+            Tuple of tuples of atom labels, e.g. ('1 H', '0 O'), for which
+            values will be calculated.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
+        final_geom : FinalGeometry
+            FinalGeometry instance for the same .out file, which is used for
+            the coordinates of all the atoms (so it can be shared with other
+            DataSections). If not given, one is created for this instance.
+        """
+        if final_geom is None:
+            final_geom = FinalGeometry(out_filename=out_filename,
+                                       outfile_contents=outfile_contents,
+                                       inputs=(),
+                                       section_index=section_index)
+        self._final_geom = final_geom
+        super().__init__(out_filename, outfile_contents, inputs, section_index)
+
+    def _find_data(self):
+        """
+        Calculates the values for all the tuples in _inputs at once.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the tuples from _inputs as keys and
+            strings of the values (rounded to 5 decimal places) as values, or
+            None for tuples with atoms that were not found.
+        """
+        return self._calc_data(self._inputs)
+
+    def _search(self, atom_tuple):
+        """
+        Calculates the value for one atom tuple, using _calc_data.
+
+        Parameters
+        ----------
+        atom_tuple : tuple
+            Tuple of atom labels.
+
+        Returns
+        -------
+        str or None
+            String of the value (rounded to 5 decimal places), or None if an
+            atom was not found or the value is undefined (see _calc_data).
+        """
+        return self._calc_data((atom_tuple,))[atom_tuple]
+
+    def _calc_data(self, atom_tuples):
+        """
+        Calculates the values for a series of atom tuples in one operation.
+
+        Parameters
+        ----------
+        atom_tuples : tuple
+            Tuple of tuples of atom labels.
+
+        Returns
+        -------
+        results : dict
+            A dictionary containing the atom tuples as keys and strings of the
+            values (rounded to 5 decimal places) as values, or None for tuples
+            with atoms that were not found or whose value is undefined (e.g.
+            an angle with an atom listed twice).
+        """
+        indices = self._final_geom.get_atom_indices(atom_tuples,
+                                                    self._tuple_length)
+        found = (indices >= 0).all(axis=1)
+        values = iter(self._calculate(self._final_geom.get_coordinates(),
+                                      indices[found]).tolist())
+        results = {}
+        for atom_tuple, is_found in zip(atom_tuples, found.tolist()):
+            if is_found:
+                value = next(values)
+                if math.isnan(value):
+                    print(f'Manual calculation failed for '
+                          f'{self._parameter_type} {"-".join(atom_tuple)}: '
+                          f'it is undefined for these atoms (e.g. one is '
+                          f'listed twice, or three are in a line).')
+                    results[atom_tuple] = None
+                else:
+                    results[atom_tuple] = str(round(value, 5))
+                continue
+            missing = next(atom for atom in atom_tuple
+                           if self._final_geom.get_atom_row(atom) is None)
+            print(f'Manual calculation failed for {self._parameter_type} '
+                  f'{"-".join(atom_tuple)}: geometry data for {missing} '
+                  f'not found.')
+            results[atom_tuple] = None
+        return results
+
+    @abstractmethod
+    def _calculate(self, coordinates, indices):
+        """
+        Calculates the values from the coordinates and an array of the rows
+        of the atoms in each tuple (e.g. with calc_distances).
+
+        Parameters
+        ----------
+        coordinates : numpy.ndarray
+            N×3 array of atomic coordinates (in Å).
+        indices : numpy.ndarray
+            Array of integers with one row per tuple, giving the rows of
+            coordinates of its atoms.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of the values, one per row of indices.
+        """
+        pass
+
+    @classmethod
+    def get_blocks(cls):
+        """
+        Gives the blocks of text that are searched for the desired data, which
+        are those of the final geometry the values are calculated from.
+
+        Returns
+        -------
+        tuple
+            Tuple of tuples of the header, trailing marker and occurrence of
+            each block.
+        """
+        return FinalGeometry.get_blocks()
+
+    def get_datum(self, atom_tuple):
+        """
+        Gives the value from _data for a tuple of atom labels, which may be
+        listed in either order (e.g. ('0 O', '1 H') or ('1 H', '0 O')).
+
+        Parameters
+        ----------
+        atom_tuple : tuple
+            Tuple of atom labels.
+
+        Returns
+        -------
+        str or None
+            String of the value, or None if the tuple was not found in _data.
+        """
+        # In order to find the value no matter which end of the tuple the
+        # atoms are listed from, this override is necessary.
+        try:
+            return self._data[atom_tuple]
+        except KeyError:
+            try:
+                return self._data[tuple(reversed(atom_tuple))]
+            except KeyError:
+                print(f'Error: {atom_tuple} not found in '
+                      f'{self._out_filename} ({self._section_name}).')
+                return None
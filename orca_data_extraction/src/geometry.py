@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+An abstract class for DataSection subclasses that find atomic coordinates.
+
+ORCA prints the geometry of the structure in the table "CARTESIAN COORDINATES
+(A.U.)", with one line per atom. Rather than searching this table once for each
+atom label, the whole table is parsed once into NumPy arrays (coordinates,
+masses, etc.), with a dictionary mapping atom labels to rows of these arrays.
+The coordinates are converted from AU to Ångstroms in a single operation.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import re
+from abc import ABC
+
+import numpy as np
+
+from orca_data_extraction.src.data_section_with_inputs import DataSectionWithInputs
+
+# Conversion factor from AU (Bohr) to Ångstroms.
+BOHR_TO_ANGSTROM = 0.529177
+
+
+def make_table(atom_labels, nuclear_charges, fragments, masses, coordinates):
+    """
+    Makes the parsed form of a coordinate table (see Geometry._parse_table)
+    from its columns, e.g. when these are loaded from a table_cache.
+
+    Parameters
+    ----------
+    atom_labels : iterable
+        Atom labels (e.g. '0 P') of the rows of the table.
+    nuclear_charges : array_like
+        Nuclear charges of the atoms.
+    fragments : array_like
+        Fragments of the atoms.
+    masses : array_like
+        Masses of the atoms.
+    coordinates : array_like
+        Coordinates of the atoms (in Å), with one row per atom.
+
+    Returns
+    -------
+    tuple
+        Tuple of the atom labels, the dict mapping the atom labels to rows,
+        and the (read-only) arrays of nuclear charges, fragments, masses and
+        coordinates.
+    """
+    atom_labels = tuple(atom_labels)
+    atom_rows = {atom_label: row for row, atom_label in enumerate(atom_labels)}
+    arrays = tuple(
+        np.array(column, dtype=np.float64, order='C')
+        for column in (nuclear_charges, fragments, masses, coordinates))
+    # These arrays may be shared between DataSections, so they are made
+    # read-only (the getters of Geometry give copies).
+    for array in arrays:
+        array.flags.writeable = False
+    return (atom_labels, atom_rows) + arrays
+
+
+class Geometry(DataSectionWithInputs, ABC):
+    """
+    A subclass of DataSectionWithInputs for tables of atomic coordinates.
+
+    Subclasses specify the table to be parsed with the _block_start,
+    _block_end and _block_occurrence class attributes.
+
+    Attributes
+    ----------
+    _geometry_type : str
+        Class attribute: the type of geometry (e.g. 'Final'), used in error
+        messages.
+    _datum_labels : tuple
+        Class attribute: the keys of the dict of coordinates for each atom.
+    _geom_regex : re.Pattern
+        Class attribute: regular expression that matches one line of a
+        Cartesian coordinates (A.U.) table.
+    _atom_labels : tuple
+        Tuple of the atom labels in the table, in order.
+    _atom_rows : dict
+        Dictionary mapping atom labels to their rows in the arrays below.
+    _nuclear_charges : numpy.ndarray
+        Array of the nuclear charges of the atoms (ZA column).
+    _fragments : numpy.ndarray
+        Array of the fragment numbers of the atoms (FRAG column).
+    _masses : numpy.ndarray
+        Array of the masses of the atoms (MASS column).
+    _coordinates : numpy.ndarray
+        N×3 array of the coordinates of the atoms (in Å); None until the
+        table has been parsed (see _load_table).
+
+    Methods
+    -------
+    _find_data
+        Parses the table once and finds the coordinates of each input atom.
+    _search
+        Gives the coordinates of a single atom as a dict.
+    _load_table
+        Parses the coordinate table, if this has not been done already.
+    _parse_table
+        Parses the coordinate table into the arrays described above.
+    get_atom_labels
+        Gives the atom labels in the table, in order.
+    get_atom_row
+        Gives the row of an atom in the arrays of the table.
+    get_atom_indices
+        Gives the rows of the atoms in a series of atom tuples as an array.
+    get_atom_coordinates
+        Gives the coordinates (in Å) of a single atom as an array.
+    get_coordinates
+        Gives the N×3 array of coordinates (in Å).
+    get_masses
+        Gives the array of masses.
+    get_nuclear_charges
+        Gives the array of nuclear charges.
+    get_fragments
+        Gives the array of fragment numbers.
+    """
+    # Class attributes.
+    _geometry_type = ''
+    _datum_labels = ('x', 'y', 'z')
+    _coordinates = None
+    _geom_regex = re.compile(
+        r"""
+        ^(\ *)
+        ([\d]+)             # atom number
+        (\ +)
+        ([A-Za-z]+)         # element symbol
+        (\ +)
+        (-?[\d]+[.][\d]+)   # ZA
+        (\ +)
+        ([\d]+)             # FRAG
+        (\ +)
+        (-?[\d]+[.][\d]+)   # MASS
+        (\ +)
+        (-?[\d]+[.][\d]+)   # X coordinate
+        (\ +)
+        (-?[\d]+[.][\d]+)   # Y coordinate
+        (\ +)
+        (-?[\d]+[.][\d]+)   # Z coordinate
+        """,
+        flags=re.VERBOSE | re.MULTILINE
+    )
+
+    def _find_data(self):
+        """
+        Parses the coordinate table once and finds the coordinates of each
+        atom in _inputs; any atoms that are not found are reported together.
+
+        Returns
+        -------
+        search_results : dict
+            A dictionary containing the atom labels from _inputs as keys and
+            dicts of their coordinates as values (see _search).
+        """
+        self._load_table()
+        search_results = {}
+        missing = []
+        for atom_label in self._inputs:
+            search_results[atom_label] = self._search(atom_label)
+            if self.get_atom_row(atom_label) is None:
+                missing.append(atom_label)
+        if missing:
+            verb = 'was' if len(missing) == 1 else 'were'
+            print(f'Error: {", ".join(missing)} {verb} not found in '
+                  f'{self._out_filename} ({self._geometry_type} Geometry).')
+        return search_results
+
+    def _search(self, atom_label):
+        """
+        Gives the coordinates of a single atom from the parsed table.
+
+        Parameters
+        ----------
+        atom_label : str
+            String of the desired atom label.
+
+        Returns
+        -------
+        dict
+            A dictionary containing 'x', 'y' and 'z' as keys and the
+            corresponding coordinates (in Å) for the atom label as values
+            (as strings), or None as values if the atom was not found.
+        """
+        row = self.get_atom_row(atom_label)
+        if row is None:
+            return {'x': None,
+                    'y': None,
+                    'z': None}
+        x, y, z = self._coordinates[row]
+        return {'x': str(round(float(x), 5)),
+                'y': str(round(float(y), 5)),
+                'z': str(round(float(z), 5))}
+
+    def _load_table(self):
+        """
+        Parses the coordinate table into the arrays described above, if this
+        has not been done already. This is done by the getters below as well
+        as _find_data, since _data is only found when it is first needed.
+        """
+        if self._coordinates is not None:
+            return
+        # The parsed table is shared with any other DataSections for the same
+        # file that use this table (e.g. BondLengths and BondAngles).
+        (self._atom_labels, self._atom_rows, self._nuclear_charges,
+         self._fragments, self._masses, self._coordinates) = \
+            self._get_parsed(self._parse_table)
+
+    def _parse_table(self):
+        """
+        Parses the coordinate table into arrays.
+
+        Returns
+        -------
+        tuple
+            Tuple of the atom labels, the dict mapping the atom labels to
+            rows, and the (read-only) arrays of nuclear charges, fragments,
+            masses and coordinates (in Å). These are empty if the table could
+            not be found.
+        """
+        block = self._get_block()
+        matches = [] if block is None else \
+            list(self._geom_regex.finditer(block))
+        atom_labels = tuple(
+            f'{match.group(2)} {match.group(4)}' for match in matches)
+        table = np.array(
+            [match.group(6, 8, 10, 12, 14, 16) for match in matches],
+            dtype=np.float64
+        ).reshape(-1, 6)
+        # Vectorized conversion of all the coordinates from AU to Å.
+        return make_table(atom_labels, table[:, 0], table[:, 1], table[:, 2],
+                          table[:, 3:6] * BOHR_TO_ANGSTROM)
+
+    def get_atom_labels(self):
+        """
+        Gives the atom labels in the table, in order.
+
+        Returns
+        -------
+        tuple
+            Tuple of the atom labels, in the order of the rows of the arrays.
+        """
+        self._load_table()
+        return self._atom_labels
+
+    def get_atom_row(self, atom_label):
+        """
+        Gives the row of an atom in the arrays of the table.
+
+        Parameters
+        ----------
+        atom_label : str
+            String of the desired atom label.
+
+        Returns
+        -------
+        int or None
+            Row of the atom, or None if it is not in the table.
+        """
+        self._load_table()
+        return self._atom_rows.get(atom_label)
+
+    def get_atom_indices(self, atom_tuples, tuple_length):
+        """
+        Gives the rows of the atoms in a series of atom tuples as an array,
+        e.g. for calculating bond lengths with calc_distances.
+
+        Parameters
+        ----------
+        atom_tuples : tuple
+            Tuple of tuples of atom labels, e.g. (('0 O', '1 H'),).
+        tuple_length : int
+            Number of atom labels in each tuple.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of integers with one row per atom tuple, giving the rows of
+            its atoms; atoms which are not in the table are given as -1.
+        """
+        self._load_table()
+        return np.array(
+            [[self._atom_rows.get(atom_label, -1) for atom_label in atom_tuple]
+             for atom_tuple in atom_tuples],
+            dtype=np.intp
+        ).reshape(-1, tuple_length)
+
+    def get_atom_coordinates(self, atom_label):
+        """
+        Gives the coordinates of a single atom in the table, whether or not
+        it is one of the inputs.
+
+        Parameters
+        ----------
+        atom_label : str
+            String of the desired atom label.
+
+        Returns
+        -------
+        numpy.ndarray or None
+            Array of the x, y and z coordinates of the atom (in Å), or None
+            if it is not in the table.
+        """
+        self._load_table()
+        row = self.get_atom_row(atom_label)
+        if row is None:
+            return None
+        return self._coordinates[row].copy()
+
+    def get_coordinates(self):
+        """
+        Gives the coordinates of all the atoms in the table.
+
+        Returns
+        -------
+        numpy.ndarray
+            N×3 array of the coordinates (in Å), in the order of the rows
+            given by get_atom_labels.
+        """
+        self._load_table()
+        return self._coordinates.copy()
+
+    def get_masses(self):
+        """
+        Gives the masses of all the atoms in the table.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of the masses, in the order given by get_atom_labels.
+        """
+        self._load_table()
+        return self._masses.copy()
+
+    def get_nuclear_charges(self):
+        """
+        Gives the nuclear charges (ZA) of all the atoms in the table.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of the nuclear charges, in the order given by
+            get_atom_labels.
+        """
+        self._load_table()
+        return self._nuclear_charges.copy()
+
+    def get_fragments(self):
+        """
+        Gives the fragment numbers of all the atoms in the table.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of the fragment numbers, in the order given by
+            get_atom_labels.
+        """
+        self._load_table()
+        return self._fragments.copy()
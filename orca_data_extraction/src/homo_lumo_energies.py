@@ -30,9 +30,21 @@ class HOMOLUMOEnergies(DataSection):
     Methods
     -------
     _find_data
+        Gives the HOMO and LUMO energy data.
+    parse
+        Parses the block without reporting missing data.
+    _parse_block
         Search the .out file for HOMO and LUMO energy data, return as dict.
     """
-    def __init__(self, out_filename, outfile_contents):
+    # Class attributes.
+    # Here I am assuming that the last occurrence of the MO energy data in
+    # the .out file will be from the finished calculation, seems logical...
+    _block_start = 'ORBITAL ENERGIES'
+    _block_end = 'MULLIKEN POPULATION ANALYSIS'
+    _block_occurrence = -1
+    _data_labels = ('HOMO energy', 'LUMO energy')
+
+    def __init__(self, out_filename, outfile_contents, section_index=None):
         """
         Parameters
         ----------
@@ -40,28 +52,17 @@ class HOMOLUMOEnergies(DataSection):
             Name of the ORCA .out file that will be searched.
         outfile_contents : str
             String containing the full text of the ORCA .out file.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
         """
-        # Here I am assuming that the last occurrence of the MO energy data in
-        # the .out file will be from the finished calculation, seems logical...
-
-        # However, I found that in order to find the last occurrence without
-        # catastrophic backtracking, it was necessary to reverse the line order
-        # of the outfile contents string, then match the first occurrence there.
+        # The HOMO is the last occupied orbital which is directly followed by
+        # an unoccupied one (the LUMO); within the block, the last such pair
+        # is taken (e.g. for spin up and spin down orbitals).
 
-        # Note that, consequently, this regex string is INVERTED to match!!!
-        # Note also: \ must be used for all whitespace I want to count
+        # Note: \ must be used for all whitespace I want to count
         # when using verbose regular expressions.
         self.__regex = re.compile(
             r"""
-            (MULLIKEN\ POPULATION\ ANALYSIS)
-            (.*?)               # all text until data begins
-            (0.0000)            # LUMO occupancy, always 0 of course
-            (\ *)               # whitespace
-            (-?[\d]+[.][\d]+)   # LUMO energy in Eh
-            (\ *)
-            (-?[\d]+[.][\d]+)   # LUMO energy in eV
-            (\ \n)              # newline
-            (\ *)  
             ([\d]+)             # HOMO orbital number
             (\ \ \ )
             (1|2)               # HOMO occupancy
@@ -70,24 +71,59 @@ class HOMOLUMOEnergies(DataSection):
             (-?[\d]+[.][\d]+)   # HOMO energy in Eh
             (\ *)
             (-?[\d]+[.][\d]+)   # HOMO energy in eV
-            (.*?)
-            (ORBITAL\ ENERGIES)
-            # above: prevents accidental matches later in the .out file
+            (\ \n)             # newline
+            (\ *)
+            ([\d]+)             # LUMO orbital number
+            (\ \ \ )
+            (0.0000)            # LUMO occupancy, always 0 of course
+            (\ *)               # whitespace
+            (-?[\d]+[.][\d]+)   # LUMO energy in Eh
+            (\ *)
+            (-?[\d]+[.][\d]+)   # LUMO energy in eV
             """,
-            flags=re.VERBOSE | re.DOTALL
+            flags=re.VERBOSE
         )
-        super().__init__(out_filename, outfile_contents)
+        super().__init__(out_filename, outfile_contents, section_index)
         self._section_name = 'HOMO LUMO Energies'
 
     def _find_data(self):
         """
-        Search the .out file for HOMO and LUMO energy data, return as dict.
+        Gives the HOMO and LUMO energy data, which are parsed once per file
+        (see _parse_block).
 
         Returns
         -------
         dict
+            Dictionary of the HOMO and LUMO energy data (see _parse_block),
+            with None as each value if they were not found.
+        """
+        data = self._get_parsed(self._parse_block)
+        if data is None:
+            print(f'HOMO/LUMO energy data not found in '
+                  f'{self._out_filename}')
+            return dict.fromkeys(self._data_labels)
+        return data
+
+    def parse(self):
+        """
+        Parses the HOMO and LUMO energy data into the section index, without reporting
+        them if they are missing (see DataSection.parse).
+        """
+        self._get_parsed(self._parse_block)
+
+    def _parse_block(self):
+        """
+        Search the .out file for HOMO and LUMO energy data, return as dict.
+
+        The result is shared by other instances for the same file, and can
+        be stored with the other parsed tables of the file (see table_cache).
+
+        Returns
+        -------
+        dict or None
             Dictionary containing HOMO/LUMO energy as keys and the
-            corresponding energy values (in eV) as values (as strings).
+            corresponding energy values (in eV) as values (as strings), or
+            None if they were not found.
 
         Raises
         ------
@@ -95,33 +131,18 @@ class HOMOLUMOEnergies(DataSection):
             This occurs when the regex fails to find what it is looking
             for, and returns NoneType. Then, .group(n) gives this error.
         """
-        def __reverse_string_by_lines(s):
-            """
-            Reverses a string in terms of the order of its lines.
-
-            Parameters
-            ----------
-            s: str
-                String to be reversed line-by-line
-
-            Returns
-            -------
-            str
-                Reversed string, line-by-line.
-            """
-            s = s.splitlines()[::-1]
-            return '\n'.join(s)
-        # See above comments: in order to match the LAST occurrence of the MO
-        # energy data in the .out file, the contents must be reversed.
-        reversed_contents = \
-            __reverse_string_by_lines(self._outfile_contents)
+        # Only the last block of orbital energies is searched; see the
+        # _block_start and _block_end class attributes. If there is no such
+        # block, the regex is not run at all.
+        block = self._get_block()
+        result = None
+        if block is not None:
+            for result in self.__regex.finditer(block):
+                pass
         try:
-            result = self.__regex.search(reversed_contents)
-            homo_energy = result.group(17)
-            lumo_energy = result.group(7)
+            homo_energy = result.group(8)
+            lumo_energy = result.group(17)
             return {'HOMO energy': homo_energy, 'LUMO energy': lumo_energy}
         except AttributeError:
-            print(f'HOMO/LUMO energy data not found in '
-                  f'{self._out_filename}')
-            return {'HOMO energy': None, 'LUMO energy': None}
+            return None
 
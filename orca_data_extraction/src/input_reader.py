@@ -16,6 +16,10 @@ __status__ = "Prototype"
 
 from abc import ABC, abstractmethod
 
+# Keys of the sections which do not take inputs, and so are included unless
+# they are switched off in the input file (e.g. "polarizability": false).
+SECTION_SWITCHES = ('polarizability', 'dipole_moments', 'homo_lumo_energies')
+
 
 class InputReader(ABC):
     """
@@ -24,6 +28,33 @@ class InputReader(ABC):
     def __init__(self, input_filename):
         self._input_filename = input_filename
 
+    def get_input_spec(self):
+        """
+        Returns all the inputs as a dict, with the same keys as the input JSON
+        file (e.g. to identify the inputs, see file_fingerprint).
+        """
+        return {
+            'initial_geometry_atom_labels': self.get_initial_geom_inputs(),
+            'final_geometry_atom_labels': self.get_final_geom_inputs(),
+            'bond_length_data_labels': self.get_bond_length_inputs(),
+            'bond_angle_data_labels': self.get_bond_angle_inputs(),
+            'dihedral_angle_data_labels': self.get_dihedral_angle_inputs(),
+            'mulliken_charge_atom_labels': self.get_mulliken_charge_inputs(),
+            'mulliken_charge_sum_atom_label_lists':
+                self.get_mulliken_charge_sum_inputs(),
+            'loewdin_charge_atom_labels': self.get_loewdin_charge_inputs(),
+            'loewdin_charge_sum_label_lists':
+                self.get_loewdin_charge_sum_inputs(),
+            **self.get_section_switches(),
+        }
+
+    def get_section_switches(self):
+        """
+        Returns a dict of whether each section without inputs (see
+        SECTION_SWITCHES) is included; by default, they all are.
+        """
+        return dict.fromkeys(SECTION_SWITCHES, True)
+
     @abstractmethod
     def get_initial_geom_inputs(self):
         """Returns initial geometry inputs."""
@@ -44,6 +75,11 @@ class InputReader(ABC):
         """Returns bond angle inputs."""
         pass
 
+    @abstractmethod
+    def get_dihedral_angle_inputs(self):
+        """Returns dihedral angle inputs."""
+        pass
+
     @abstractmethod
     def get_mulliken_charge_inputs(self):
         """Returns Mulliken charge inputs."""
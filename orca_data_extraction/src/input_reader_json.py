@@ -19,7 +19,8 @@ __status__ = "Prototype"
 
 import json
 
-from orca_data_extraction.src.input_reader import InputReader
+from orca_data_extraction.src.input_reader import (
+    InputReader, SECTION_SWITCHES)
 
 
 class InputReaderJSON(InputReader):
@@ -47,6 +48,8 @@ class InputReaderJSON(InputReader):
         Returns tuple of bond len. inputs ('bond tuples').
     get_bond_angle_inputs
         Returns tuple of bond angle inputs ('angle tuples').
+    get_dihedral_angle_inputs
+        Returns tuple of dihedral angle inputs ('dihedral tuples').
     get_mulliken_charge_inputs
         Returns tuple of Mulliken charge inputs.
     get_mulliken_charge_sum_inputs
@@ -55,6 +58,8 @@ class InputReaderJSON(InputReader):
         Returns tuple of Loewdin charge inputs.
     get_loewdin_charge_sum_inputs
         Returns tuple of Loewdin charge sum inputs.
+    get_section_switches
+        Returns dict of whether each section without inputs is included.
     """
     def __init__(self, input_filename):
         """
@@ -81,9 +86,14 @@ class InputReaderJSON(InputReader):
 
         for key in inputs_dict.keys():
             inputs = inputs_dict[key]
+            if key in SECTION_SWITCHES:
+                continue
             for i, elem in enumerate(inputs):
                 if type(elem) is list:
-                    if key == "bond_angle_data_labels":
+                    # The order of the atoms matters for angles and dihedrals,
+                    # so these are not sorted.
+                    if key in ("bond_angle_data_labels",
+                               "dihedral_angle_data_labels"):
                         inputs[i] = tuple(elem)
                     else:
                         inputs[i] = tuple(sorted(elem))
@@ -136,6 +146,20 @@ class InputReaderJSON(InputReader):
         """
         return self._inputs_dict['bond_angle_data_labels']
 
+    def get_dihedral_angle_inputs(self):
+        """
+        Returns tuple of dihedral angle inputs.
+
+        This key is optional in the JSON file, since it was added after the
+        others; if it is absent, the Dihedral Angles section is skipped.
+
+        Returns
+        -------
+        tuple
+            Tuple of dihedral angle inputs.
+        """
+        return self._inputs_dict.get('dihedral_angle_data_labels', ())
+
     def get_mulliken_charge_inputs(self):
         """
         Returns tuple of Mulliken charge inputs.
@@ -179,3 +203,18 @@ class InputReaderJSON(InputReader):
             Tuple of Loewdin charge sum inputs.
         """
         return self._inputs_dict['loewdin_charge_sum_label_lists']
+
+    def get_section_switches(self):
+        """
+        Returns dict of whether each section without inputs is included.
+
+        These keys (e.g. "polarizability": false) are optional in the JSON
+        file; sections whose key is absent are included.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping each key in SECTION_SWITCHES to a bool.
+        """
+        return {key: bool(self._inputs_dict.get(key, True))
+                for key in SECTION_SWITCHES}
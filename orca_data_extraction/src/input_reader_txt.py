@@ -101,6 +101,8 @@ class InputReaderTxt(InputReader):
         Returns tuple of bond len. inputs ('bond tuples').
     get_bond_angle_inputs
         Returns tuple of bond angle inputs ('angle tuples').
+    get_dihedral_angle_inputs
+        Returns tuple of dihedral angle inputs (always empty).
     get_mulliken_charge_inputs
         Returns tuple of Mulliken charge inputs.
     get_mulliken_charge_sum_inputs
@@ -422,6 +424,18 @@ class InputReaderTxt(InputReader):
         """
         return self.__bond_angle_inputs
 
+    def get_dihedral_angle_inputs(self):
+        """
+        Returns tuple of dihedral angle inputs. The (deprecated) .txt input
+        format has no line for these, so the section is always skipped.
+
+        Returns
+        -------
+        tuple
+            Empty tuple.
+        """
+        return ()
+
     def get_mulliken_charge_inputs(self):
         """
         Returns tuple of Mulliken charge inputs.
@@ -28,10 +28,13 @@ class LoewdinChargeSums(DataSectionWithInputs):
     -------
     _search
         Search the .out file for Loewdin charge sum data.
+    get_blocks
+        Gives the blocks of text searched by LoewdinCharges.
     get_datum
         Gives the sum of Loewdin charges from _data for a set of atoms.
     """
-    def __init__(self, out_filename, outfile_contents, inputs):
+    def __init__(self, out_filename, outfile_contents, inputs,
+                 section_index=None):
         """
         Parameters
         ----------
@@ -42,13 +45,38 @@ class LoewdinChargeSums(DataSectionWithInputs):
         inputs : tuple
             Tuple of tuples of atom labels (e.g. ('1 H', '0 O) for which
             Loewdin charge sum data will be searched and then summed.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
         """
-        super().__init__(out_filename, outfile_contents, inputs)
+        super().__init__(out_filename, outfile_contents, inputs, section_index)
         self._section_name = 'Loewdin Charge Sums'
 
+    def _find_data(self):
+        """
+        Finds the Loewdin charge sum for each tuple of atom labels in _inputs.
+
+        All the atoms from all the tuples are looked up in a single
+        LoewdinCharges instance, so the charge table is only parsed once.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the tuples of atom labels from _inputs as
+            keys and strings of the charge sums as values.
+        """
+        atom_labels = tuple(dict.fromkeys(
+            atom_label for atoms_tuple in self._inputs
+            for atom_label in atoms_tuple
+        ))
+        self.__loewdin_charges = LoewdinCharges(
+            self._out_filename, self._outfile_contents, atom_labels,
+            self._section_index
+        )
+        return super()._find_data()
+
     def _search(self, atoms_tuple):
         """
-        Use regex to search .out file to get an Loewdin charge sum.
+        Use the parsed Loewdin charges to get an Loewdin charge sum.
 
         Parameters
         ----------
@@ -69,9 +97,7 @@ class LoewdinChargeSums(DataSectionWithInputs):
             This occurs when the regex (from the associated LoewdinCharges
             instance) fails to find what it is looking for.
         """
-        loewdin_charges = LoewdinCharges(
-            self._out_filename, self._outfile_contents, atoms_tuple
-        )
+        loewdin_charges = self.__loewdin_charges
         charge_sum = 0
         for atom_label in atoms_tuple:
             try:
@@ -83,6 +109,20 @@ class LoewdinChargeSums(DataSectionWithInputs):
                 return None
         return str(round(charge_sum, 5))
 
+    @classmethod
+    def get_blocks(cls):
+        """
+        Gives the blocks of text that are searched for the desired data, which
+        are those of the LoewdinCharges instance used to find the charges.
+
+        Returns
+        -------
+        tuple
+            Tuple of tuples of the header, trailing marker and occurrence of
+            each block.
+        """
+        return LoewdinCharges.get_blocks()
+
     def get_datum(self, atoms_tuple):
         """
         Gives the sum of Loewdin charges from _data for a set of atoms.
@@ -28,10 +28,13 @@ class MullikenChargeSums(DataSectionWithInputs):
     -------
     _search
         Search the .out file for Mulliken charge sum data.
+    get_blocks
+        Gives the blocks of text searched by MullikenCharges.
     get_datum
         Gives the sum of Mulliken charges from _data for a set of atoms.
     """
-    def __init__(self, out_filename, outfile_contents, inputs):
+    def __init__(self, out_filename, outfile_contents, inputs,
+                 section_index=None):
         """
         Parameters
         ----------
@@ -42,13 +45,38 @@ class MullikenChargeSums(DataSectionWithInputs):
         inputs : tuple
             Tuple of tuples of atom labels (e.g. ('1 H', '0 O) for which
             Mulliken charge sum data will be searched and then summed.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
         """
-        super().__init__(out_filename, outfile_contents, inputs)
+        super().__init__(out_filename, outfile_contents, inputs, section_index)
         self._section_name = 'Mulliken Charge Sums'
 
+    def _find_data(self):
+        """
+        Finds the Mulliken charge sum for each tuple of atom labels in _inputs.
+
+        All the atoms from all the tuples are looked up in a single
+        MullikenCharges instance, so the charge table is only parsed once.
+
+        Returns
+        -------
+        dict
+            A dictionary containing the tuples of atom labels from _inputs as
+            keys and strings of the charge sums as values.
+        """
+        atom_labels = tuple(dict.fromkeys(
+            atom_label for atoms_tuple in self._inputs
+            for atom_label in atoms_tuple
+        ))
+        self.__mulliken_charges = MullikenCharges(
+            self._out_filename, self._outfile_contents, atom_labels,
+            self._section_index
+        )
+        return super()._find_data()
+
     def _search(self, atoms_tuple):
         """
-        Use regex to search .out file to get an Mulliken charge sum.
+        Use the parsed Mulliken charges to get an Mulliken charge sum.
 
         Parameters
         ----------
@@ -68,9 +96,7 @@ class MullikenChargeSums(DataSectionWithInputs):
             This occurs when the regex (from the associated LoewdinCharges
             instance) fails to find what it is looking for.
         """
-        mulliken_charges = MullikenCharges(
-            self._out_filename, self._outfile_contents, atoms_tuple
-        )
+        mulliken_charges = self.__mulliken_charges
         charge_sum = 0
         for atom_label in atoms_tuple:
             try:
@@ -82,6 +108,20 @@ class MullikenChargeSums(DataSectionWithInputs):
                 return None
         return str(round(charge_sum, 5))
 
+    @classmethod
+    def get_blocks(cls):
+        """
+        Gives the blocks of text that are searched for the desired data, which
+        are those of the MullikenCharges instance used to find the charges.
+
+        Returns
+        -------
+        tuple
+            Tuple of tuples of the header, trailing marker and occurrence of
+            each block.
+        """
+        return MullikenCharges.get_blocks()
+
     def get_datum(self, atoms_tuple):
         """
         Gives the sum of Mulliken charges from _data for a set of atoms.
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Provides the NDJSONWriter class, which writes StructureData instances to a
+newline-delimited JSON (JSON Lines) file one record at a time.
+
+Each line holds the compact JSON record of one .out file (the same record as
+in the JSON file, see orca_out_to_json.make_json_record), so each record can
+be written as soon as its .out file has been processed and nothing needs to
+be kept in memory afterwards. The file is flushed at most every
+flush_interval seconds, so that a program reading it through a pipe (e.g.
+from stdout) receives the records as they are written rather than only when
+a buffer fills up.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import json
+import time
+
+from orca_data_extraction.src.orca_out_to_json import make_json_record
+
+# Default number of seconds between flushes of the file.
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class NDJSONWriter:
+    """
+    Writes StructureData instances to a newline-delimited JSON file, one line
+    per instance.
+
+    Attributes
+    ----------
+    __file_object : file object
+        Text file (or stream, e.g. sys.stdout) to which the records are
+        written.
+    __flush_interval : float
+        Number of seconds between flushes of __file_object (0 to flush after
+        every record).
+    __last_flush : float
+        Time of the last flush (see time.monotonic).
+    __record_count : int
+        Number of records written so far.
+
+    Methods
+    -------
+    write
+        Writes the data from a StructureData instance as the next line.
+    flush
+        Flushes the file.
+    get_record_count
+        Gives the number of records written so far.
+    """
+    def __init__(self, file_object, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        """
+        Parameters
+        ----------
+        file_object : file object
+            Text file opened for writing, or a stream such as sys.stdout.
+        flush_interval : float
+            Number of seconds between flushes of the file (0 to flush after
+            every record).
+        """
+        self.__file_object = file_object
+        self.__flush_interval = flush_interval
+        self.__last_flush = time.monotonic()
+        self.__record_count = 0
+
+    def write(self, sd):
+        """
+        Writes the data from a StructureData instance as the next line, and
+        flushes the file if flush_interval has passed since the last flush.
+
+        Parameters
+        ----------
+        sd : StructureData
+            StructureData instance from an ORCA .out file.
+        """
+        self.__file_object.write(
+            json.dumps(make_json_record(sd), separators=(',', ':')) + '\n')
+        self.__record_count += 1
+        if time.monotonic() - self.__last_flush >= self.__flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Flushes the file, e.g. once every record has been written."""
+        self.__file_object.flush()
+        self.__last_flush = time.monotonic()
+
+    def get_record_count(self):
+        """
+        Gives the number of records written so far.
+
+        Returns
+        -------
+        int
+            __record_count attribute.
+        """
+        return self.__record_count
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+A script to quickly pull desired data from ORCA .out files and write it to
+several types of output at once.
+
+Before running, the user should specify what information they want to look for
+in an input JSON file (see example). When executed, the script checks each file
+in the working directory. If the file ends in .out, it extracts the desired
+data once and writes it to every output chosen with --to (e.g.
+"--to csv --to parquet"), each of which is the same as that written by the
+corresponding orca_out_to_* script; the outputs share the output name and
+differ in their extensions.
+
+Each output is written by a thread of its own as the .out files are processed
+(see fan_out), so this is faster than running the scripts one after another,
+which would each read and parse every .out file again.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+from orca_data_extraction.src.arrow_writer import DEFAULT_ROW_GROUP_SIZE
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.export_sinks import SINK_TYPES, make_sink
+from orca_data_extraction.src.fan_out import FanOut
+from orca_data_extraction.src.file_discovery import discover_out_files
+from orca_data_extraction.src.script_args import get_script_args
+
+
+def add_arguments(parser):
+    """Adds the arguments which only this script takes."""
+    parser.add_argument('--to', action='append', choices=SINK_TYPES,
+                        dest='sink_types',
+                        help='type of output to write; give it once for '
+                             'each type of output (e.g. --to csv --to '
+                             'sqlite)')
+    parser.add_argument('--split-sections', action='store_true',
+                        help='for excel, write each section on a sheet of '
+                             'its own')
+    parser.add_argument('--row-group-size', type=int,
+                        default=DEFAULT_ROW_GROUP_SIZE,
+                        help=f'for parquet, the number of rows in each row '
+                             f'group (default: {DEFAULT_ROW_GROUP_SIZE})')
+    parser.add_argument('--float32', action='store_true',
+                        help='for parquet, store the values as float32 '
+                             'rather than float64')
+
+
+def main():
+    args = get_script_args('output', add_arguments)
+    if not args.sink_types:
+        print(f'Choose at least one type of output with --to (one of '
+              f'{", ".join(SINK_TYPES)}).')
+        quit()
+    if args.row_group_size < 1:
+        print('--row-group-size must be at least 1.')
+        quit()
+
+    print('')
+    sinks = []
+    # dict.fromkeys drops any type given more than once, keeping the order.
+    for sink_type in dict.fromkeys(args.sink_types):
+        try:
+            sinks.append(make_sink(sink_type, args.output_name,
+                                   args.inputs_name, args.split_sections,
+                                   args.row_group_size,
+                                   'float32' if args.float32 else 'float64'))
+        except ImportError as error:
+            print(f'{sink_type} output needs {error.name}, which is not '
+                  f'installed; install it with pip or conda.')
+            for sink in sinks:
+                sink.close()
+            quit()
+
+    with FanOut(sinks) as fan_out:
+        for f, sd, error in build_structure_data(args.inputs_name,
+                                                 discover_out_files(args),
+                                                 args.jobs,
+                                                 args.cache_dir, args.read_mode,
+                                                 args.index_dir):
+            if error is None:
+                fan_out.write(sd)
+                print(f'{f} complete.\n')
+            else:
+                print(f'Something went wrong with {f} and it threw '
+                      f'{error}\n')
+
+    failed_sinks = []
+    for sink, error in fan_out.get_errors():
+        failed_sinks.append(sink)
+        print(f'Something went wrong writing "{sink.get_output_filename()}" '
+              f'and it threw {type(error).__name__}: {error}\n')
+    saved_filenames = [f'"{sink.get_output_filename()}"' for sink in sinks
+                       if sink not in failed_sinks]
+    if saved_filenames:
+        print(f'Process complete! Results saved as '
+              f'{", ".join(saved_filenames)}')
+    else:
+        print('Process complete, but no results were saved.')
+
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,11 @@ Before running, the user should specify what information they want to look for
 in a .txt file (see example). When executed, the script checks each file in the
 working directory. If the file ends in .out, it exports the desired data into
 a CSV file.
+
+The .out files are processed in parallel, by one process per CPU unless a
+different number is given with --jobs (e.g. --jobs 1 to use a single process).
+Each row of the CSV file is written as soon as its .out file is processed, so
+the memory used does not grow with the number of files.
 """
 __author__ = "Peter Waddell"
 __copyright__ = "Copyright 2024"
@@ -17,10 +22,10 @@ __maintainer__ = "Peter Waddell"
 __email__ = "pmwaddell9@gmail.com"
 __status__ = "Prototype"
 
-import os
-import sys
-import pandas as pd
-
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.csv_writer import CSVWriter, get_csv_columns
+from orca_data_extraction.src.file_discovery import discover_out_files
+from orca_data_extraction.src.script_args import get_script_args
 from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
 from orca_data_extraction.src.orca_out_to_json import make_json_list
 
@@ -29,6 +34,9 @@ def create_csv_from_sds(sd_list, csv_name):
     """
     Writes the data in a list of StructureData instances to a CSV file.
 
+    The columns are taken from the data, so this needs every instance at
+    once; main instead writes each row as it goes (see csv_writer).
+
     Parameters
     ----------
     sd_list : list
@@ -37,70 +45,36 @@ def create_csv_from_sds(sd_list, csv_name):
     csv_name : str
         Name of the CSV file where the data will be stored.
     """
+    # pandas is only needed here, not for main.
+    import pandas as pd
+
     json_list = make_json_list(sd_list)
     df = pd.json_normalize(json_list)
     df.to_csv(csv_name + '.csv')
 
 
 def main():
-    # TODO: use an argument parser here instead? make argument inputs more sophisticated?
-    csv_name = ''
-    # Process command line arguments
-    # TODO: extract this part for each file type?? let the user select the file type @ command line?
-    if len(sys.argv) >= 2:
-        inputs_name = sys.argv[1]
-        if not os.path.isfile(inputs_name):
-            print('No file with name ' + inputs_name + ' found.')
-            quit()
-        if len(sys.argv) >= 3:
-            csv_name = sys.argv[2]
-    else:
-        print('Script will execute on all .out files in the current '
-              'working directory.')
-        while True:
-            print('Name of input file with atom labels ("q" to quit): ',
-                  end='')
-            inputs_name = input()
-            if inputs_name == 'q':
-                quit()
-            if not os.path.isfile(os.getcwd() + "\\" + inputs_name):
-                print('No file with name ' + inputs_name + ' found.')
-                continue
-            break
-
-    # Ask for excel file name
-    if csv_name == '':
-        print('Name of the CSV file which will contain the data (press ENTER '
-              'to use the default name, "q" to quit): ', end='')
-        csv_name = input()
-        if csv_name == 'q':
-            quit()
-        # If the user just hits enter, use default name:
-        if csv_name == '':
-            csv_name = f'ORCA_data_{inputs_name[:-4]}'
+    args = get_script_args('CSV')
+    csv_name = args.output_name
 
     print('')
-    sd_list = []
-    structure_data_builder = StructureDataBuilder(inputs_name)
-    for f in os.listdir(os.getcwd()):
-        if os.path.isfile(f):
-            try:
-                filename_end = f[-4:]
-            except IndexError:
-                # Since it is hard for filenames to be shorter than 4 chars
-                # I think it is unlikely this error would ever be raised...
-                print(f'{f}: Invalid filename')
-                continue
-            if filename_end == '.out':
-                try:
-                    print(f'Beginning search: {f}')
-                    sd_list.append(structure_data_builder.build(f))
-                    print(f'{f} complete.\n')
-                except IndexError:
-                    print(f'Something went wrong with {f} and it threw '
-                          f'an IndexError...\n')
+    # The columns are laid out from the inputs, before any .out file is read.
+    columns = get_csv_columns(
+        StructureDataBuilder(args.inputs_name).get_section_specs())
+    with open(f'{csv_name}.csv', 'w', newline='') as csv_file:
+        csv_writer = CSVWriter(csv_file, columns)
+        for f, sd, error in build_structure_data(args.inputs_name,
+                                                 discover_out_files(args),
+                                                 args.jobs,
+                                                 args.cache_dir, args.read_mode,
+                                                 args.index_dir):
+            if error is None:
+                csv_writer.write(sd)
+                print(f'{f} complete.\n')
+            else:
+                print(f'Something went wrong with {f} and it threw '
+                      f'{error}\n')
 
-    create_csv_from_sds(sd_list, csv_name)
     print(f'Process complete! Results saved as "{csv_name}.csv"')
 
 
@@ -7,6 +7,13 @@ Before running, the user should specify what information they want to look for
 in a .txt file (see example). When executed, the script checks each file in the
 working directory. If the file ends in .out, it exports the desired data into
 an excel spreadsheet.
+
+The .out files are processed in parallel, by one process per CPU unless a
+different number is given with --jobs (e.g. --jobs 1 to use a single process).
+The spreadsheet is written as an .xlsx file one row at a time, as each .out
+file is processed (see xlsx_writer); with --split-sections, each section is
+written on a sheet of its own. If xlsxwriter is not installed, or with --xls,
+an .xls file is written with xlwt once every .out file has been processed.
 """
 __author__ = "Peter Waddell"
 __copyright__ = "Copyright 2024"
@@ -17,11 +24,13 @@ __maintainer__ = "Peter Waddell"
 __email__ = "pmwaddell9@gmail.com"
 __status__ = "Prototype"
 
-import os
-import sys
+import importlib.util
 
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.file_discovery import discover_out_files
+from orca_data_extraction.src.script_args import get_script_args
 from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
-from xlwt import Workbook
+from orca_data_extraction.src.xlsx_writer import XLSXWriter
 
 
 def create_excel_from_sds(sd_list, excel_name):
@@ -126,6 +135,9 @@ def create_excel_from_sds(sd_list, excel_name):
                 data_section_name,
                 current_sd.get_data_section(data_section_name).get_data())
 
+    # xlwt is only needed here, not for the .xlsx files written by main.
+    from xlwt import Workbook
+
     wb = Workbook()
     sheet1 = wb.add_sheet('Sheet 1')
     row = 2
@@ -135,63 +147,62 @@ def create_excel_from_sds(sd_list, excel_name):
     wb.save(f'{excel_name}.xls')
 
 
+def add_arguments(parser):
+    """Adds the arguments which only this script takes."""
+    parser.add_argument('--split-sections', action='store_true',
+                        help='write each section on a sheet of its own')
+    parser.add_argument('--xls', action='store_true',
+                        help='write an .xls file with xlwt instead of an '
+                             '.xlsx file')
+
+
 def main():
-    # TODO: use an argument parser here instead? make argument inputs more sophisticated?
-    excel_name = ''
-    # Process command line arguments
-    if len(sys.argv) >= 2:
-        inputs_name = sys.argv[1]
-        if not os.path.isfile(inputs_name):
-            print('No file with name ' + inputs_name + ' found.')
-            quit()
-        if len(sys.argv) >= 3:
-            excel_name = sys.argv[2]
-    else:
-        print('Script will execute on all .out files in the current '
-              'working directory.')
-        while True:
-
-            print('Name of input file with atom labels ("q" to quit): ',
-                  end='')
-            inputs_name = input()
-            if inputs_name == 'q':
-                quit()
-            if not os.path.isfile(os.getcwd() + "\\" + inputs_name):
-                print('No file with name ' + inputs_name + ' found.')
-                continue
-            break
-
-    # Ask for excel file name
-    if excel_name == '':
-        print('Name of the Excel file which will contain the data (press ENTER '
-              'to use the default name, "q" to quit): ', end='')
-        excel_name = input()
-        if excel_name == 'q':
-            quit()
-        # If the user just hits enter, use default name:
-        if excel_name == '':
-            excel_name = f'ORCA_data_{inputs_name[:-4]}'
+    args = get_script_args('Excel', add_arguments)
+    excel_name = args.output_name
 
     print('')
-    sd_list = []
-    structure_data_builder = StructureDataBuilder(inputs_name)
-    for f in os.listdir(os.getcwd()):
-        if os.path.isfile(f):
-            try:
-                filename_end = f[-4:]
-            except IndexError:
-                # Since it is hard for filenames to be shorter than 4 chars
-                # I think it is unlikely this error would ever be raised...
-                print(f'{f}: Invalid filename')
-                continue
-            if filename_end == '.out':
-                try:
-                    print(f'Beginning search: {f}')
-                    sd_list.append(structure_data_builder.build(f))
-                    print(f'{f} complete.\n')
-                except IndexError:
+    if not args.xls and importlib.util.find_spec('xlsxwriter') is None:
+        print('xlsxwriter is not installed, so an .xls file will be written '
+              'instead of an .xlsx file.\n')
+        args.xls = True
+    if not args.xls:
+        section_specs = StructureDataBuilder(
+            args.inputs_name).get_section_specs()
+        with XLSXWriter(f'{excel_name}.xlsx', section_specs,
+                        args.split_sections) as xlsx_writer:
+            for f, sd, error in build_structure_data(
+                    args.inputs_name, discover_out_files(args), args.jobs,
+                    args.cache_dir, args.read_mode, args.index_dir):
+                if error is not None:
                     print(f'Something went wrong with {f} and it threw '
-                          f'an IndexError...\n')
+                          f'{error}\n')
+                    continue
+                try:
+                    xlsx_writer.write(sd)
+                except ValueError as write_error:
+                    # The sheets are full, so no more rows can be written.
+                    print(f'Something went wrong writing "{excel_name}.xlsx" '
+                          f'and it threw {type(write_error).__name__}: '
+                          f'{write_error}\n')
+                    print(f'Process stopped; results for the first '
+                          f'{xlsx_writer.get_row_count()} .out files saved as '
+                          f'"{excel_name}.xlsx"')
+                    return
+                print(f'{f} complete.\n')
+        print(f'Process complete! Results saved as "{excel_name}.xlsx"')
+        return
+
+    sd_list = []
+    for f, sd, error in build_structure_data(args.inputs_name,
+                                             discover_out_files(args),
+                                             args.jobs, args.cache_dir,
+                                             args.read_mode, args.index_dir):
+        if error is None:
+            sd_list.append(sd)
+            print(f'{f} complete.\n')
+        else:
+            print(f'Something went wrong with {f} and it threw '
+                  f'{error}\n')
 
     create_excel_from_sds(sd_list, excel_name)
     print(f'Process complete! Results saved as "{excel_name}.xls"')
@@ -7,6 +7,9 @@ Before running, the user should specify what information they want to look for
 in a .txt file (see example). When executed, the script checks each file in the
 working directory. If the file ends in .out, it exports the desired data into
 a JSON file.
+
+The .out files are processed in parallel, by one process per CPU unless a
+different number is given with --jobs (e.g. --jobs 1 to use a single process).
 """
 __author__ = "Peter Waddell"
 __copyright__ = "Copyright 2024"
@@ -17,11 +20,90 @@ __maintainer__ = "Peter Waddell"
 __email__ = "pmwaddell9@gmail.com"
 __status__ = "Prototype"
 
-import os
 import json
-import sys
 
-from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.file_discovery import discover_out_files
+from orca_data_extraction.src.script_args import get_script_args
+
+
+def format_column_name(x):
+    """
+    Format string for use as a column name in the JSON file.
+
+    Parameters
+    ----------
+    x : str or other
+        Entity to be potentially renamed.
+
+    Returns
+    -------
+    str or other
+        A string formatted for use as column name in the JSON file, or returns
+        the object unchanged if it is not a string (e.g., a dict).
+    """
+    if type(x) != str:
+        return x
+    else:
+        return x\
+            .replace("'", "")\
+            .replace(', ', ',')\
+            .replace(' ', '_')\
+            .lower()
+
+
+def format_section_name(section_name):
+    """
+    Format the name of a DataSection for use as a key in the JSON file.
+
+    Parameters
+    ----------
+    section_name : str
+        Name of the DataSection, e.g. 'Bond Lengths'.
+
+    Returns
+    -------
+    str
+        The formatted name, e.g. 'bond_lengths'.
+    """
+    return section_name.replace(' ', '_').lower()
+
+
+def make_json_record(sd):
+    """
+    Converts the data in a StructureData instance to a dict for JSON.
+
+    Parameters
+    ----------
+    sd : StructureData
+        StructureData instance from an ORCA .out file.
+
+    Returns
+    -------
+    dict
+        Dictionary with the data from sd configured to be compatible with
+        JSON (i.e., tuples are converted to strings).
+    """
+    sd_data = {
+        'script_input_filename': sd.get_input_filename(),
+        'orca_out_filename': sd.get_out_filename()
+    }
+    for data_section in sd.get_data_sections().values():
+        data_section_data = data_section.get_data()
+        json_safe_data = {}
+        # JSON is not compatible with tuples, so must convert to str
+        for key in data_section_data.keys():
+            val = data_section_data[key]
+            key_to_add, val_to_add = key, val
+            if type(val) == tuple:
+                val_to_add = str(val)
+            if type(key) == tuple:
+                key_to_add = str(key)
+            json_safe_data[format_column_name(key_to_add)] = \
+                format_column_name(val_to_add)
+        sd_data[format_section_name(data_section.get_section_name())] = \
+            json_safe_data
+    return sd_data
 
 
 def make_json_list(sd_list):
@@ -40,54 +122,7 @@ def make_json_list(sd_list):
         List with the data from sd_list configured to be compatible with
         JSON (i.e., tuples are converted to strings).
     """
-    def format_column_name(x):
-        """
-        Format string for use as a column name in the JSON file.
-
-        Parameters
-        ----------
-        x : str or other
-            Entity to be potentially renamed.
-
-        Returns
-        -------
-        str or other
-            A string formatted for use as column name in the JSON file, or returns
-            the object unchanged if it is not a string (e.g., a dict).
-        """
-        if type(x) != str:
-            return x
-        else:
-            return x\
-                .replace("'", "")\
-                .replace(', ', ',')\
-                .replace(' ', '_')\
-                .lower()
-
-    json_lst = []
-    for sd in sd_list:
-        sd_data = {
-            'script_input_filename': sd.get_input_filename(),
-            'orca_out_filename': sd.get_out_filename()
-        }
-        for data_section in sd.get_data_sections().values():
-            data_section_data = data_section.get_data()
-            json_safe_data = {}
-            # JSON is not compatible with tuples, so must convert to str
-            for key in data_section_data.keys():
-                val = data_section_data[key]
-                key_to_add, val_to_add = key, val
-                if type(val) == tuple:
-                    val_to_add = str(val)
-                if type(key) == tuple:
-                    key_to_add = str(key)
-                json_safe_data[format_column_name(key_to_add)] = \
-                    format_column_name(val_to_add)
-            sd_data[
-                data_section.get_section_name().replace(' ', '_').lower()
-            ] = json_safe_data
-        json_lst.append(sd_data)
-    return json_lst
+    return [make_json_record(sd) for sd in sd_list]
 
 
 def create_json_from_sds(sd_list, json_name):
@@ -108,62 +143,21 @@ def create_json_from_sds(sd_list, json_name):
 
 
 def main():
-    # TODO: use an argument parser here instead? make argument inputs more sophisticated?
-    json_name = ''
-    # Process command line arguments
-    # TODO: extract this part for each file type?? let the user select the file type @ command line?
-    if len(sys.argv) >= 2:
-        inputs_name = sys.argv[1]
-        if not os.path.isfile(inputs_name):
-            print('No file with name ' + inputs_name + ' found.')
-            quit()
-        if len(sys.argv) >= 3:
-            json_name = sys.argv[2]
-    else:
-        print('Script will execute on all .out files in the current '
-              'working directory.')
-        while True:
-            print('Name of input file with atom labels ("q" to quit): ',
-                  end='')
-            inputs_name = input()
-            if inputs_name == 'q':
-                quit()
-            if not os.path.isfile(os.getcwd() + "\\" + inputs_name):
-                print('No file with name ' + inputs_name + ' found.')
-                continue
-            break
-
-    # Ask for excel file name
-    if json_name == '':
-        print('Name of the JSON file which will contain the data (press ENTER '
-              'to use the default name, "q" to quit): ', end='')
-        json_name = input()
-        if json_name == 'q':
-            quit()
-        # If the user just hits enter, use default name:
-        if json_name == '':
-            json_name = f'ORCA_data_{inputs_name[:-4]}'
+    args = get_script_args('JSON')
+    json_name = args.output_name
 
     print('')
     sd_list = []
-    structure_data_builder = StructureDataBuilder(inputs_name)
-    for f in os.listdir(os.getcwd()):
-        if os.path.isfile(f):
-            try:
-                filename_end = f[-4:]
-            except IndexError:
-                # Since it is hard for filenames to be shorter than 4 chars
-                # I think it is unlikely this error would ever be raised...
-                print(f'{f}: Invalid filename')
-                continue
-            if filename_end == '.out':
-                try:
-                    print(f'Beginning search: {f}')
-                    sd_list.append(structure_data_builder.build(f))
-                    print(f'{f} complete.\n')
-                except IndexError:
-                    print(f'Something went wrong with {f} and it threw '
-                          f'an IndexError...\n')
+    for f, sd, error in build_structure_data(args.inputs_name,
+                                             discover_out_files(args),
+                                             args.jobs, args.cache_dir,
+                                             args.read_mode, args.index_dir):
+        if error is None:
+            sd_list.append(sd)
+            print(f'{f} complete.\n')
+        else:
+            print(f'Something went wrong with {f} and it threw '
+                  f'{error}\n')
 
     create_json_from_sds(sd_list, json_name)
     print(f'Process complete! Results saved as "{json_name}.json"')
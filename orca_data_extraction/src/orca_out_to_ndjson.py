@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+A script to quickly pull desired data from ORCA .out files and write it as
+newline-delimited JSON (JSON Lines), one record per .out file.
+
+Before running, the user should specify what information they want to look for
+in an input JSON file (see example). When executed, the script checks each file
+in the working directory. If the file ends in .out, it writes the desired data
+as one line of the output file, with the same record as in the JSON file written
+by orca_out_to_json (see ndjson_writer).
+
+Each record is written as soon as its .out file is processed. If the name of
+the output file is "-", the records are written to stdout (e.g. to be piped
+into another program), and the messages of the script are written to stderr.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+import sys
+
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.file_discovery import discover_out_files
+from orca_data_extraction.src.ndjson_writer import (
+    DEFAULT_FLUSH_INTERVAL, NDJSONWriter)
+from orca_data_extraction.src.script_args import get_script_args
+
+
+def add_arguments(parser):
+    """Adds the arguments which only this script takes."""
+    parser.add_argument('--flush-interval', type=float,
+                        default=DEFAULT_FLUSH_INTERVAL,
+                        help=f'number of seconds between flushes of the '
+                             f'output, 0 to flush after every record '
+                             f'(default: {DEFAULT_FLUSH_INTERVAL})')
+
+
+def open_records_file(ndjson_name):
+    """
+    Opens the file to which the records are written: a copy of stdout if
+    ndjson_name is "-", otherwise the file ndjson_name + ".jsonl". For stdout,
+    the original stdout is then pointed at stderr, so that the messages printed
+    by this script, the DataSections and the worker processes (which inherit
+    it) are not mixed in with the records.
+
+    Parameters
+    ----------
+    ndjson_name : str
+        Name of the output file (without extension), or "-" for stdout.
+
+    Returns
+    -------
+    file object
+        Text file opened for writing.
+    """
+    if ndjson_name != '-':
+        return open(f'{ndjson_name}.jsonl', 'w')
+    sys.stdout.flush()
+    records_file = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return records_file
+
+
+def main():
+    args = get_script_args('NDJSON', add_arguments)
+    ndjson_name = args.output_name
+
+    with open_records_file(ndjson_name) as records_file:
+        print('')
+        ndjson_writer = NDJSONWriter(records_file, args.flush_interval)
+        for f, sd, error in build_structure_data(args.inputs_name,
+                                                 discover_out_files(args),
+                                                 args.jobs,
+                                                 args.cache_dir, args.read_mode,
+                                                 args.index_dir):
+            if error is None:
+                ndjson_writer.write(sd)
+                print(f'{f} complete.\n')
+            else:
+                print(f'Something went wrong with {f} and it threw '
+                      f'{error}\n')
+        ndjson_writer.flush()
+
+    if ndjson_name == '-':
+        print('Process complete! Results written to stdout')
+    else:
+        print(f'Process complete! Results saved as "{ndjson_name}.jsonl"')
+
+
+if __name__ == '__main__':
+    main()
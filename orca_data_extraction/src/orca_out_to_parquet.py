@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+A script to quickly pull desired data from ORCA .out files and compile it into
+a Parquet file (or an Arrow IPC stream), with typed numeric columns.
+
+Before running, the user should specify what information they want to look for
+in an input JSON file (see example). When executed, the script checks each file
+in the working directory. If the file ends in .out, it exports the desired data
+into the Parquet file, with the same columns as the CSV file written by
+orca_out_to_csv but with the values stored as numbers (see arrow_writer).
+
+The .out files are processed in parallel, as for the other orca_out_to_*
+scripts, and the rows are written in row groups as the files are processed.
+This needs the optional dependency pyarrow.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import importlib.util
+
+from orca_data_extraction.src.arrow_writer import (
+    ARROW_FORMATS, DEFAULT_ROW_GROUP_SIZE, ArrowWriter)
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.file_discovery import discover_out_files
+from orca_data_extraction.src.script_args import get_script_args
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+def add_arguments(parser):
+    """Adds the arguments which only this script takes."""
+    parser.add_argument('--format', choices=ARROW_FORMATS, default='parquet',
+                        help='"parquet" for a Parquet file, or "arrow" for '
+                             'an Arrow IPC stream (default: parquet)')
+    parser.add_argument('--row-group-size', type=int,
+                        default=DEFAULT_ROW_GROUP_SIZE,
+                        help=f'number of rows in each row group (default: '
+                             f'{DEFAULT_ROW_GROUP_SIZE})')
+    parser.add_argument('--float32', action='store_true',
+                        help='store the values as float32 rather than '
+                             'float64')
+
+
+def main():
+    args = get_script_args('Parquet', add_arguments)
+    if args.row_group_size < 1:
+        print('--row-group-size must be at least 1.')
+        quit()
+    output_filename = args.output_name + ARROW_FORMATS[args.format]
+    if importlib.util.find_spec('pyarrow') is None:
+        print('pyarrow is needed to write Parquet and Arrow files; install '
+              'it with pip or conda.')
+        quit()
+
+    print('')
+    section_specs = StructureDataBuilder(args.inputs_name).get_section_specs()
+    with ArrowWriter(output_filename, section_specs, args.format,
+                     args.row_group_size,
+                     'float32' if args.float32 else 'float64') as writer:
+        for f, sd, error in build_structure_data(args.inputs_name,
+                                                 discover_out_files(args),
+                                                 args.jobs,
+                                                 args.cache_dir, args.read_mode,
+                                                 args.index_dir):
+            if error is None:
+                writer.write(sd)
+                print(f'{f} complete.\n')
+            else:
+                print(f'Something went wrong with {f} and it threw '
+                      f'{error}\n')
+
+    print(f'Process complete! Results saved as "{output_filename}"')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+A script to quickly pull desired data from ORCA .out files and keep it in an
+SQLite database.
+
+Before running, the user should specify what information they want to look for
+in an input JSON file (see example). When executed, the script checks each file
+in the working directory. If the file ends in .out and its data are not already
+in the database (or the file or the input file has changed since they were
+stored), it stores the desired data in the database, replacing any old data
+for that file (see results_store).
+
+The .out files are processed in parallel, as for the other orca_out_to_*
+scripts, and the data are committed to the database in batches as they go.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import sqlite3
+
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.file_discovery import (
+    discover_out_files, get_out_filename)
+from orca_data_extraction.src.file_fingerprint import input_spec_hash
+from orca_data_extraction.src.input_reader_json import InputReaderJSON
+from orca_data_extraction.src.results_store import (
+    FILES_PER_COMMIT, ResultsStore)
+from orca_data_extraction.src.script_args import get_script_args
+
+
+def main():
+    args = get_script_args('SQLite')
+    db_name = f'{args.output_name}.sqlite'
+
+    print('')
+    spec_hash = input_spec_hash(
+        InputReaderJSON(args.inputs_name).get_input_spec())
+    with ResultsStore(db_name, spec_hash) as results_store:
+        unchanged_count = 0
+
+        def changed_out_files():
+            # The files are checked as they are found, so that the changed
+            # ones are processed without waiting for the search to finish.
+            nonlocal unchanged_count
+            for out_file in discover_out_files(args):
+                if results_store.is_current(get_out_filename(out_file)):
+                    unchanged_count += 1
+                else:
+                    yield out_file
+
+        stored_count = 0
+        for f, sd, error in build_structure_data(args.inputs_name,
+                                                 changed_out_files(), args.jobs,
+                                                 args.cache_dir, args.read_mode,
+                                                 args.index_dir):
+            if error is None:
+                try:
+                    results_store.put(sd)
+                except (OSError, sqlite3.Error) as put_error:
+                    # None of the data of the file were stored (see
+                    # ResultsStore.put), so the rest can still be stored.
+                    print(f'Something went wrong with {f} and it threw '
+                          f'{type(put_error).__name__}: {put_error}\n')
+                    continue
+                stored_count += 1
+                if stored_count % FILES_PER_COMMIT == 0:
+                    results_store.commit()
+                print(f'{f} complete.\n')
+            else:
+                print(f'Something went wrong with {f} and it threw '
+                      f'{error}\n')
+
+    if unchanged_count:
+        print(f'{unchanged_count} .out files were unchanged since they were '
+              f'stored and were skipped.\n')
+    print(f'Process complete! Results saved in "{db_name}"')
+
+
+if __name__ == '__main__':
+    main()
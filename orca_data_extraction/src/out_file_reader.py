@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Provides open_out_file, which gives the contents of an ORCA .out file in one
+of several forms (read modes) for the DataSection subclasses to search.
+
+The read modes are:
+
+'text'
+    The whole file is read and decoded into a single str.
+'mmap'
+    The file is memory-mapped and given as a read-only bytes-like buffer.
+    Nothing is read until it is searched, the operating system can share
+    and evict the pages as needed, and only the blocks which are parsed are
+    decoded (see section_index.get_text). This is much faster and uses much
+    less memory for large files.
+'stream'
+    The file is read once, in fixed-size chunks, and only the blocks that are
+    searched by the DataSections are kept (see block_stream). This holds only
+    a small part of the file in memory at any time, for files which are too
+    large to be read or mapped as a whole.
+'tail'
+    Only the end of the file is read, backwards, as far as is needed to find
+    the last occurrence of each block that is searched by the DataSections,
+    and the start of the file is read only for the blocks which are counted
+    from the start, no further than the first cycle of the calculation (see
+    tail_reader). For a long geometry optimization, this is usually a small
+    part of the file.
+'indexed'
+    The offsets of the section headers are taken from a sidecar index saved
+    by an earlier run (written on the first run), and only the byte ranges of
+    the blocks that are searched by the DataSections are read (see
+    sidecar_index). This suits files which are extracted from repeatedly.
+
+Compressed .out files (gzip, xz, bz2 or zstd, see compressed_files) are
+detected whatever their extension, and decompressed as they are read: they
+are given whole for 'text' (as a str) and 'mmap' (as bytes), and only the
+blocks that are searched are kept for the other read modes, since a
+compressed file can only be read from start to end.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import mmap
+import os
+from contextlib import contextmanager
+
+from orca_data_extraction.src.block_stream import read_blocks
+from orca_data_extraction.src.compressed_files import (
+    detect_compression, open_decompressed)
+from orca_data_extraction.src.file_fingerprint import CHUNK_SIZE, HashingFile
+from orca_data_extraction.src.sidecar_index import read_indexed_blocks
+from orca_data_extraction.src.tail_reader import read_head_and_tail
+
+READ_MODES = ('text', 'mmap', 'stream', 'tail', 'indexed')
+
+
+@contextmanager
+def open_out_file(out_filename, read_mode='text', blocks=(), index_dir=None,
+                  out_data=None, content_hashes=None):
+    """
+    Context manager which gives the contents of a .out file. For the 'mmap'
+    read mode, the memory map is closed when the context is exited, so the
+    contents must not be used after that.
+
+    Parameters
+    ----------
+    out_filename : str
+        Filename of the .out file.
+    read_mode : str
+        One of READ_MODES (see above).
+    blocks : iterable
+        Tuples of the header, trailing marker and occurrence of each block
+        that is kept in the 'stream', 'tail' and 'indexed' read modes (see
+        DataSection.get_blocks).
+    index_dir : str or None
+        Directory in which the sidecar indexes are kept for the 'indexed'
+        read mode, or None to keep each next to its .out file.
+    out_data : bytes or None
+        Contents of the .out file (possibly compressed), e.g. of a member of
+        an archive, which are read instead of the file out_filename. These
+        are given as bytes for 'mmap', and only the blocks that are searched
+        are kept for 'indexed', as for 'stream', since there is no file to
+        index.
+    content_hashes : dict or None
+        If given, the hash of the contents of the file (see
+        file_fingerprint.content_hash) is stored in this under out_filename
+        when the whole file is read from start to end anyway (in the 'text'
+        and 'stream' read modes, and for compressed files), so that it need
+        not be read again to hash it (see extraction_cache). Files which are
+        only partly read are not hashed at all.
+
+    Yields
+    ------
+    str or bytes-like
+        The contents of the .out file: a str for 'text', a read-only
+        mmap.mmap for 'mmap' (bytes for an empty file, which cannot be
+        memory-mapped, for a compressed file or for out_data), or a str of
+        only the parts of the file that were kept for 'stream', 'tail' and
+        'indexed'.
+
+    Raises
+    ------
+    ValueError
+        If read_mode is not one of READ_MODES.
+    OSError
+        If the file cannot be read (or decompressed).
+    ImportError
+        If the file is compressed with zstd and zstandard is not installed.
+    """
+    if read_mode not in READ_MODES:
+        raise ValueError(f'Unknown read mode {read_mode!r}; expected one of '
+                         f'{", ".join(READ_MODES)}.')
+    if out_data is None:
+        file_object = open(out_filename, 'rb')
+    else:
+        file_object = io.BytesIO(out_data)
+    with file_object:
+        compression = detect_compression(file_object)
+        hashing_file = None
+        if content_hashes is not None and out_data is None and (
+                compression is not None or read_mode in ('text', 'stream')):
+            hashing_file = HashingFile(file_object)
+            file_object = io.BufferedReader(hashing_file, CHUNK_SIZE)
+        if compression is not None:
+            with open_decompressed(file_object, compression) as decompressed:
+                contents = _read_decompressed(decompressed, read_mode, blocks)
+            _store_hash(hashing_file, content_hashes, out_filename)
+            yield contents
+        elif read_mode == 'text':
+            with io.TextIOWrapper(file_object) as text_file:
+                contents = text_file.read()
+            _store_hash(hashing_file, content_hashes, out_filename)
+            yield contents
+        elif read_mode == 'mmap':
+            if out_data is not None:
+                yield out_data
+                return
+            if os.fstat(file_object.fileno()).st_size == 0:
+                yield b''
+                return
+            with mmap.mmap(file_object.fileno(), 0,
+                           access=mmap.ACCESS_READ) as buffer:
+                yield buffer
+        elif read_mode == 'stream' or out_data is not None and \
+                read_mode == 'indexed':
+            with io.TextIOWrapper(file_object) as text_file:
+                contents = read_blocks(text_file, blocks)
+            _store_hash(hashing_file, content_hashes, out_filename)
+            yield contents
+        elif read_mode == 'tail':
+            contents = read_head_and_tail(file_object, blocks)
+            yield contents
+        else:
+            yield read_indexed_blocks(out_filename, blocks, index_dir)
+
+
+def _store_hash(hashing_file, content_hashes, out_filename):
+    """
+    Stores the hash of the contents of a file read through a HashingFile in
+    content_hashes, if the whole file was read.
+    """
+    if hashing_file is None:
+        return
+    digest = hashing_file.get_digest()
+    if digest is not None:
+        content_hashes[out_filename] = digest
+
+
+def _read_decompressed(decompressed, read_mode, blocks):
+    """
+    Reads the contents of a compressed .out file as it is decompressed.
+
+    A compressed file cannot be memory-mapped, read backwards or read from an
+    offset without decompressing everything before it, so for the 'mmap'
+    read mode the decompressed contents are read as bytes (so that only the
+    blocks which are parsed are decoded), and for the 'tail' and 'indexed'
+    read modes only the desired blocks are kept as in the 'stream' read mode.
+
+    Parameters
+    ----------
+    decompressed : file object
+        Binary file object of the decompressed contents (see
+        compressed_files.open_decompressed).
+    read_mode : str
+        One of READ_MODES.
+    blocks : iterable
+        Tuples of the header, trailing marker and occurrence of each block
+        that is kept (see DataSection.get_blocks).
+
+    Returns
+    -------
+    str or bytes
+        The contents of the .out file: bytes for 'mmap', otherwise a str.
+    """
+    if read_mode == 'mmap':
+        return decompressed.read()
+    with io.TextIOWrapper(decompressed) as text_file:
+        if read_mode == 'text':
+            return text_file.read()
+        return read_blocks(text_file, blocks)
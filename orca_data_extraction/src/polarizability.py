@@ -30,9 +30,20 @@ class Polarizability(DataSection):
     Methods
     -------
     _find_data
+        Gives the polarizability data.
+    parse
+        Parses the block without reporting missing data.
+    _parse_block
         Search the .out file for polarizability data, return as dict.
     """
-    def __init__(self, out_filename, outfile_contents):
+    # Class attributes.
+    _block_start = 'THE POLARIZABILITY TENSOR'
+    _block_end = 'Timings for individual modules:'
+    _block_occurrence = 0
+    _data_labels = ('alpha_xx', 'alpha_xy', 'alpha_xz', 'alpha_yx', 'alpha_yy',
+                    'alpha_yz', 'alpha_zx', 'alpha_zy', 'alpha_zz', 'alpha')
+
+    def __init__(self, out_filename, outfile_contents, section_index=None):
         """
         Parameters
         ----------
@@ -40,6 +51,8 @@ class Polarizability(DataSection):
             Name of the ORCA .out file that will be searched.
         outfile_contents : str
             String containing the full text of the ORCA .out file.
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents.
         """
         # Note: \ must be used for all whitespace I want to count
         # when using verbose regular expressions.
@@ -70,24 +83,49 @@ class Polarizability(DataSection):
             (Isotropic\ polarizability\ :)
             (\ *)
             (-?[\d]+[.][\d]+)   # isotropic polarizability
-            (.*?)
-            (Timings\ for\ individual\ modules:)
-            # above: prevents accidental matches later in the .out file
             """,
             flags=re.VERBOSE | re.DOTALL
         )
-        super().__init__(out_filename, outfile_contents)
+        super().__init__(out_filename, outfile_contents, section_index)
         self._section_name = 'Polarizability'
 
     def _find_data(self):
         """
-        Search the .out file for polarizability data, return as dict.
+        Gives the polarizability data, which are parsed once per file (see
+        _parse_block).
 
         Returns
         -------
         dict
+            Dictionary of the polarizability data (see _parse_block), with
+            None as each value if they were not found.
+        """
+        data = self._get_parsed(self._parse_block)
+        if data is None:
+            print(f'Polarizability data not found in {self._out_filename}.')
+            return dict.fromkeys(self._data_labels)
+        return data
+
+    def parse(self):
+        """
+        Parses the polarizability data into the section index, without reporting
+        them if they are missing (see DataSection.parse).
+        """
+        self._get_parsed(self._parse_block)
+
+    def _parse_block(self):
+        """
+        Search the .out file for polarizability data, return as dict.
+
+        The result is shared by other instances for the same file, and can
+        be stored with the other parsed tables of the file (see table_cache).
+
+        Returns
+        -------
+        dict or None
             Dictionary containing polarizability parameters as keys and the
-            corresponding polarizability values (in AU) as values (as strings).
+            corresponding polarizability values (in AU) as values (as strings),
+            or None if they were not found.
 
         Raises
         ------
@@ -96,7 +134,12 @@ class Polarizability(DataSection):
             for, and returns NoneType. Then, .group(n) gives this error.
         """
         try:
-            result = self.__regex.search(self._outfile_contents)
+            # The header and trailing marker are located first (see the
+            # _block_start and _block_end attributes), so a missing section is
+            # reported without running the regex, which is then only tried at
+            # the header at the start of the block.
+            block = self._get_block()
+            result = None if block is None else self.__regex.match(block)
             alpha_xx = result.group(5)
             alpha_xy = result.group(7)
             alpha_xz = result.group(9)
@@ -113,9 +156,4 @@ class Polarizability(DataSection):
                     'alpha_zx': alpha_zx, 'alpha_zy': alpha_zy,
                     'alpha_zz': alpha_zz, 'alpha': alpha}
         except AttributeError:
-            print(f'Polarizability data not found in {self._out_filename}.')
-            return {'alpha_xx': None, 'alpha_xy': None,
-                    'alpha_xz': None, 'alpha_yx': None,
-                    'alpha_yy': None, 'alpha_yz': None,
-                    'alpha_zx': None, 'alpha_zy': None,
-                    'alpha_zz': None, 'alpha': None}
+            return None
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Provides the ResultsStore class, which keeps the data extracted from ORCA .out
+files in an SQLite database.
+
+Unlike the CSV, JSON and Excel files written by the other scripts, the
+database is updated in place: the data of each .out file are replaced when
+the file (or the input file) has changed, and files which have not changed
+are not processed again. The data are kept in normalized tables with typed
+(REAL) values, so they can be queried with SQL without loading all of them:
+
+files
+    One row per .out file: its absolute path, the size and modification time
+    used to tell whether it has changed (see file_fingerprint.stat_key), the
+    hash of the input specification and the name of the input file.
+sections
+    One row per section name (e.g. 'Final Geometry').
+atom_values
+    Values for single atoms (coordinates and charges): the file, the section,
+    the atom label (e.g. '0 P'), the quantity (e.g. 'x', or 'value' for a
+    charge) and the value.
+tuple_values
+    Values for tuples of atoms (bond lengths, bond angles, dihedral angles
+    and charge sums): the file, the section, the atom labels joined by ','
+    (e.g. '0 P,1 C') and the value.
+file_values
+    Values which belong to the whole structure (dipole moments,
+    polarizability and HOMO and LUMO energies): the file, the section, the
+    label (e.g. 'Tot') and the value.
+
+For example, the P-C bond length of every structure is given by:
+
+    SELECT files.path, tuple_values.value
+    FROM tuple_values
+    JOIN files USING (file_id)
+    JOIN sections USING (section_id)
+    WHERE sections.name = 'Bond Lengths' AND tuple_values.atoms = '0 P,1 C'
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import sqlite3
+
+from orca_data_extraction.src.data_section_with_inputs import DataSectionWithInputs
+from orca_data_extraction.src.file_fingerprint import stat_key
+
+# Number of .out files whose data are stored between commits.
+FILES_PER_COMMIT = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    file_id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    spec_hash TEXT NOT NULL,
+    input_filename TEXT
+);
+CREATE TABLE IF NOT EXISTS sections (
+    section_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS atom_values (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    section_id INTEGER NOT NULL REFERENCES sections (section_id),
+    atom_label TEXT NOT NULL,
+    quantity TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (file_id, section_id, atom_label, quantity)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS atom_values_by_atom
+    ON atom_values (section_id, atom_label, quantity);
+CREATE TABLE IF NOT EXISTS tuple_values (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    section_id INTEGER NOT NULL REFERENCES sections (section_id),
+    atoms TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (file_id, section_id, atoms)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tuple_values_by_atoms
+    ON tuple_values (section_id, atoms);
+CREATE TABLE IF NOT EXISTS file_values (
+    file_id INTEGER NOT NULL REFERENCES files (file_id) ON DELETE CASCADE,
+    section_id INTEGER NOT NULL REFERENCES sections (section_id),
+    label TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (file_id, section_id, label)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS file_values_by_label
+    ON file_values (section_id, label);
+"""
+
+
+class ResultsStore:
+    """
+    Keeps the data of StructureData instances in an SQLite database (see
+    above), one entry per .out file.
+
+    Changes are made in a transaction, which is committed by commit or
+    close (or when the ResultsStore is used as a context manager).
+
+    Attributes
+    ----------
+    __connection : sqlite3.Connection
+        Connection to the database.
+    __spec_hash : str
+        Hash of the input specification (see file_fingerprint), stored with
+        each file so that its data are replaced when the inputs change.
+    __section_ids : dict
+        Dictionary mapping section names to their ids in the sections table.
+
+    Methods
+    -------
+    is_current
+        Tells whether the stored data of a .out file are up to date.
+    put
+        Stores the data of a StructureData instance, replacing any stored
+        data of the same .out file.
+    commit
+        Commits the changes made so far.
+    close
+        Commits the changes and closes the database.
+    get_connection
+        Gives the connection to the database, e.g. to query it.
+    __put
+        Stores the data of a StructureData instance under a stat key.
+    __read_section_ids
+        Gives the ids of the sections in the sections table.
+    __section_id
+        Gives the id of a section, adding it if necessary.
+    """
+    def __init__(self, db_filename, spec_hash):
+        """
+        Opens the database, creating its tables if necessary.
+
+        Parameters
+        ----------
+        db_filename : str
+            Filename of the SQLite database.
+        spec_hash : str
+            Hash of the input specification (see file_fingerprint).
+        """
+        self.__connection = sqlite3.connect(db_filename)
+        self.__connection.execute('PRAGMA foreign_keys = ON')
+        self.__connection.executescript(_SCHEMA)
+        self.__spec_hash = spec_hash
+        self.__section_ids = self.__read_section_ids()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def is_current(self, out_filename):
+        """
+        Tells whether the stored data of a .out file are up to date, i.e.
+        neither the file nor the input specification has changed since they
+        were stored (so the file does not need to be processed again).
+
+        Parameters
+        ----------
+        out_filename : str
+            Path of the .out file.
+
+        Returns
+        -------
+        bool
+            True if the stored data are up to date, otherwise False.
+        """
+        try:
+            path, size, mtime_ns = stat_key(out_filename)
+        except OSError:
+            return False
+        row = self.__connection.execute(
+            'SELECT size, mtime_ns, spec_hash FROM files WHERE path = ?',
+            (path,)).fetchone()
+        return row == (size, mtime_ns, self.__spec_hash)
+
+    def put(self, sd):
+        """
+        Stores the data of a StructureData instance, replacing any stored
+        data of the same .out file. The file is stored with the stat key
+        taken before it was read (see StructureData.get_stat_key), so if it
+        was changed while it was being read, it is processed again next
+        time. If storing the data fails, none of them are stored.
+
+        Parameters
+        ----------
+        sd : StructureData
+            StructureData instance from an ORCA .out file.
+
+        Raises
+        ------
+        OSError
+            If the stat key of the .out file is not known and the file cannot
+            be accessed.
+        sqlite3.Error
+            If the data cannot be written to the database.
+        """
+        key = sd.get_stat_key()
+        if key is None:
+            key = stat_key(sd.get_out_filename())
+        connection = self.__connection
+        # The data of the file are written within a savepoint, so that they
+        # are either all stored or (e.g. if the disk is full) none of them,
+        # without committing the transaction of the files before.
+        if not connection.in_transaction:
+            connection.execute('BEGIN')
+        connection.execute('SAVEPOINT put')
+        try:
+            self.__put(sd, key)
+        except BaseException:
+            connection.execute('ROLLBACK TO put')
+            # Any sections added by the savepoint were rolled back too.
+            self.__section_ids = self.__read_section_ids()
+            raise
+        finally:
+            connection.execute('RELEASE put')
+
+    def commit(self):
+        """Commits the changes made so far."""
+        self.__connection.commit()
+
+    def close(self):
+        """Commits the changes made so far and closes the database."""
+        self.__connection.commit()
+        self.__connection.close()
+
+    def get_connection(self):
+        """
+        Gives the connection to the database, e.g. to query it.
+
+        Returns
+        -------
+        sqlite3.Connection
+            __connection attribute.
+        """
+        return self.__connection
+
+    def __put(self, sd, key):
+        """Stores the data of a StructureData instance under a stat key."""
+        path, size, mtime_ns = key
+        connection = self.__connection
+        connection.execute(
+            'INSERT INTO files (path, size, mtime_ns, spec_hash, '
+            'input_filename) VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT (path) DO UPDATE SET size = excluded.size, '
+            'mtime_ns = excluded.mtime_ns, spec_hash = excluded.spec_hash, '
+            'input_filename = excluded.input_filename',
+            (path, size, mtime_ns, self.__spec_hash, sd.get_input_filename()))
+        file_id, = connection.execute(
+            'SELECT file_id FROM files WHERE path = ?', (path,)).fetchone()
+        for table in ('atom_values', 'tuple_values', 'file_values'):
+            connection.execute(f'DELETE FROM {table} WHERE file_id = ?',
+                               (file_id,))
+
+        atom_rows = []
+        tuple_rows = []
+        file_rows = []
+        for section_name, data_section in sd.get_data_sections().items():
+            section_id = self.__section_id(section_name)
+            takes_inputs = isinstance(data_section, DataSectionWithInputs)
+            for label, datum in data_section.get_data().items():
+                if type(label) is tuple:
+                    tuple_rows.append((file_id, section_id, ','.join(label),
+                                       _to_float(datum)))
+                elif type(datum) is dict:
+                    atom_rows.extend(
+                        (file_id, section_id, label, quantity,
+                         _to_float(value))
+                        for quantity, value in datum.items())
+                elif takes_inputs:
+                    atom_rows.append((file_id, section_id, label, 'value',
+                                      _to_float(datum)))
+                else:
+                    file_rows.append((file_id, section_id, label,
+                                      _to_float(datum)))
+        connection.executemany(
+            'INSERT OR REPLACE INTO atom_values VALUES (?, ?, ?, ?, ?)',
+            atom_rows)
+        connection.executemany(
+            'INSERT OR REPLACE INTO tuple_values VALUES (?, ?, ?, ?)',
+            tuple_rows)
+        connection.executemany(
+            'INSERT OR REPLACE INTO file_values VALUES (?, ?, ?, ?)',
+            file_rows)
+
+    def __read_section_ids(self):
+        """Gives the ids of the sections in the sections table, by name."""
+        return {
+            name: section_id for section_id, name in
+            self.__connection.execute('SELECT section_id, name FROM sections')
+        }
+
+    def __section_id(self, section_name):
+        """Gives the id of a section, adding it to the table if necessary."""
+        if section_name not in self.__section_ids:
+            self.__section_ids[section_name] = self.__connection.execute(
+                'INSERT INTO sections (name) VALUES (?)',
+                (section_name,)).lastrowid
+        return self.__section_ids[section_name]
+
+
+def _to_float(value):
+    """Gives a value as a float, or None if it is missing or not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Processes the command line arguments shared by the orca_out_to_* scripts.
+
+Each script takes the name of the input JSON file and the name of the output
+file (without its extension), and optionally the number of processes to use
+(--jobs), a directory in which to cache extracted data (--cache-dir), where
+to look for the .out files (--root, --recursive, --include, --exclude,
+--manifest and --archive, see file_discovery), how they are read
+(--read-mode) and where their sidecar indexes are kept (--index-dir).
+Anything not given on the command line is asked for interactively.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import argparse
+import os
+
+from orca_data_extraction.src.out_file_reader import READ_MODES
+
+
+def get_script_args(output_type, add_arguments=None):
+    """
+    Gives the arguments for a script, from the command line or by asking the
+    user.
+
+    Parameters
+    ----------
+    output_type : str
+        Type of output file written by the script (e.g. 'CSV'), used in the
+        help text and prompts.
+    add_arguments : callable or None
+        Function which adds the arguments that only the script takes to the
+        argparse.ArgumentParser it is passed.
+
+    Returns
+    -------
+    argparse.Namespace
+        Namespace with the attributes inputs_name (the input filename),
+        output_name (the name of the output file, without extension), jobs
+        (the number of processes, or None to use one per CPU), cache_dir
+        (the cache directory, or None to not use a cache), roots,
+        recursive, include, exclude, manifest and archives (where to look
+        for the .out files, see file_discovery.discover_out_files),
+        read_mode (how the .out files are read, see out_file_reader) and
+        index_dir (the
+        directory of the sidecar indexes, or None to keep them next to the
+        .out files), as well as any added by add_arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=f'Extracts data from all the ORCA .out files in the '
+                    f'current working directory (or those chosen with '
+                    f'--root, --manifest or --archive) into a {output_type} '
+                    f'file.')
+    parser.add_argument('inputs_name', nargs='?', default='',
+                        help='name of the input JSON file with atom labels')
+    parser.add_argument('output_name', nargs='?', default='',
+                        help=f'name of the {output_type} file (without '
+                             f'extension) which will contain the data')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of processes to use (default: the '
+                             'number of CPUs)')
+    parser.add_argument('--cache-dir', default=None,
+                        help='directory in which to cache the extracted data, '
+                             'so that unchanged .out files are not read again')
+    parser.add_argument('--read-mode', choices=READ_MODES, default='text',
+                        help='how the .out files are read: "mmap" maps each '
+                             'file into memory and decodes only the parts '
+                             'that are parsed, which is faster for large '
+                             'files; "stream" reads each file in chunks and '
+                             'keeps only those parts, for files too large '
+                             'to fit in memory; "tail" reads only as much '
+                             'of the end (and start) of each file as is '
+                             'needed; "indexed" reads only those parts, '
+                             'using an index of each file saved by an '
+                             'earlier run (default: text)')
+    parser.add_argument('--root', action='append', dest='roots',
+                        metavar='DIRECTORY',
+                        help='directory in which to look for .out files; '
+                             'give it once for each directory (default: '
+                             'the current working directory)')
+    parser.add_argument('-r', '--recursive', action='store_true',
+                        help='also look for .out files in the '
+                             'subdirectories of each directory')
+    parser.add_argument('--include', action='append', metavar='PATTERN',
+                        help='shell-style pattern of the files to process, '
+                             'matched against the name of each file, or '
+                             'its path (relative to the directory searched) '
+                             'if the pattern has a "/"; give it once for '
+                             'each pattern (default: *.out and compressed '
+                             '.out files, e.g. *.out.gz)')
+    parser.add_argument('--exclude', action='append', metavar='PATTERN',
+                        help='shell-style pattern of the files and '
+                             'subdirectories to skip, matched as for '
+                             '--include')
+    parser.add_argument('--manifest', default=None,
+                        help='file listing the paths of the .out files to '
+                             'process, one per line, or "-" to read them '
+                             'from stdin; the current working directory is '
+                             'then only searched if --root is given')
+    parser.add_argument('--archive', action='append', dest='archives',
+                        help='tar or zip archive (possibly compressed, e.g. '
+                             '.tar.gz) whose .out files are processed '
+                             'without unpacking it; give it once for each '
+                             'archive; the current working directory is '
+                             'then only searched if --root is given')
+    parser.add_argument('--index-dir', default=None,
+                        help='directory in which to keep the indexes of the '
+                             '.out files for --read-mode indexed (default: '
+                             'next to each .out file)')
+    if add_arguments is not None:
+        add_arguments(parser)
+    args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+    if args.manifest == '-' and not (args.inputs_name and args.output_name):
+        # stdin holds the manifest, so it cannot be used to ask for them.
+        parser.error('the input and output names must be given when the '
+                     'manifest is read from stdin')
+    for filename in [args.manifest] + (args.archives or []):
+        if filename not in (None, '-') and not os.path.isfile(filename):
+            print('No file with name ' + filename + ' found.')
+            quit()
+
+    inputs_name = args.inputs_name
+    if inputs_name:
+        if not os.path.isfile(inputs_name):
+            print('No file with name ' + inputs_name + ' found.')
+            quit()
+    else:
+        if args.manifest is None and args.roots is None and \
+                args.archives is None:
+            print('Script will execute on all .out files in the current '
+                  'working directory.')
+        while True:
+            print('Name of input file with atom labels ("q" to quit): ',
+                  end='')
+            inputs_name = input()
+            if inputs_name == 'q':
+                quit()
+            if not os.path.isfile(inputs_name):
+                print('No file with name ' + inputs_name + ' found.')
+                continue
+            break
+
+    output_name = args.output_name
+    if output_name == '':
+        print(f'Name of the {output_type} file which will contain the data '
+              f'(press ENTER to use the default name, "q" to quit): ', end='')
+        output_name = input()
+        if output_name == 'q':
+            quit()
+        # If the user just hits enter, use default name:
+        if output_name == '':
+            output_name = f'ORCA_data_{inputs_name[:-4]}'
+    args.inputs_name = inputs_name
+    args.output_name = output_name
+    return args
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Provides the SectionIndex class, which locates section headers in a .out file.
+
+Rather than having every DataSection subclass run its own regular expression
+over the entire contents of an ORCA .out file, a SectionIndex scans the
+contents once for every known section header and records the offsets at which
+each header occurs. DataSection subclasses then use these offsets to parse only
+the bounded block of text that contains their data. The index also keeps the
+results of parsing these blocks, so that DataSections for the same file which
+need the same data (e.g. the final geometry) only parse it once.
+
+For a DataSection which is used on its own (i.e. without an index shared with
+other DataSections), the locate_block function instead finds a single block
+directly, searching backwards from the end of the contents for blocks that are
+counted from the last occurrence.
+
+The contents may be either a str or a bytes-like buffer (bytes, or an mmap of
+the .out file, see out_file_reader). For a buffer, the headers are searched
+for as bytes, and only the blocks that are parsed are decoded (see get_text),
+so the file is never decoded as a whole.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import bisect
+import re
+
+# Headers (and trailing markers) of the sections used by the DataSection
+# subclasses. Note that a header which is a prefix of another header (e.g.
+# 'INTERNAL COORDINATES') is recorded wherever the longer one occurs as well.
+SECTION_HEADERS = (
+    'CARTESIAN COORDINATES (A.U.)',
+    'INTERNAL COORDINATES',
+    'INTERNAL COORDINATES (ANGSTROEM)',
+    'ORBITAL ENERGIES',
+    'MULLIKEN POPULATION ANALYSIS',
+    'MULLIKEN ATOMIC CHARGES',
+    'MULLIKEN REDUCED ORBITAL CHARGES',
+    'LOEWDIN ATOMIC CHARGES',
+    'LOEWDIN REDUCED ORBITAL CHARGES',
+    'DIPOLE MOMENT',
+    'Rotational spectrum',
+    'THE POLARIZABILITY TENSOR',
+    'Timings for individual modules:',
+)
+
+
+def encode_like(text, outfile_contents):
+    """
+    Gives text in the same type as outfile_contents, i.e. encoded as bytes if
+    outfile_contents is a bytes-like buffer, so that it can be searched for.
+
+    Parameters
+    ----------
+    text : str
+        Text to be searched for (e.g. a header).
+    outfile_contents : str, bytes or mmap.mmap
+        Contents of the ORCA .out file.
+
+    Returns
+    -------
+    str or bytes
+        text, encoded as UTF-8 if outfile_contents is not a str.
+    """
+    if isinstance(outfile_contents, str):
+        return text
+    return text.encode('utf-8')
+
+
+def get_text(outfile_contents, start, end):
+    """
+    Gives the text between two offsets of outfile_contents as a str; for a
+    bytes-like buffer, only this slice is decoded, and its line endings are
+    translated to '\\n' (as when a file is read in text mode).
+
+    Parameters
+    ----------
+    outfile_contents : str, bytes or mmap.mmap
+        Contents of the ORCA .out file.
+    start : int
+        Offset of the start of the text.
+    end : int
+        Offset of the end of the text.
+
+    Returns
+    -------
+    str
+        The text between start and end.
+    """
+    text = outfile_contents[start:end]
+    if isinstance(text, str):
+        return text
+    text = bytes(text).decode('utf-8', errors='replace')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def locate_block(outfile_contents, start_header, end_header, occurrence=-1):
+    """
+    Gives the (start, end) offsets of one occurrence of a block of text that
+    begins with start_header and ends with the first end_header after it
+    (inclusive), without indexing the whole of outfile_contents.
+
+    Blocks counted from the end (negative occurrence) are found with rfind, so
+    only the text after the desired block start is searched; e.g. the last
+    block in a long geometry optimization is found almost immediately. These
+    only include complete blocks, so if the last block was cut off (e.g. the
+    calculation was stopped while printing it) the one before it is given.
+
+    Parameters
+    ----------
+    outfile_contents : str, bytes or mmap.mmap
+        Contents of the ORCA .out file.
+    start_header : str
+        Header that begins the block.
+    end_header : str
+        Marker that ends the block.
+    occurrence : int
+        Which occurrence of start_header begins the block, indexed as for
+        a list (i.e. 0 is the first, -1 is the last and -2 the second-to-last).
+
+    Returns
+    -------
+    tuple or None
+        Tuple of the start and end offsets of the block, or None if either
+        the header or the trailing marker could not be found.
+    """
+    start_header = encode_like(start_header, outfile_contents)
+    end_header = encode_like(end_header, outfile_contents)
+    if occurrence < 0:
+        # Only blocks which are followed by an end_header are counted, so the
+        # search begins at the last end_header in the contents.
+        start = outfile_contents.rfind(end_header)
+        if start == -1:
+            return None
+        for _ in range(-occurrence):
+            start = outfile_contents.rfind(start_header, 0, start)
+            if start == -1:
+                return None
+    else:
+        start = -1
+        for _ in range(occurrence + 1):
+            start = outfile_contents.find(start_header, start + 1)
+            if start == -1:
+                return None
+    end = outfile_contents.find(end_header, start + len(start_header))
+    if end == -1:
+        return None
+    return start, end + len(end_header)
+
+
+def find_span(starts, ends, start_length, end_length, occurrence=-1):
+    """
+    Gives the (start, end) offsets of one occurrence of a block, from the
+    offsets of its header and trailing marker (as for locate_block).
+
+    Parameters
+    ----------
+    starts : tuple
+        Sorted offsets of the header that begins the block.
+    ends : tuple
+        Sorted offsets of the marker that ends the block.
+    start_length : int
+        Length of the header.
+    end_length : int
+        Length of the trailing marker.
+    occurrence : int
+        Which occurrence of the header begins the block, indexed as for a
+        list (i.e. 0 is the first and -1 is the last). Blocks counted from
+        the end only include complete blocks.
+
+    Returns
+    -------
+    tuple or None
+        Tuple of the start and end offsets of the block, or None if either
+        the header or the trailing marker could not be found.
+    """
+    if occurrence < 0:
+        # As for locate_block, blocks counted from the end only include those
+        # which are followed by a trailing marker.
+        if not ends:
+            return None
+        starts = starts[:bisect.bisect_right(starts, ends[-1] - start_length)]
+    try:
+        start = starts[occurrence]
+    except IndexError:
+        return None
+    i = bisect.bisect_left(ends, start + start_length)
+    if i == len(ends):
+        return None
+    return start, ends[i] + end_length
+
+
+class SectionIndex:
+    """
+    Records the offsets of every occurrence of every known section header.
+
+    Attributes
+    ----------
+    __outfile_contents : str, bytes or mmap.mmap
+        Contents of the ORCA .out file.
+    __offsets : dict
+        Dictionary mapping each header to a list of the (sorted) offsets at
+        which it occurs in __outfile_contents.
+    __parsed : dict
+        Dictionary of the results of parsing blocks of the file, which are
+        shared by all DataSections that use this index.
+
+    Methods
+    -------
+    __scan
+        Finds every occurrence of every header in one pass over the contents.
+    get_offsets
+        Gives the offsets at which a header occurs.
+    find_block
+        Gives the (start, end) offsets of one occurrence of a block of text
+        bounded by a header and a trailing marker.
+    get_block
+        Gives the text of one occurrence of such a block.
+    get_parsed
+        Gives a stored parsing result, parsing it first if necessary.
+    get_all_parsed
+        Gives every stored parsing result.
+    add_parsed
+        Stores parsing results made earlier.
+    __length
+        Gives the length of a header in the contents.
+    """
+    def __init__(self, outfile_contents, headers=SECTION_HEADERS):
+        """
+        Parameters
+        ----------
+        outfile_contents : str, bytes or mmap.mmap
+            Contents of the ORCA .out file.
+        headers : tuple
+            Tuple of strings of the headers that will be indexed.
+        """
+        self.__outfile_contents = outfile_contents
+        self.__offsets = self.__scan(headers)
+        self.__parsed = {}
+
+    def __scan(self, headers):
+        """
+        Finds every occurrence of every header in one pass over the contents.
+
+        Parameters
+        ----------
+        headers : tuple
+            Tuple of strings of the headers that will be indexed.
+
+        Returns
+        -------
+        offsets : dict
+            Dictionary mapping each header to a list of its offsets.
+        """
+        offsets = {header: [] for header in headers}
+        if not headers:
+            return offsets
+        # Longer headers are listed first so that e.g. 'INTERNAL COORDINATES
+        # (ANGSTROEM)' is matched in full rather than just its prefix.
+        ordered_headers = sorted(headers, key=len, reverse=True)
+        prefixes = {
+            header: [h for h in headers if header.startswith(h)]
+            for header in headers
+        }
+        encoded_headers = {
+            encode_like(header, self.__outfile_contents): header
+            for header in headers
+        }
+        anchors = re.compile(encode_like('|', self.__outfile_contents).join(
+            re.escape(encode_like(h, self.__outfile_contents))
+            for h in ordered_headers))
+        for match in anchors.finditer(self.__outfile_contents):
+            for header in prefixes[encoded_headers[match.group()]]:
+                offsets[header].append(match.start())
+        return offsets
+
+    def get_offsets(self, header):
+        """
+        Gives the offsets at which a header occurs.
+
+        Headers which were not indexed originally are searched for (and then
+        indexed) the first time they are requested.
+
+        Parameters
+        ----------
+        header : str
+            The header of interest.
+
+        Returns
+        -------
+        tuple
+            Tuple of the offsets at which the header occurs, in order.
+        """
+        if header not in self.__offsets:
+            self.__offsets[header] = [
+                match.start() for match in re.finditer(
+                    re.escape(encode_like(header, self.__outfile_contents)),
+                    self.__outfile_contents)
+            ]
+        return tuple(self.__offsets[header])
+
+    def find_block(self, start_header, end_header, occurrence=-1):
+        """
+        Gives the (start, end) offsets of one occurrence of a block of text
+        that begins with start_header and ends with the first end_header
+        after it (inclusive).
+
+        Parameters
+        ----------
+        start_header : str
+            Header that begins the block.
+        end_header : str
+            Marker that ends the block.
+        occurrence : int
+            Which occurrence of start_header begins the block, indexed as for
+            a list (i.e. 0 is the first and -1 is the last). Blocks counted
+            from the end only include complete blocks.
+
+        Returns
+        -------
+        tuple or None
+            Tuple of the start and end offsets of the block, or None if either
+            the header or the trailing marker could not be found.
+        """
+        return find_span(self.get_offsets(start_header),
+                         self.get_offsets(end_header),
+                         self.__length(start_header),
+                         self.__length(end_header), occurrence)
+
+    def get_block(self, start_header, end_header, occurrence=-1):
+        """
+        Gives the text of one occurrence of a block of text that begins with
+        start_header and ends with the first end_header after it (inclusive).
+
+        Parameters
+        ----------
+        start_header : str
+            Header that begins the block.
+        end_header : str
+            Marker that ends the block.
+        occurrence : int
+            Which occurrence of start_header begins the block, indexed as for
+            a list (i.e. 0 is the first and -1 is the last).
+
+        Returns
+        -------
+        str or None
+            Text of the block, or None if it could not be found.
+        """
+        span = self.find_block(start_header, end_header, occurrence)
+        if span is None:
+            return None
+        return get_text(self.__outfile_contents, span[0], span[1])
+
+    def __length(self, header):
+        """Gives the length of a header in __outfile_contents."""
+        return len(encode_like(header, self.__outfile_contents))
+
+    def get_parsed(self, key, parse):
+        """
+        Gives the parsing result stored under key; if there is none yet,
+        parse is called and its result stored first.
+
+        Parameters
+        ----------
+        key : tuple
+            Key describing the parsing result (e.g. the parsing method and
+            the block it parses).
+        parse : callable
+            Function with no arguments which gives the parsing result.
+
+        Returns
+        -------
+        The parsing result stored under key.
+        """
+        if key not in self.__parsed:
+            self.__parsed[key] = parse()
+        return self.__parsed[key]
+
+    def get_all_parsed(self):
+        """
+        Gives every stored parsing result (e.g. so that they can be saved,
+        see table_cache).
+
+        Returns
+        -------
+        dict
+            Dictionary mapping the keys to the parsing results.
+        """
+        return self.__parsed.copy()
+
+    def add_parsed(self, parsed):
+        """
+        Stores parsing results made earlier (e.g. loaded from a table_cache),
+        so that the blocks they come from are not parsed again.
+
+        Parameters
+        ----------
+        parsed : dict
+            Dictionary mapping keys to parsing results (see get_parsed).
+        """
+        self.__parsed.update(parsed)
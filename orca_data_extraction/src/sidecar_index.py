@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Provides read_indexed_blocks, which reads the desired blocks of an ORCA .out
+file using a sidecar index of the file saved by an earlier run.
+
+The sidecar index is a small JSON file which records the byte offsets of
+every occurrence of every section header in the .out file (see
+SectionIndex), with the size and modification time of the file so that it is
+only used while the file is unchanged. It is kept next to the .out file
+(e.g. "PPh3_opt.out.sections.json"), or in a separate directory. Since it
+covers every header rather than just the sections asked for by one input
+file, a later run with different inputs can go straight to the byte ranges of
+the blocks it needs, without searching the file again.
+
+The first time a file is read, its headers are found by scanning a memory map
+of it (as for the 'mmap' read mode) and the sidecar index is written.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import hashlib
+import json
+import mmap
+import os
+
+from orca_data_extraction.src.file_utils import write_atomic
+from orca_data_extraction.src.section_index import (
+    SECTION_HEADERS, SectionIndex, find_span, get_text)
+
+# Ending added to the name of a .out file for its sidecar index.
+SIDECAR_SUFFIX = '.sections.json'
+# Version of the format of the sidecar index; indexes with another version
+# are not used.
+SIDECAR_VERSION = 1
+
+
+def get_sidecar_path(out_filename, index_dir=None):
+    """
+    Gives the path of the sidecar index of a .out file.
+
+    Parameters
+    ----------
+    out_filename : str
+        Filename of the .out file.
+    index_dir : str or None
+        Directory in which the sidecar indexes are kept, named by a hash of
+        the absolute path of each .out file; by default, each is kept next
+        to its .out file.
+
+    Returns
+    -------
+    str
+        Path of the sidecar index.
+    """
+    if index_dir is None:
+        return out_filename + SIDECAR_SUFFIX
+    path_hash = hashlib.sha256(
+        os.path.abspath(out_filename).encode('utf-8')).hexdigest()
+    return os.path.join(index_dir, path_hash[:2], path_hash + SIDECAR_SUFFIX)
+
+
+def read_indexed_blocks(out_filename, blocks, index_dir=None):
+    """
+    Reads the desired blocks of a .out file, using its sidecar index (which
+    is written first if there is no up-to-date one).
+
+    Parameters
+    ----------
+    out_filename : str
+        Filename of the .out file.
+    blocks : iterable
+        Tuples of the header, trailing marker and occurrence of each block
+        (see DataSection.get_blocks).
+    index_dir : str or None
+        Directory in which the sidecar indexes are kept (see
+        get_sidecar_path).
+
+    Returns
+    -------
+    str
+        Text of the blocks which were found, in the order in which they occur
+        in the file, with overlapping blocks merged and a line break between
+        the others (as for block_stream.read_blocks).
+    """
+    blocks = tuple(dict.fromkeys(blocks))
+    headers = tuple(dict.fromkeys(
+        SECTION_HEADERS +
+        tuple(header for block in blocks for header in block[:2])))
+    sidecar_path = get_sidecar_path(out_filename, index_dir)
+    with open(out_filename, 'rb') as file_object:
+        stat = os.fstat(file_object.fileno())
+        fingerprint = [stat.st_size, stat.st_mtime_ns]
+        offsets = _load_sidecar(sidecar_path, fingerprint)
+        if offsets is None or any(header not in offsets for header in headers):
+            offsets = _scan_offsets(file_object, headers)
+            _save_sidecar(sidecar_path, fingerprint, offsets)
+
+        spans = []
+        for start_header, end_header, occurrence in blocks:
+            span = find_span(offsets[start_header], offsets[end_header],
+                             len(start_header.encode('utf-8')),
+                             len(end_header.encode('utf-8')), occurrence)
+            if span is not None:
+                spans.append(span)
+        # Overlapping blocks are read once.
+        merged_spans = []
+        for start, end in sorted(spans):
+            if merged_spans and start < merged_spans[-1][1]:
+                merged_spans[-1][1] = max(merged_spans[-1][1], end)
+            else:
+                merged_spans.append([start, end])
+        pieces = []
+        for start, end in merged_spans:
+            file_object.seek(start)
+            data = file_object.read(end - start)
+            pieces.append(get_text(data, 0, len(data)))
+    return '\n'.join(pieces)
+
+
+def _scan_offsets(file_object, headers):
+    """
+    Finds the byte offsets of every occurrence of each header in a file.
+
+    Parameters
+    ----------
+    file_object : file object
+        The .out file, opened in binary mode.
+    headers : tuple
+        Tuple of strings of the headers.
+
+    Returns
+    -------
+    dict
+        Dictionary mapping each header to a list of its offsets.
+    """
+    if os.fstat(file_object.fileno()).st_size == 0:
+        return {header: [] for header in headers}
+    with mmap.mmap(file_object.fileno(), 0,
+                   access=mmap.ACCESS_READ) as buffer:
+        section_index = SectionIndex(buffer, headers)
+        return {header: list(section_index.get_offsets(header))
+                for header in headers}
+
+
+def _load_sidecar(sidecar_path, fingerprint):
+    """
+    Gives the offsets from a sidecar index, or None if there is no sidecar
+    index for the file as it is now (or it cannot be read).
+    """
+    try:
+        with open(sidecar_path) as json_file:
+            sidecar = json.load(json_file)
+        if sidecar['version'] != SIDECAR_VERSION or \
+                sidecar['fingerprint'] != fingerprint:
+            return None
+        return sidecar['offsets']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_sidecar(sidecar_path, fingerprint, offsets):
+    """
+    Writes a sidecar index atomically (see file_utils.write_atomic), so that
+    an index is never read while it is partly written; if it cannot be
+    written (e.g. the directory is read-only), nothing is done.
+    """
+    write_atomic(sidecar_path, json.dumps(
+        {'version': SIDECAR_VERSION, 'fingerprint': fingerprint,
+         'offsets': offsets}).encode('utf-8'))
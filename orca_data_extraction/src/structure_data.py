@@ -32,6 +32,9 @@ class StructureData:
     __data_sections : dict
         Dictionary mapping strings of the names of DataSection subclasses to
         instances those subclasses associated with this .out file.
+    __stat_key : tuple or None
+        Stat key of the .out file (see file_fingerprint.stat_key), taken
+        before it was read, or None if it is not known.
 
     Methods
     -------
@@ -43,6 +46,8 @@ class StructureData:
         Gives the filename of the .out file from which the data was taken.
     get_input_filename
         Gives the filename of the input .txt file.
+    get_stat_key
+        Gives the stat key of the .out file, taken before it was read.
     get_std_error_msg
         Gives the standard error message used by this class.
     get_data_sections
@@ -61,7 +66,8 @@ class StructureData:
     # Class attributes.
     __std_error_msg = 'ERROR: not found'
 
-    def __init__(self, out_filename, input_filename, data_sections):
+    def __init__(self, out_filename, input_filename, data_sections,
+                 stat_key=None):
         """
         Parameters
         ----------
@@ -71,10 +77,14 @@ class StructureData:
                 String of filename of .txt file that contains lists of desired
                 atom labels for each type of data that will be pulled from the
                 .out file.
+            stat_key : tuple or None
+                Stat key of the .out file, taken before it was read (see
+                file_fingerprint.stat_key).
         """
         self.__out_filename = out_filename
         self.__input_filename = input_filename
         self.__data_sections = data_sections
+        self.__stat_key = stat_key
 
     def get_out_filename(self):
         """
@@ -98,6 +108,19 @@ class StructureData:
         """
         return self.__input_filename
 
+    def get_stat_key(self):
+        """
+        Gives the stat key of the .out file, taken before it was read, so
+        that the data can be stored with the fingerprint of the contents they
+        were taken from (see results_store).
+
+        Returns
+        -------
+        tuple or None
+            __stat_key attribute.
+        """
+        return self.__stat_key
+
     # Results/data:
     @staticmethod
     def get_std_error_msg():
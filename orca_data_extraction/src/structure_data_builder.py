@@ -14,6 +14,8 @@ __maintainer__ = "Peter Waddell"
 __email__ = "pmwaddell9@gmail.com"
 __status__ = "Prototype"
 
+from contextlib import nullcontext
+
 from orca_data_extraction.src.structure_data import StructureData
 from orca_data_extraction.src.input_reader_json import InputReaderJSON
 from orca_data_extraction.src.initial_geom import InitialGeometry
@@ -25,8 +27,17 @@ from orca_data_extraction.src.loewdin_charge_sums import LoewdinChargeSums
 from orca_data_extraction.src.homo_lumo_energies import HOMOLUMOEnergies
 from orca_data_extraction.src.bond_lengths import BondLengths
 from orca_data_extraction.src.bond_angles import BondAngles
+from orca_data_extraction.src.dihedral_angles import DihedralAngles
+from orca_data_extraction.src.geometric_parameters import GeometricParameters
 from orca_data_extraction.src.polarizability import Polarizability
 from orca_data_extraction.src.dipole_moments import DipoleMoments
+from orca_data_extraction.src.data_section_with_inputs import DataSectionWithInputs
+from orca_data_extraction.src.section_index import SectionIndex
+from orca_data_extraction.src.extraction_cache import ExtractionCache
+from orca_data_extraction.src.table_cache import TableCache
+from orca_data_extraction.src.file_fingerprint import (
+    input_spec_hash, stat_key)
+from orca_data_extraction.src.out_file_reader import open_out_file, READ_MODES
 
 
 class StructureDataBuilder:
@@ -41,20 +52,126 @@ class StructureDataBuilder:
     __input_reader : InputReaderJSON
         Instance of InputReader used to retrieve the inputs for the
         StructureData objects this instance builds.
+    __cache : ExtractionCache or None
+        Cache of StructureData instances built previously, or None if no
+        cache is used.
+    __table_cache : TableCache or None
+        Cache of the tables parsed previously from .out files, whatever the
+        inputs, or None if no cache is used.
+    __read_mode : str
+        How .out files are read (see out_file_reader).
+    __index_dir : str or None
+        Directory of the sidecar indexes for the 'indexed' read mode, or None
+        to keep each next to its .out file.
+    __sections : tuple or None
+        Names of the sections which are built, or None to build all those
+        the inputs ask for.
+    __lazy : bool
+        Whether the data of each section are only found when first needed.
+    _section_switches : dict
+        Class attribute: the key of the input file which switches off each
+        section that does not take inputs.
+    _table_sections : tuple
+        Class attribute: the DataSection subclasses whose tables are all
+        parsed and stored when a table cache is used.
+
+    Methods
+    -------
+    build
+        Creates and returns an instance of StructureData for a .out file.
+    __get_blocks
+        Gives the blocks of text searched by the DataSections.
+    __parse_tables
+        Parses every table of a .out file, for the table cache.
+    get_section_specs
+        Gives the DataSection subclasses that are instantiated for each .out
+        file.
+    __all_section_specs
+        Gives every section that can be built.
     """
-    def __init__(self, input_filename):
+    # Class attributes.
+    _section_switches = {
+        'Polarizability': 'polarizability',
+        'Dipole Moments': 'dipole_moments',
+        'HOMO LUMO Energies': 'homo_lumo_energies',
+    }
+    _table_sections = (InitialGeometry, FinalGeometry, MullikenCharges,
+                       LoewdinCharges, DipoleMoments, Polarizability,
+                       HOMOLUMOEnergies)
+
+    def __init__(self, input_filename, cache_dir=None, read_mode='text',
+                 sections=None, lazy=False, index_dir=None):
         """
         Parameters
         ----------
         input_filename : str
             String of filename of .txt file that contains lists of desired atom
             labels for each type of data that will be pulled from the .out file.
+        cache_dir : str or None
+            Path of a directory in which built StructureData instances are
+            stored and reused for .out files (and inputs) which have not
+            changed, along with every table parsed from the .out files, which
+            are reused for any inputs (see table_cache); by default, no cache
+            is used.
+        read_mode : str
+            How .out files are read: 'text' to read each file into a str,
+            'mmap' to memory-map it and only decode the blocks that are
+            parsed, 'stream' to read it in chunks and only keep these
+            blocks, 'tail' to only read as much of the end (and start)
+            of the file as is needed to find them, or 'indexed' to only read
+            them using a sidecar index of the file saved by an earlier run
+            (see out_file_reader).
+        sections : iterable or None
+            Names of the sections to build (e.g. only those whose columns
+            are wanted), out of those the inputs ask for; by default, all of
+            them are built.
+        lazy : bool
+            If True, the data of each section are only found when they are
+            first needed (e.g. by get_data), so sections which are never used
+            cost nothing. This needs the contents of the .out file to be kept,
+            so it cannot be used with the 'mmap' read mode.
+        index_dir : str or None
+            Directory in which the sidecar indexes are kept for the
+            'indexed' read mode; by default, each is kept next to its .out
+            file.
+
+        Raises
+        ------
+        ValueError
+            If read_mode is not one of out_file_reader.READ_MODES, if it is
+            'mmap' and lazy is True, or if sections has an unknown name.
         """
+        if read_mode not in READ_MODES:
+            raise ValueError(f'Unknown read mode {read_mode!r}; expected one '
+                             f'of {", ".join(READ_MODES)}.')
+        if lazy and read_mode == 'mmap':
+            raise ValueError('Lazy sections cannot be used with the mmap read '
+                             'mode, since the file is closed after building.')
+        self.__read_mode = read_mode
+        self.__index_dir = index_dir
+        self.__lazy = lazy
         self.__input_filename = input_filename
         # TODO: another opportunity for Dependency Injection???? or not????
         self.__input_reader = InputReaderJSON(input_filename)
+        self.__sections = None
+        if sections is not None:
+            self.__sections = tuple(sections)
+            section_names = [name for name, _, _ in self.__all_section_specs()]
+            unknown = [name for name in self.__sections
+                       if name not in section_names]
+            if unknown:
+                raise ValueError(f'Unknown sections: {", ".join(unknown)}.')
+        self.__cache = None
+        self.__table_cache = None
+        if cache_dir is not None:
+            self.__table_cache = TableCache(cache_dir)
+            input_spec = self.__input_reader.get_input_spec()
+            if self.__sections is not None:
+                input_spec['sections'] = sorted(self.__sections)
+            self.__cache = ExtractionCache(cache_dir,
+                                           input_spec_hash(input_spec))
 
-    def build(self, out_filename):
+    def build(self, out_filename, out_data=None):
         """
         Creates and returns an instance of StructureData based on the passed
         .out filename and the input filename attribute.
@@ -63,13 +180,38 @@ class StructureDataBuilder:
         ----------
         out_filename : str
             String of filename of desired .out file.
+        out_data : bytes or None
+            Contents of the .out file (possibly compressed), e.g. of a member
+            of an archive (see file_discovery.iter_archive_members), which
+            are read instead of the file out_filename. These are not cached,
+            since there is no file whose changes can be checked.
 
         Returns
         -------
         StructureData
             Instance of StructureData based on the passed .out filename and the
             input filename attribute.
+
+        Raises
+        ------
+        OSError
+            If the .out file cannot be read (e.g. FileNotFoundError).
         """
+        use_cache = out_data is None
+        # The file is identified before it is read, so that if it is changed
+        # while it is being read, the data are not taken to be those of its
+        # new contents.
+        try:
+            key = stat_key(out_filename)
+        except OSError:
+            key = None
+        if self.__cache is not None and use_cache:
+            sd = self.__cache.get(out_filename)
+            if sd is not None:
+                # The stored instance may be from a copy of this .out file, or
+                # from an input file with a different name but the same inputs.
+                return StructureData(out_filename, self.__input_filename,
+                                     sd.get_data_sections(), key)
 
         def create_data_sections():
             """
@@ -83,89 +225,181 @@ class StructureDataBuilder:
                 DataSection subclasses related to the Schrödinger .out file,
                 which are instantiated based on inputs from __input_reader.
             """
-            def add_inputs_section(name, data_section, inputs=()):
-                """
-                Adds a key-value pair to data_sections: the key is the name of
-                the particular DataSection subclass to be added, and the value
-                is the instance of this subclass.
-
-                Parameters
-                ----------
-                name : str
-                    Name of the DataSection subclass.
-                data_section : DataSection
-                    Instance of the DataSection subclass.
-                inputs : tuple
-                    Tuple of inputs from __input_reader for the particular
-                    DataSection subclass.
-                """
-                if inputs:
+            data_sections = {}
+            # The final geometry is parsed once per file and shared by every
+            # section that needs it, rather than once per bond or angle; it is
+            # only created if one of them is built.
+            final_geom = None
+            for name, data_section, inputs in self.get_section_specs():
+                if final_geom is None and (
+                        data_section is FinalGeometry or
+                        issubclass(data_section, GeometricParameters)):
+                    final_geom = FinalGeometry(
+                        out_filename=out_filename,
+                        outfile_contents=outfile_contents,
+                        inputs=self.__input_reader.get_final_geom_inputs(),
+                        section_index=section_index)
+                if data_section is FinalGeometry:
+                    data_sections[name] = final_geom
+                elif inputs is None:
                     data_sections[name] = \
                         data_section(out_filename=out_filename,
                                      outfile_contents=outfile_contents,
-                                     inputs=inputs)
-
-            data_sections = {}
-            # TODO: possibly abstract this to make this class plug-n-play
-            add_inputs_section('Initial Geometry', InitialGeometry,
-                               self.__input_reader.get_initial_geom_inputs())
-            add_inputs_section('Final Geometry', FinalGeometry,
-                               self.__input_reader.get_final_geom_inputs())
-            add_inputs_section('Bond Lengths', BondLengths,
-                               self.__input_reader.get_bond_length_inputs())
-            add_inputs_section('Bond Angles', BondAngles,
-                               self.__input_reader.get_bond_angle_inputs())
-            data_sections['Polarizability'] = \
-                Polarizability(out_filename=out_filename,
-                               outfile_contents=outfile_contents)
-            data_sections['Dipole Moments'] = \
-                DipoleMoments(out_filename=out_filename,
-                              outfile_contents=outfile_contents)
-            data_sections['HOMO LUMO Energies'] = \
-                HOMOLUMOEnergies(out_filename=out_filename,
-                                 outfile_contents=outfile_contents)
-            add_inputs_section('Mulliken Charges', MullikenCharges,
-                               self.__input_reader.get_mulliken_charge_inputs())
-            add_inputs_section('Mulliken Charge Sums', MullikenChargeSums,
-                               self.__input_reader.
-                               get_mulliken_charge_sum_inputs())
-            add_inputs_section('Loewdin Charges', LoewdinCharges,
-                               self.__input_reader.get_loewdin_charge_inputs())
-            add_inputs_section('Loewdin Charge Sums', LoewdinChargeSums,
-                               self.__input_reader.
-                               get_loewdin_charge_sum_inputs())
+                                     section_index=section_index)
+                else:
+                    kwargs = {}
+                    if issubclass(data_section, GeometricParameters):
+                        kwargs['final_geom'] = final_geom
+                    data_sections[name] = \
+                        data_section(out_filename=out_filename,
+                                     outfile_contents=outfile_contents,
+                                     inputs=inputs,
+                                     section_index=section_index,
+                                     **kwargs)
             return data_sections
 
-        outfile_contents = self.__read_file(out_filename)
-        return StructureData(
-            out_filename, self.__input_filename, create_data_sections())
+        tables = None
+        if self.__table_cache is not None and use_cache:
+            tables = self.__table_cache.get(out_filename)
+        # The file is hashed as it is read, if it is read whole, so that it
+        # need not be read again to store the instance in the cache.
+        content_hashes = {}
+        if tables is None:
+            out_file = open_out_file(
+                out_filename, self.__read_mode, self.__get_blocks(use_cache),
+                self.__index_dir, out_data,
+                content_hashes if self.__cache is not None and use_cache
+                else None)
+        else:
+            # Every table in the file was parsed before, so the DataSections
+            # take their data from these and the file is not read at all.
+            out_file = nullcontext('')
+        with out_file as outfile_contents:
+            # The .out file is scanned once for all section headers, and this
+            # index is shared by every DataSection for the file.
+            section_index = SectionIndex(outfile_contents)
+            if tables is not None:
+                section_index.add_parsed(tables)
+            data_sections = create_data_sections()
+            if not self.__lazy:
+                for data_section in data_sections.values():
+                    data_section.load()
+            if tables is None and self.__table_cache is not None and \
+                    use_cache:
+                self.__table_cache.put(
+                    out_filename,
+                    self.__parse_tables(out_filename, outfile_contents,
+                                        section_index))
+            sd = StructureData(
+                out_filename, self.__input_filename, data_sections, key)
+        if self.__cache is not None and use_cache:
+            self.__cache.put(out_filename, sd,
+                             content_hashes.get(out_filename))
+        return sd
 
-    # TODO: probs will make this another class I guess for reading files I mean
-    @staticmethod
-    def __read_file(f):
+    def __get_blocks(self, use_cache=True):
         """
-        Converts a text file to a single string using .read().
+        Gives the blocks of text searched by the DataSections for each .out
+        file (see DataSection.get_blocks).
 
         Parameters
         ----------
-        f : str
-            Filename of the desired file to read.
+        use_cache : bool
+            Whether the tables of the file are stored in the table cache (if
+            any), in which case the blocks of every table are included.
 
         Returns
         -------
-        contents : str
-            String containing the full text of the file.
+        list
+            List of tuples of the header, trailing marker and occurrence of
+            each block.
+        """
+        blocks = []
+        for _, data_section, _ in self.get_section_specs():
+            blocks.extend(data_section.get_blocks())
+        if self.__table_cache is not None and use_cache:
+            for data_section in self._table_sections:
+                blocks.extend(data_section.get_blocks())
+        return blocks
 
-        Raises
-        ------
-        FileNotFoundError
-            If f is not the filename of a file in the current directory.
+    def __parse_tables(self, out_filename, outfile_contents, section_index):
         """
-        try:
-            with open(f) as file_object:
-                contents = file_object.read()
-        except FileNotFoundError:
-            print(f"File {f} not found")
-        else:
-            file_object.close()
-            return contents
+        Parses every table of a .out file (see _table_sections), including
+        those which are not needed for the inputs, so that all of them can be
+        stored in the table cache.
+
+        Parameters
+        ----------
+        out_filename : str
+            String of filename of the .out file.
+        outfile_contents : str, bytes or mmap.mmap
+            Contents of the .out file (see out_file_reader).
+        section_index : SectionIndex
+            Index of the section headers in outfile_contents, which holds the
+            parsed tables.
+
+        Returns
+        -------
+        dict
+            Dictionary mapping the keys of the parsed tables to the tables
+            (see SectionIndex.get_all_parsed).
+        """
+        for data_section in self._table_sections:
+            if issubclass(data_section, DataSectionWithInputs):
+                data_section(out_filename, outfile_contents, (),
+                             section_index).parse()
+            else:
+                data_section(out_filename, outfile_contents,
+                             section_index).parse()
+        return section_index.get_all_parsed()
+
+    def get_section_specs(self):
+        """
+        Gives the DataSection subclasses that are instantiated for each .out
+        file, in order, without reading any .out file (e.g. so that the
+        columns of a table of the data can be laid out in advance).
+
+        Returns
+        -------
+        list
+            List of tuples of the section name, the DataSection subclass and
+            its inputs from __input_reader (None for subclasses that do not
+            take inputs). Sections whose inputs are empty, which are switched
+            off in the input file, or which are not in __sections are skipped.
+        """
+        section_switches = self.__input_reader.get_section_switches()
+        return [(name, data_section, inputs)
+                for name, data_section, inputs in self.__all_section_specs()
+                if (inputs is None or inputs) and
+                section_switches.get(self._section_switches.get(name), True)
+                and (self.__sections is None or name in self.__sections)]
+
+    def __all_section_specs(self):
+        """
+        Gives every section that can be built, with its DataSection subclass
+        and its inputs (see get_section_specs).
+        """
+        input_reader = self.__input_reader
+        return [
+            ('Initial Geometry', InitialGeometry,
+             input_reader.get_initial_geom_inputs()),
+            ('Final Geometry', FinalGeometry,
+             input_reader.get_final_geom_inputs()),
+            ('Bond Lengths', BondLengths,
+             input_reader.get_bond_length_inputs()),
+            ('Bond Angles', BondAngles,
+             input_reader.get_bond_angle_inputs()),
+            ('Dihedral Angles', DihedralAngles,
+             input_reader.get_dihedral_angle_inputs()),
+            ('Polarizability', Polarizability, None),
+            ('Dipole Moments', DipoleMoments, None),
+            ('HOMO LUMO Energies', HOMOLUMOEnergies, None),
+            ('Mulliken Charges', MullikenCharges,
+             input_reader.get_mulliken_charge_inputs()),
+            ('Mulliken Charge Sums', MullikenChargeSums,
+             input_reader.get_mulliken_charge_sum_inputs()),
+            ('Loewdin Charges', LoewdinCharges,
+             input_reader.get_loewdin_charge_inputs()),
+            ('Loewdin Charge Sums', LoewdinChargeSums,
+             input_reader.get_loewdin_charge_sum_inputs()),
+        ]
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Provides the TableCache class, which stores the parsed tables of ORCA .out
+files on disk.
+
+Unlike ExtractionCache, which stores the data extracted for one input
+specification, this stores every table parsed from a .out file in full (the
+coordinates of every atom in the initial and final geometries, every
+Mulliken and Loewdin charge, and the dipole moments, polarizability and HOMO
+and LUMO energies), independently of the inputs. Any input specification can
+then be answered by looking up the desired atoms in the stored tables, so
+adding an atom to an input file does not mean parsing every .out file again.
+
+Entries are keyed by the stat key of the .out file (see file_fingerprint) and
+TABLE_VERSION, and are stored as uncompressed NumPy .npz files, which hold
+the coordinates as float64 arrays (so they are restored exactly) and the
+other values as arrays of strings. They are written atomically (see
+file_utils.write_atomic) like those of ExtractionCache, and are removed by
+prune_cache along with them.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import json
+import os
+
+import numpy as np
+
+from orca_data_extraction.src.file_fingerprint import hash_parts, stat_key
+from orca_data_extraction.src.file_utils import write_atomic
+from orca_data_extraction.src.geometry import make_table
+
+# Version of the parsed tables; this must be changed whenever a change to the
+# code would change how the tables are parsed (or the keys they are stored
+# under, see DataSection._get_parsed), so that old entries are not used.
+TABLE_VERSION = '0.1.1'
+
+
+class TableCache:
+    """
+    Stores the parsed tables of .out files on disk (in the 'tables'
+    subdirectory of a cache directory), keyed by the fingerprint of the .out
+    file alone.
+
+    The tables are the parsing results of a SectionIndex (see
+    SectionIndex.get_all_parsed): either coordinate tables (see
+    geometry.make_table), dicts of strings (e.g. charges by atom label), or
+    None for sections which were not found in the file, so that these are
+    reported again when the entry is used.
+
+    Attributes
+    ----------
+    __cache_dir : str
+        Path of the cache directory.
+
+    Methods
+    -------
+    get
+        Gives the stored tables of a .out file, if any.
+    put
+        Stores the tables of a .out file.
+    __path
+        Gives the path of the entry for a .out file.
+    """
+    def __init__(self, cache_dir):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Path of the cache directory, which is created if necessary.
+        """
+        self.__cache_dir = cache_dir
+
+    def get(self, out_filename):
+        """
+        Gives the stored tables of a .out file, without reading the file.
+
+        Parameters
+        ----------
+        out_filename : str
+            Path of the .out file.
+
+        Returns
+        -------
+        dict or None
+            Dictionary mapping the keys of the parsing results to the tables
+            (see SectionIndex.add_parsed), or None if there is no entry for
+            the file as it is now.
+        """
+        try:
+            path = self.__path(out_filename)
+            with np.load(path, allow_pickle=False) as entry:
+                manifest = json.loads(str(entry['manifest']))
+                tables = {}
+                for i, (key, kind) in enumerate(manifest):
+                    arrays = [entry[f'{i}_{name}'] for name in _FIELDS[kind]]
+                    tables[tuple(key)] = _unpack(kind, arrays)
+            # Entries are pruned by the time they were last used.
+            os.utime(path)
+        except Exception:
+            return None
+        return tables
+
+    def put(self, out_filename, tables):
+        """
+        Stores the tables of a .out file. Nothing is stored if any of them
+        is not a coordinate table, a dict of strings or None, since every
+        table is needed for the entry to be used.
+
+        Parameters
+        ----------
+        out_filename : str
+            Path of the .out file.
+        tables : dict
+            Dictionary mapping the keys of the parsing results to the tables
+            (see SectionIndex.get_all_parsed).
+        """
+        manifest = []
+        arrays = {}
+        for i, (key, table) in enumerate(tables.items()):
+            packed = _pack(table)
+            if packed is None:
+                return
+            kind, table_arrays = packed
+            manifest.append((key, kind))
+            for name, array in zip(_FIELDS[kind], table_arrays):
+                arrays[f'{i}_{name}'] = array
+        arrays['manifest'] = np.array(json.dumps(manifest))
+        try:
+            path = self.__path(out_filename)
+        except OSError:
+            return
+        contents = io.BytesIO()
+        np.savez(contents, **arrays)
+        write_atomic(path, contents.getvalue())
+
+    def __path(self, out_filename):
+        """
+        Gives the path of the entry for a .out file, from its stat key (so
+        this raises OSError if the file cannot be accessed).
+        """
+        key_hash = hash_parts(*stat_key(out_filename), TABLE_VERSION)
+        return os.path.join(self.__cache_dir, 'tables', key_hash[:2],
+                            key_hash + '.npz')
+
+
+# Names of the arrays that hold each kind of table.
+_FIELDS = {
+    'coordinates': ('labels', 'nuclear_charges', 'fragments', 'masses',
+                    'coordinates'),
+    'strings': ('labels', 'values', 'missing'),
+    'missing': (),
+}
+
+
+def _pack(table):
+    """
+    Gives the kind of a table and the arrays that hold it (see _FIELDS), or
+    None if it is neither a coordinate table, a dict of strings nor None.
+    """
+    if table is None:
+        return 'missing', ()
+    if isinstance(table, tuple) and len(table) == 6:
+        atom_labels, _, nuclear_charges, fragments, masses, coordinates = table
+        return 'coordinates', (np.array(atom_labels, dtype=str),
+                               nuclear_charges, fragments, masses, coordinates)
+    if isinstance(table, dict) and all(
+            isinstance(label, str) and (value is None or isinstance(value, str))
+            for label, value in table.items()):
+        return 'strings', (
+            np.array(list(table), dtype=str),
+            np.array(['' if value is None else value
+                      for value in table.values()], dtype=str),
+            np.array([value is None for value in table.values()], dtype=bool))
+    return None
+
+
+def _unpack(kind, arrays):
+    """Gives the table held by the arrays of the given kind (see _pack)."""
+    if kind == 'coordinates':
+        labels, nuclear_charges, fragments, masses, coordinates = arrays
+        return make_table(labels.tolist(), nuclear_charges, fragments, masses,
+                          coordinates)
+    if kind == 'missing':
+        return None
+    labels, values, missing = arrays
+    return {label: None if is_missing else value
+            for label, value, is_missing in zip(labels.tolist(),
+                                                values.tolist(),
+                                                missing.tolist())}
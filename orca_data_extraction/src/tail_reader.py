@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Provides read_head_and_tail, which reads only the end (and if necessary the
+start) of an ORCA .out file, as far as is needed to find the desired blocks.
+
+Most of the data are taken from the last occurrence of a block (e.g. the
+final geometry or the last table of charges), which for a long geometry
+optimization is near the end of the file. The file is therefore read
+backwards from the end in chunks, each twice the size of the one before it,
+until the last occurrences of all these blocks have been found. These blocks
+are in every .out file that completed; if one of them is not in the file at
+all, the whole file ends up being read, as in the 'text' read mode.
+
+Blocks that are counted from the start of the file (e.g. the initial
+geometry) are then found by reading forwards from the start, in chunks that
+are given to a BlockStream (see block_stream), which only holds the text of
+these blocks in memory. This stops as soon as they have all been found, or
+at the start of the tail, so no part of the file is read twice. It also stops
+at the start of the second cycle of the calculation (the second occurrence
+of the header of a block counted from the end, e.g. the second step of a
+geometry optimization): a block which is printed in every cycle has its
+first occurrence in the first one, so a block which has not been found by
+then is taken to be printed only at the end of the calculation (as the
+dipole moment and polarizability are), and its first occurrence in the tail
+is used, or it is taken to be missing. Without this, a single block missing
+from the file (e.g. the polarizability, which is not calculated in most
+optimizations) would mean that the whole file is read.
+
+The blocks from the start of the file and the tail are then joined, so that
+they can be indexed and parsed in the same way as the whole file (see
+SectionIndex).
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+
+from orca_data_extraction.src.block_stream import BlockStream, join_blocks
+from orca_data_extraction.src.section_index import (
+    SECTION_HEADERS, locate_block, get_text)
+
+# Number of bytes in the first chunk read from the end of the file, and in
+# each chunk read from the start.
+CHUNK_SIZE = 1 << 20
+
+
+def read_head_and_tail(file_object, blocks, chunk_size=CHUNK_SIZE):
+    """
+    Reads as much of the end and the start of a .out file as is needed to
+    find the desired blocks.
+
+    Parameters
+    ----------
+    file_object : file object
+        The .out file, opened in binary mode.
+    blocks : iterable
+        Tuples of the header, trailing marker and occurrence of each block
+        (see DataSection.get_blocks).
+    chunk_size : int
+        Number of bytes in the first chunk read from the end of the file,
+        and in each chunk read from the start.
+
+    Returns
+    -------
+    str
+        Text of the blocks from the start of the file, followed by the tail.
+    """
+    blocks = tuple(dict.fromkeys(blocks))
+    last_blocks = [block for block in blocks if block[2] < 0]
+    tail, tail_start = _read_tail(file_object, last_blocks, chunk_size)
+    tail = get_text(tail, 0, len(tail))
+
+    # The part of the file before the tail is only read until the blocks
+    # counted from the start have been found, or (see _is_past_first_cycle)
+    # until the start of the second cycle, after which the first occurrence
+    # of a block is taken to be the one in the tail, if any.
+    repeated_headers = tuple(dict.fromkeys(block[0] for block in last_blocks))
+    stream = BlockStream((block for block in blocks if block[2] >= 0),
+                         SECTION_HEADERS + repeated_headers)
+    file_object.seek(0)
+    position = 0
+    carry = b''
+    while not stream.is_done() and position < tail_start and \
+            not _is_past_first_cycle(stream, repeated_headers):
+        data = file_object.read(min(chunk_size, tail_start - position))
+        if not data:
+            break
+        position += len(data)
+        data = carry + data
+        # Only whole lines are decoded and searched, so that no header (or
+        # character) is split; the tail begins at the start of a line.
+        cut = data.rfind(b'\n') + 1 if position < tail_start else len(data)
+        data, carry = data[:cut], data[cut:]
+        stream.feed(get_text(data, 0, len(data)))
+
+    if stream.is_done() or position < tail_start:
+        # The tail is not next to the text given to the stream, so it is
+        # placed after the blocks that were found (with a line break).
+        tail_offset = stream.get_offset() + 1
+    else:
+        # A block which begins before the tail may end within it.
+        tail_offset = stream.get_offset()
+        stream.feed(tail)
+    return join_blocks(sorted(stream.get_found_blocks() +
+                              [(tail_offset, tail_offset + len(tail), tail)]))
+
+
+def _is_past_first_cycle(stream, repeated_headers):
+    """
+    Gives whether the text given to a BlockStream reaches past the start of
+    the second cycle of the calculation (e.g. the second step of a geometry
+    optimization), i.e. the second occurrence of the header of any block
+    counted from the end, and no desired block is still open.
+
+    Parameters
+    ----------
+    stream : BlockStream
+        Stream of the part of the file before the tail.
+    repeated_headers : tuple
+        Headers of the blocks counted from the end of the file.
+
+    Returns
+    -------
+    bool
+        True if the rest of the part before the tail need not be read.
+    """
+    return not stream.has_open_blocks() and any(
+        stream.get_header_count(header) >= 2 for header in repeated_headers)
+
+
+def _read_tail(file_object, blocks, chunk_size):
+    """
+    Reads the file backwards from the end until every block is found.
+
+    Parameters
+    ----------
+    file_object : file object
+        The .out file, opened in binary mode; it must be seekable.
+    blocks : list
+        Tuples of the header, trailing marker and occurrence of each block,
+        which are all counted from the end of the file.
+    chunk_size : int
+        Number of bytes in the first chunk read.
+
+    Returns
+    -------
+    tuple
+        Tuple of the bytes of the tail of the file, which begins at the start
+        of a line, and the offset of its start.
+    """
+    tail = b''
+    # The size is found by seeking, so that file objects without a file
+    # descriptor (e.g. the contents of a member of an archive) can be read.
+    tail_start = file_object.seek(0, os.SEEK_END)
+    size_to_read = chunk_size
+    while tail_start > 0:
+        # The tail is only searched from its first line break, so that no
+        # header is cut off.
+        cut = tail.find(b'\n') + 1
+        if cut == 0:
+            cut = len(tail)
+        if all(locate_block(tail[cut:], *block) is not None
+               for block in blocks):
+            return tail[cut:], tail_start + cut
+        read_from = max(tail_start - size_to_read, 0)
+        file_object.seek(read_from)
+        tail = file_object.read(tail_start - read_from) + tail
+        tail_start = read_from
+        size_to_read *= 2
+    return tail, tail_start
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Provides the XLSXWriter class, which writes StructureData instances to an
+Excel .xlsx workbook one row at a time.
+
+The workbook is written with xlsxwriter in its constant memory mode, in which
+each row is written out as soon as the next one is started, so the memory used
+does not grow with the number of files. As for the CSV file (see csv_writer),
+the columns are laid out in advance from the input specification, so each row
+can be written as soon as its .out file has been processed.
+
+The layout of each sheet is that of the .xls file written by
+orca_out_to_excel.create_excel_from_sds: the .out filename in the first
+column, the section names in the first row, the labels of the data in the
+second row, and one row per .out file after that; the values are written as
+numbers where possible. Unlike .xls sheets, which are limited to 256 columns
+and 65,536 rows, an .xlsx sheet can hold 16,384 columns and 1,048,576 rows;
+if there are still too many columns, they are split across several sheets.
+Each section can also be written on a sheet of its own (or on several, if it
+has too many columns for one).
+
+This needs the optional dependency xlsxwriter, which is only imported when an
+XLSXWriter is created.
+"""
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+from orca_data_extraction.src.csv_writer import (
+    get_column_values, get_data_columns)
+
+# Maximum numbers of columns and rows in an .xlsx sheet.
+MAX_COLUMNS = 16384
+MAX_ROWS = 1048576
+# Maximum length of the name of a sheet.
+MAX_SHEET_NAME_LENGTH = 31
+# Number of header rows above the data.
+HEADER_ROWS = 2
+
+
+class XLSXWriter:
+    """
+    Writes StructureData instances to an .xlsx workbook, one row (of each
+    sheet) per instance.
+
+    Attributes
+    ----------
+    __workbook : xlsxwriter.Workbook
+        The workbook, in constant memory mode.
+    __columns : list
+        List of the data columns (see csv_writer.get_data_columns).
+    __sheets : list
+        List of tuples of each worksheet and the indices (in __columns) of
+        the data columns it holds.
+    __row : int
+        Index of the next row to be written.
+
+    Methods
+    -------
+    write
+        Writes the data from a StructureData instance as the next row.
+    close
+        Closes the workbook, which writes the file.
+    get_row_count
+        Gives the number of rows written so far.
+    __add_sheets
+        Adds as many worksheets as are needed for some of the data columns.
+    __add_sheet
+        Adds a worksheet and writes its header rows.
+    """
+    def __init__(self, filename, section_specs, split_sections=False):
+        """
+        Creates the workbook, lays out the columns of each sheet and writes
+        the header rows.
+
+        Parameters
+        ----------
+        filename : str
+            Filename of the .xlsx file to write.
+        section_specs : list
+            List of tuples of the section name, the DataSection subclass and
+            its inputs, as given by StructureDataBuilder.get_section_specs.
+        split_sections : bool
+            If True, each section is written on a sheet of its own (named
+            after the section, and numbered if it needs several sheets),
+            rather than all of them on one sheet.
+
+        Raises
+        ------
+        ImportError
+            If xlsxwriter is not installed.
+        """
+        # xlsxwriter is only needed for this writer.
+        import xlsxwriter
+
+        self.__workbook = xlsxwriter.Workbook(filename,
+                                              {'constant_memory': True})
+        self.__columns = get_data_columns(section_specs)
+        self.__sheets = []
+        self.__row = HEADER_ROWS
+        if split_sections:
+            groups = {}
+            for i, (_, section_name, _, _) in enumerate(self.__columns):
+                groups.setdefault(section_name, []).append(i)
+            for section_name, indices in groups.items():
+                self.__add_sheets(section_name, indices, numbered=False)
+        else:
+            self.__add_sheets('Sheet', list(range(len(self.__columns))),
+                              numbered=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def write(self, sd):
+        """
+        Writes the data from a StructureData instance as the next row of each
+        sheet. Values are written as numbers if they are numbers, and cells
+        for values which were not found are left empty.
+
+        Parameters
+        ----------
+        sd : StructureData
+            StructureData instance from an ORCA .out file.
+
+        Raises
+        ------
+        ValueError
+            If the sheets are already full.
+        """
+        if self.__row >= MAX_ROWS:
+            raise ValueError(f'An .xlsx sheet cannot hold more than '
+                             f'{MAX_ROWS - HEADER_ROWS} .out files.')
+        values = [_to_number(value)
+                  for value in get_column_values(sd, self.__columns)]
+        for worksheet, indices in self.__sheets:
+            worksheet.write_row(self.__row, 0,
+                                [sd.get_out_filename()] +
+                                [values[i] for i in indices])
+        self.__row += 1
+
+    def close(self):
+        """Closes the workbook, which finishes writing the file."""
+        self.__workbook.close()
+
+    def get_row_count(self):
+        """
+        Gives the number of rows written so far.
+
+        Returns
+        -------
+        int
+            Number of rows of data (not including the header rows).
+        """
+        return self.__row - HEADER_ROWS
+
+    def __add_sheets(self, sheet_name, indices, numbered):
+        """
+        Adds as many worksheets as are needed for some of the data columns,
+        splitting them across several sheets if there are too many for one.
+
+        Parameters
+        ----------
+        sheet_name : str
+            Name of the worksheets, to which the number of each is added
+            (e.g. 'Sheet 2') if numbered is True or there are several.
+        indices : list
+            Indices (in __columns) of the data columns.
+        numbered : bool
+            Whether the number is added to the name of a single worksheet.
+        """
+        # The first column of each sheet holds the .out filenames.
+        sheet_size = MAX_COLUMNS - 1
+        starts = range(0, max(len(indices), 1), sheet_size)
+        for sheet_number, start in enumerate(starts, start=1):
+            if numbered or len(starts) > 1:
+                suffix = f' {sheet_number}'
+                name = sheet_name[:MAX_SHEET_NAME_LENGTH - len(suffix)] + \
+                    suffix
+            else:
+                name = sheet_name[:MAX_SHEET_NAME_LENGTH]
+            self.__add_sheet(name, indices[start:start + sheet_size])
+
+    def __add_sheet(self, sheet_name, indices):
+        """
+        Adds a worksheet for some of the data columns and writes its header
+        rows: the name of each section above its first column, and the label
+        of the data in each column.
+
+        Parameters
+        ----------
+        sheet_name : str
+            Name of the worksheet.
+        indices : list
+            Indices (in __columns) of the data columns of the worksheet.
+        """
+        worksheet = self.__workbook.add_worksheet(sheet_name)
+        section_row = [None]
+        label_row = [None]
+        previous_section = None
+        for i in indices:
+            _, section_name, data_label, datum_label = self.__columns[i]
+            section_row.append(
+                section_name if section_name != previous_section else None)
+            previous_section = section_name
+            label_row.append(f'{data_label}' if datum_label is None
+                             else f'{data_label} {datum_label}')
+        # In constant memory mode, the rows must be written in order.
+        worksheet.write_row(0, 0, section_row)
+        worksheet.write_row(1, 0, label_row)
+        self.__sheets.append((worksheet, indices))
+
+
+def _to_number(value):
+    """
+    Gives a value as a float if it is a number, otherwise unchanged (e.g. None
+    for values which were not found, which are written as empty cells).
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+
+from orca_data_extraction.src.arrow_writer import ArrowWriter
+from orca_data_extraction.src.csv_writer import (
+    get_csv_columns, get_data_columns)
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestArrowWriter(unittest.TestCase):
+    """Tests for writing typed Parquet files and Arrow IPC streams"""
+
+    def setUp(self):
+        builder = StructureDataBuilder('PPh3_test_input.json')
+        self.section_specs = builder.get_section_specs()
+        self.sd = builder.build('PPh3_opt.out')
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_columns(self):
+        """
+        Tests that the data columns are those of the CSV file, and locate the
+        data of each.
+        """
+        columns = get_data_columns(self.section_specs)
+        self.assertEqual([column for column, _, _, _ in columns],
+                         get_csv_columns(self.section_specs)[2:])
+        self.assertIn(('bond_lengths.(0_p,1_c)', 'Bond Lengths',
+                       ('0 P', '1 C'), None), columns)
+        self.assertIn(('final_geometry.0_p.x', 'Final Geometry', '0 P', 'x'),
+                      columns)
+        with self.assertRaises(ValueError):
+            ArrowWriter(os.path.join(self.directory, 'x'), self.section_specs,
+                        file_format='feather')
+        print('Arrow columns test complete.\n')
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'),
+                         'pyarrow is not installed')
+    def test_write(self):
+        """
+        Tests that the values are written as numbers in row groups of the
+        given size, in both formats.
+        """
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet as pq
+
+        parquet_filename = os.path.join(self.directory, 'data.parquet')
+        with ArrowWriter(parquet_filename, self.section_specs,
+                         row_group_size=2) as writer:
+            for _ in range(5):
+                writer.write(self.sd)
+        parquet_file = pq.ParquetFile(parquet_filename)
+        self.assertEqual(parquet_file.metadata.num_rows, 5)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        table = parquet_file.read()
+        self.assertEqual(table.column('bond_lengths.(0_p,1_c)').to_pylist(),
+                         [1.85902] * 5)
+        self.assertEqual(table.schema.field('final_geometry.0_p.x').type,
+                         pa.float64())
+
+        arrow_filename = os.path.join(self.directory, 'data.arrows')
+        with ArrowWriter(arrow_filename, self.section_specs, 'arrow',
+                         float_type='float32') as writer:
+            writer.write(self.sd)
+        with pa.OSFile(arrow_filename) as source:
+            table = pyarrow.ipc.open_stream(source).read_all()
+        self.assertEqual(table.num_rows, 1)
+        self.assertEqual(table.schema.field('final_geometry.0_p.x').type,
+                         pa.float32())
+        self.assertEqual(table.column('orca_out_filename').to_pylist(),
+                         ['PPh3_opt.out'])
+        print('Arrow writer test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
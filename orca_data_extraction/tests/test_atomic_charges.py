@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import unittest
+import math
+from contextlib import redirect_stdout
+
+from orca_data_extraction.src.mulliken_charges import MullikenCharges
+from orca_data_extraction.src.loewdin_charges import LoewdinCharges
+
+
+class TestAtomicCharges(unittest.TestCase):
+    """Tests for the AtomicCharges subclasses"""
+
+    def setUp(self):
+        """
+        Read the geometry optimization of triphenylphosphine (PPh3_opt.out).
+        """
+        with open('PPh3_opt.out') as file_object:
+            self.contents = file_object.read()
+
+    def test_all_atoms(self):
+        """
+        Tests that the charges of every atom are found from a single table.
+        """
+        all_labels = tuple(
+            f'{i} {"P" if i == 0 else "C"}' for i in range(34))
+        mulliken_charges = MullikenCharges('PPh3_opt.out', self.contents,
+                                           all_labels)
+        self.assertEqual(len(mulliken_charges.get_data()), 34)
+        self.assertTrue(
+            math.isclose(float(mulliken_charges.get_datum('0 P')), 0.303926,
+                         rel_tol=0.0001)
+        )
+        self.assertTrue(
+            math.isclose(float(mulliken_charges.get_datum('32 C')), 0.013397,
+                         rel_tol=0.0001)
+        )
+        # '3 C' is actually '3 H', so it should not be found.
+        self.assertEqual(mulliken_charges.get_datum('3 C'), None)
+        print('All atoms charge test complete.\n')
+
+    def test_two_letter_element(self):
+        """
+        Tests that atoms of elements with two-letter symbols, which ORCA
+        prints directly followed by the colon, are found.
+        """
+        contents = (
+            'LOEWDIN ATOMIC CHARGES\n'
+            '----------------------\n'
+            '   0 Cl:   -0.201234\n'
+            '   1 C :    0.101234\n'
+            'Sum of atomic charges:   -0.1000000\n\n'
+            'LOEWDIN REDUCED ORBITAL CHARGES\n'
+        )
+        loewdin_charges = LoewdinCharges('test.out', contents,
+                                         ('0 Cl', '1 C'))
+        self.assertEqual(loewdin_charges.get_datum('0 Cl'), '-0.201234')
+        self.assertEqual(loewdin_charges.get_datum('1 C'), '0.101234')
+        print('Two-letter element charge test complete.\n')
+
+    def test_missing_atoms_reported(self):
+        """
+        Tests that the atoms which are not found are reported together, with
+        the verb agreeing with their number.
+        """
+        for labels, expected in ((('0 P', '3 C'), '3 C was not found'),
+                                 (('3 C', '5 C', '0 P'),
+                                  '3 C, 5 C were not found')):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                MullikenCharges('PPh3_opt.out', self.contents,
+                                labels).load()
+            self.assertIn(f'Error: {expected} in PPh3_opt.out',
+                          output.getvalue())
+        print('Missing atoms charge test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
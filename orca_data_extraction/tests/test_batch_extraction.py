@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import unittest
+
+from orca_data_extraction.src.batch_extraction import build_structure_data
+
+
+class TestBatchExtraction(unittest.TestCase):
+    """Tests for building StructureData instances in parallel"""
+
+    def test_parallel_order_and_errors(self):
+        """
+        Tests that results from a process pool come back in the order of the
+        filenames, match a serial build, and that an error for one file is
+        captured without stopping the others.
+        """
+        out_filenames = ['PPh3_opt.out', 'missing.out', 'PPh3_opt.out']
+        serial = list(build_structure_data('PPh3_test_input.json',
+                                           out_filenames, jobs=1))
+        parallel = list(build_structure_data('PPh3_test_input.json',
+                                             out_filenames, jobs=2))
+        self.assertEqual([result[0] for result in parallel], out_filenames)
+        self.assertEqual(parallel[1][1], None)
+        self.assertTrue(parallel[1][2])
+        for (_, serial_sd, _), (_, parallel_sd, error) in zip(serial, parallel):
+            if serial_sd is None:
+                continue
+            self.assertEqual(error, None)
+            self.assertEqual(
+                serial_sd.get_data_section_data('Bond Angles'),
+                parallel_sd.get_data_section_data('Bond Angles'))
+            self.assertEqual(
+                parallel_sd.get_data_section_datum('Bond Lengths',
+                                                   ('1 C', '0 P')),
+                '1.85902')
+        print('Batch extraction test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
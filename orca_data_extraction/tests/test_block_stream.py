@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import unittest
+
+from orca_data_extraction.src.block_stream import read_blocks
+from orca_data_extraction.src.final_geom import FinalGeometry
+from orca_data_extraction.src.initial_geom import InitialGeometry
+from orca_data_extraction.src.section_index import SectionIndex
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestBlockStream(unittest.TestCase):
+    """Tests for reading only the desired blocks of a .out file"""
+
+    def test_read_blocks(self):
+        """
+        Tests that the first and last blocks are kept, whatever the size of
+        the chunks the file is read in.
+        """
+        blocks = InitialGeometry.get_blocks() + FinalGeometry.get_blocks()
+        with open('PPh3_opt.out') as file_object:
+            contents = file_object.read()
+        index = SectionIndex(contents)
+        for chunk_size in (10, 4096):
+            with open('PPh3_opt.out') as file_object:
+                stream_index = SectionIndex(
+                    read_blocks(file_object, blocks, chunk_size=chunk_size))
+            for start_header, end_header, occurrence in blocks:
+                self.assertEqual(
+                    stream_index.get_block(start_header, end_header,
+                                           occurrence),
+                    index.get_block(start_header, end_header, occurrence))
+            self.assertEqual(len(stream_index.get_offsets(
+                'CARTESIAN COORDINATES (A.U.)')), 2)
+        print('Block stream test complete.\n')
+
+    def test_stream_build(self):
+        """
+        Tests that StructureData built by streaming the file has the same
+        data as that built from the file read as text.
+        """
+        text_sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        stream_sd = StructureDataBuilder(
+            'PPh3_test_input.json', read_mode='stream').build('PPh3_opt.out')
+        for section_name, data_section in text_sd.get_data_sections().items():
+            self.assertEqual(stream_sd.get_data_section_data(section_name),
+                             data_section.get_data())
+        print('Block stream build test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
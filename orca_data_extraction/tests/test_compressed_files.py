@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import bz2
+import gzip
+import importlib.util
+import io
+import lzma
+import os
+import shutil
+import tempfile
+import unittest
+
+from orca_data_extraction.src.compressed_files import detect_compression
+from orca_data_extraction.src.out_file_reader import READ_MODES
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestCompressedFiles(unittest.TestCase):
+    """Tests for reading compressed .out files"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        with open('PPh3_opt.out', 'rb') as out_file:
+            self.contents = out_file.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_detect_compression(self):
+        """Tests that each type of compression is detected from its data."""
+        for compress, compression in ((gzip.compress, 'gzip'),
+                                      (lzma.compress, 'xz'),
+                                      (bz2.compress, 'bz2')):
+            self.assertEqual(
+                detect_compression(io.BytesIO(compress(b'ORCA'))),
+                compression)
+        self.assertIsNone(detect_compression(io.BytesIO(self.contents)))
+        self.assertIsNone(detect_compression(io.BytesIO(b'')))
+        print('Compression detection test complete.\n')
+
+    def test_build(self):
+        """
+        Tests that StructureData built from a compressed .out file has the
+        same data as that built from the uncompressed file, in every read
+        mode, whatever the extension of the file.
+        """
+        compressed_files = [('PPh3_opt.out.gz', gzip.compress),
+                            ('PPh3_opt.out.xz', lzma.compress),
+                            # The compression is detected from the data.
+                            ('PPh3_opt.out', bz2.compress)]
+        if importlib.util.find_spec('zstandard'):
+            import zstandard
+            compressed_files.append(
+                ('PPh3_opt.out.zst', zstandard.ZstdCompressor().compress))
+        sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        for filename, compress in compressed_files:
+            path = os.path.join(self.directory, filename)
+            with open(path, 'wb') as compressed_file:
+                compressed_file.write(compress(self.contents))
+            for read_mode in READ_MODES:
+                compressed_sd = StructureDataBuilder(
+                    'PPh3_test_input.json', read_mode=read_mode,
+                    index_dir=self.directory).build(path)
+                for section_name, data_section in \
+                        sd.get_data_sections().items():
+                    self.assertEqual(
+                        compressed_sd.get_data_section_data(section_name),
+                        data_section.get_data())
+        print('Compressed file build test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
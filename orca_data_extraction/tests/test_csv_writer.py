@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import csv
+import io
+import unittest
+
+from orca_data_extraction.src.csv_writer import (
+    CSVWriter, get_csv_columns, flatten_record)
+from orca_data_extraction.src.orca_out_to_json import make_json_record
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestCSVWriter(unittest.TestCase):
+    """Tests for the streaming CSV writer"""
+
+    def setUp(self):
+        """
+        Create a StructureData instance from PPh3_opt.out and the columns
+        laid out from the input specification.
+        """
+        builder = StructureDataBuilder('PPh3_test_input.json')
+        self.sd = builder.build('PPh3_opt.out')
+        self.columns = get_csv_columns(builder.get_section_specs())
+
+    def test_columns(self):
+        """
+        Tests that the columns laid out from the inputs are those given by
+        flattening the JSON record of the data.
+        """
+        self.assertEqual(self.columns,
+                         list(flatten_record(make_json_record(self.sd))))
+        self.assertIn('final_geometry.0_p.x', self.columns)
+        self.assertIn('bond_lengths.(0_p,1_c)', self.columns)
+        self.assertIn('dipole_moments.tot', self.columns)
+        print('CSV column test complete.\n')
+
+    def test_write(self):
+        """
+        Tests that each StructureData instance is written as a row.
+        """
+        csv_file = io.StringIO()
+        csv_writer = CSVWriter(csv_file, self.columns)
+        csv_writer.write(self.sd)
+        csv_writer.write(self.sd)
+        rows = list(csv.DictReader(io.StringIO(csv_file.getvalue())))
+        self.assertEqual(csv_writer.get_row_count(), 2)
+        self.assertEqual([row[''] for row in rows], ['0', '1'])
+        self.assertEqual(rows[1]['orca_out_filename'], 'PPh3_opt.out')
+        self.assertEqual(rows[1]['bond_lengths.(0_p,1_c)'], '1.85902')
+        self.assertEqual(rows[1]['final_geometry.1_h.x'], '')
+        print('CSV write test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from orca_data_extraction.src import (
+    extraction_cache, structure_data_builder)
+from orca_data_extraction.src.extraction_cache import (
+    ExtractionCache, prune_cache)
+from orca_data_extraction.src.file_fingerprint import content_hash
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestExtractionCache(unittest.TestCase):
+    """Tests for the on-disk cache of StructureData instances"""
+
+    def setUp(self):
+        """
+        Create a temporary directory with a copy of PPh3_opt.out, and a
+        StructureData instance built from it.
+        """
+        self.temp_dir = tempfile.mkdtemp()
+        self.out_filename = os.path.join(self.temp_dir, 'PPh3_opt.out')
+        shutil.copy('PPh3_opt.out', self.out_filename)
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.sd = StructureDataBuilder('PPh3_test_input.json').build(
+            self.out_filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_and_put(self):
+        """
+        Tests that entries are found by stat key or content hash, and not for
+        changed files or other input specifications.
+        """
+        cache = ExtractionCache(self.cache_dir, 'spec')
+        self.assertEqual(cache.get(self.out_filename), None)
+        cache.put(self.out_filename, self.sd,
+                  content_hash(self.out_filename))
+        cached_sd = ExtractionCache(self.cache_dir, 'spec').get(
+            self.out_filename)
+        self.assertEqual(cached_sd.get_data_section_data('Bond Angles'),
+                         self.sd.get_data_section_data('Bond Angles'))
+        self.assertEqual(
+            ExtractionCache(self.cache_dir, 'other').get(self.out_filename),
+            None)
+        # A touched file is still found by the hash of its contents.
+        os.utime(self.out_filename, (0, 0))
+        self.assertNotEqual(
+            ExtractionCache(self.cache_dir, 'spec').get(self.out_filename),
+            None)
+        with open(self.out_filename, 'a') as file_object:
+            file_object.write('\n')
+        self.assertEqual(
+            ExtractionCache(self.cache_dir, 'spec').get(self.out_filename),
+            None)
+        # Without a content hash, an entry is found by its stat key only.
+        cache.put(self.out_filename, StructureDataBuilder(
+            'PPh3_test_input.json').build(self.out_filename))
+        self.assertNotEqual(cache.get(self.out_filename), None)
+        os.utime(self.out_filename, (0, 0))
+        self.assertEqual(cache.get(self.out_filename), None)
+        print('Extraction cache test complete.\n')
+
+    def test_builder_and_prune(self):
+        """
+        Tests that a builder with a cache gives the same data, and that
+        pruning removes the entries.
+        """
+        builder = StructureDataBuilder('PPh3_test_input.json', self.cache_dir)
+        builder.build(self.out_filename)
+        cached_sd = builder.build(self.out_filename)
+        self.assertEqual(cached_sd.get_out_filename(), self.out_filename)
+        self.assertEqual(
+            cached_sd.get_data_section_datum('Bond Lengths', ('1 C', '0 P')),
+            '1.85902')
+        prune_cache(self.cache_dir, max_size=0)
+        self.assertFalse([filename
+                          for _, _, filenames in os.walk(self.cache_dir)
+                          for filename in filenames
+                          if filename.endswith('.pickle')])
+        print('Extraction cache builder test complete.\n')
+
+    def test_copied_and_renamed_files(self):
+        """
+        Tests that copies of a stored .out file are found by the hash of
+        their contents, without extracting their data again, and are given
+        with their own filenames.
+        """
+        builder = StructureDataBuilder('PPh3_test_input.json', self.cache_dir)
+        builder.build(self.out_filename)
+        copy_filename = os.path.join(self.temp_dir, 'copy.out')
+        shutil.copyfile(self.out_filename, copy_filename)
+        renamed_filename = os.path.join(self.temp_dir, 'renamed.out')
+        os.rename(self.out_filename, renamed_filename)
+        for filename in (copy_filename, renamed_filename):
+            with mock.patch.object(structure_data_builder,
+                                   'open_out_file') as open_out_file:
+                cached_sd = builder.build(filename)
+            open_out_file.assert_not_called()
+            self.assertEqual(cached_sd.get_out_filename(), filename)
+            for section_name, data_section in \
+                    cached_sd.get_data_sections().items():
+                self.assertEqual(data_section.get_out_filename(), filename)
+                self.assertEqual(data_section.get_data(),
+                                 self.sd.get_data_section_data(section_name))
+        print('Extraction cache copied file test complete.\n')
+
+    def test_new_file_read_once(self):
+        """
+        Tests that a new .out file is hashed as it is read to build it, rather
+        than read again, and that a touched file is hashed to find it.
+        """
+        with mock.patch.object(extraction_cache, 'content_hash',
+                               wraps=extraction_cache.content_hash) as hashed:
+            StructureDataBuilder('PPh3_test_input.json',
+                                 self.cache_dir).build(self.out_filename)
+            self.assertEqual(hashed.call_count, 0)
+            os.utime(self.out_filename, (0, 0))
+            sd = StructureDataBuilder(
+                'PPh3_test_input.json', self.cache_dir,
+                read_mode='tail').build(self.out_filename)
+            # The touched file is hashed to find it in the cache.
+            self.assertEqual(hashed.call_count, 1)
+            self.assertEqual(sd.get_data_section_data('Bond Angles'),
+                             self.sd.get_data_section_data('Bond Angles'))
+        print('Extraction cache new file test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
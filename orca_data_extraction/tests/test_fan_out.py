@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from orca_data_extraction.src.export_sinks import (
+    ExportSink, JSONSink, ParquetSink)
+from orca_data_extraction.src.fan_out import FanOut
+from orca_data_extraction.src.orca_out_to_json import create_json_from_sds
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class ListSink(ExportSink):
+    """ExportSink which keeps the instances written to it in a list."""
+
+    def __init__(self, fail=False):
+        super().__init__('list')
+        self.sds = []
+        self.closed = False
+        self.fail = fail
+
+    def write(self, sd):
+        if self.fail:
+            raise OSError('disk full')
+        self.sds.append(sd)
+
+    def close(self):
+        self.closed = True
+
+
+class TestFanOut(unittest.TestCase):
+    """Tests for writing to several outputs at once"""
+
+    def setUp(self):
+        self.sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_fan_out(self):
+        """
+        Tests that every instance is written to every sink in order, and that
+        a sink which fails does not stop the others.
+        """
+        sinks = [ListSink(), ListSink(fail=True), ListSink()]
+        with FanOut(sinks, queue_size=1) as fan_out:
+            fan_out.write(self.sd)
+            fan_out.write(self.sd)
+        self.assertEqual(sinks[0].sds, [self.sd, self.sd])
+        self.assertEqual(sinks[2].sds, [self.sd, self.sd])
+        self.assertTrue(all(sink.closed for sink in sinks))
+        errors = fan_out.get_errors()
+        self.assertEqual(len(errors), 1)
+        self.assertIs(errors[0][0], sinks[1])
+        self.assertIsInstance(errors[0][1], OSError)
+        print('Fan-out test complete.\n')
+
+    def test_json_sink(self):
+        """
+        Tests that the JSON file written one record at a time is the same as
+        that written by create_json_from_sds.
+        """
+        for sds in ([], [self.sd], [self.sd, self.sd]):
+            json_name = os.path.join(self.directory, 'sink')
+            json_sink = JSONSink(json_name)
+            for sd in sds:
+                json_sink.write(sd)
+            json_sink.close()
+            expected_name = os.path.join(self.directory, 'expected')
+            create_json_from_sds(sds, expected_name)
+            with open(f'{json_name}.json') as f, \
+                    open(f'{expected_name}.json') as expected_file:
+                self.assertEqual(f.read(), expected_file.read())
+        print('JSON sink test complete.\n')
+
+    def test_parquet_sink_format(self):
+        """Tests that a Parquet sink is not made for an unknown format."""
+        with self.assertRaises(ValueError):
+            ParquetSink(os.path.join(self.directory, 'sink'), [], 'feather')
+        self.assertFalse(os.listdir(self.directory))
+        print('Parquet sink format test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import gzip
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from orca_data_extraction.src.batch_extraction import build_structure_data
+from orca_data_extraction.src.file_discovery import (
+    iter_archive_members, iter_out_files, read_manifest)
+from orca_data_extraction.src.out_file_reader import READ_MODES
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestFileDiscovery(unittest.TestCase):
+    """Tests for finding the .out files to be processed"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for path in ('b.out', 'a.out', 'notes.txt', 'job1/opt.out',
+                     'job1/freq/freq.out', 'job2/opt.out',
+                     'scratch/tmp.out'):
+            path = os.path.join(self.directory, *path.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w'):
+                pass
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def relative_paths(self, paths):
+        return [os.path.relpath(path, self.directory).replace(os.sep, '/')
+                for path in paths]
+
+    def test_iter_out_files(self):
+        """
+        Tests that the .out files are found in sorted order, in the
+        subdirectories only if asked, and filtered by the patterns.
+        """
+        self.assertEqual(
+            self.relative_paths(iter_out_files([self.directory])),
+            ['a.out', 'b.out'])
+        self.assertEqual(
+            self.relative_paths(iter_out_files([self.directory], True)),
+            ['a.out', 'b.out', 'job1/opt.out', 'job1/freq/freq.out',
+             'job2/opt.out', 'scratch/tmp.out'])
+        self.assertEqual(
+            self.relative_paths(iter_out_files(
+                [self.directory], True, include=['opt.out', 'job1/*/*.out'],
+                exclude=['job2'])),
+            ['job1/opt.out', 'job1/freq/freq.out'])
+        self.assertEqual(
+            self.relative_paths(iter_out_files(
+                [self.directory], True, exclude=['scratch', 'a.*'])),
+            ['b.out', 'job1/opt.out', 'job1/freq/freq.out', 'job2/opt.out'])
+        print('.out file search test complete.\n')
+
+    def test_read_manifest(self):
+        """
+        Tests that the paths in a manifest are given as written, without
+        blank lines and comments.
+        """
+        manifest_filename = os.path.join(self.directory, 'manifest.txt')
+        with open(manifest_filename, 'w') as manifest:
+            manifest.write('# jobs\njob1/opt.out\n\n  job2/opt.out  \n')
+        self.assertEqual(list(read_manifest(manifest_filename)),
+                         ['job1/opt.out', 'job2/opt.out'])
+        print('Manifest test complete.\n')
+
+    def test_archive_members(self):
+        """
+        Tests that the .out files in tar and zip archives are found without
+        unpacking them, and build the same data as the files themselves in
+        every read mode.
+        """
+        with open('PPh3_opt.out', 'rb') as out_file:
+            contents = out_file.read()
+        members = {'job1/opt.out': contents,
+                   'job2/opt.out.gz': gzip.compress(contents),
+                   'job2/notes.txt': b'',
+                   'scratch/tmp.out': b''}
+        tar_filename = os.path.join(self.directory, 'jobs.tar.gz')
+        with tarfile.open(tar_filename, 'w:gz') as archive:
+            for name, data in members.items():
+                path = os.path.join(self.directory, 'member')
+                with open(path, 'wb') as member_file:
+                    member_file.write(data)
+                archive.add(path, './' + name)
+        zip_filename = os.path.join(self.directory, 'jobs.zip')
+        with zipfile.ZipFile(zip_filename, 'w') as archive:
+            for name, data in members.items():
+                archive.writestr(name, data)
+
+        sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        for archive_filename in (tar_filename, zip_filename):
+            out_files = list(iter_archive_members(archive_filename,
+                                                  exclude=['scratch']))
+            self.assertEqual(
+                [name for name, _ in out_files],
+                [os.path.join(archive_filename, 'job1/opt.out'),
+                 os.path.join(archive_filename, 'job2/opt.out.gz')])
+            for read_mode in READ_MODES:
+                for _, member_sd, error in build_structure_data(
+                        'PPh3_test_input.json', out_files, jobs=1,
+                        read_mode=read_mode, index_dir=self.directory):
+                    self.assertIsNone(error)
+                    for section_name, data_section in \
+                            sd.get_data_sections().items():
+                        self.assertEqual(
+                            member_sd.get_data_section_data(section_name),
+                            data_section.get_data())
+        print('Archive test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import unittest
+import math
+import warnings
+from contextlib import redirect_stdout
+
+import numpy as np
+
+from orca_data_extraction.src.geometric_parameters import (
+    calc_distances, calc_angles, calc_dihedrals)
+from orca_data_extraction.src.bond_angles import BondAngles
+from orca_data_extraction.src.dihedral_angles import DihedralAngles
+from orca_data_extraction.src.input_reader_json import InputReaderJSON
+
+
+class TestGeometricParameters(unittest.TestCase):
+    """Tests for the vectorized geometric parameter calculations"""
+
+    def setUp(self):
+        """
+        Create a simple set of coordinates: a chain of four atoms with right
+        angles and a dihedral angle of 90 degrees.
+        """
+        self.coordinates = np.array([[1.0, 0.0, 0.0],
+                                     [0.0, 0.0, 0.0],
+                                     [0.0, 2.0, 0.0],
+                                     [0.0, 2.0, 1.0]])
+
+    def test_calc_functions(self):
+        """
+        Tests distances, angles and signed dihedral angles.
+        """
+        self.assertEqual(
+            calc_distances(self.coordinates, [[0, 1], [1, 2]]).tolist(),
+            [1.0, 2.0])
+        self.assertTrue(np.allclose(
+            calc_angles(self.coordinates, [[0, 1, 2], [2, 1, 0]]), 90))
+        dihedrals = calc_dihedrals(self.coordinates,
+                                   [[0, 1, 2, 3], [3, 2, 1, 0]])
+        self.assertTrue(np.allclose(dihedrals, [-90, -90]))
+        # Mirroring the structure changes the sign of the dihedral angle.
+        mirrored = self.coordinates * [1, 1, -1]
+        self.assertTrue(math.isclose(
+            calc_dihedrals(mirrored, [[0, 1, 2, 3]])[0], 90))
+        self.assertEqual(calc_distances(self.coordinates, []).shape, (0,))
+        print('Geometric parameter calculation test complete.\n')
+
+    def test_degenerate_tuples(self):
+        """
+        Tests that angles and dihedral angles with an atom listed twice, or
+        with three atoms in a line, are NaN without any warning, and are
+        given as None by the sections.
+        """
+        coordinates = np.vstack([self.coordinates, [[0.0, 4.0, 0.0]]])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            angles = calc_angles(coordinates, [[0, 1, 1], [0, 1, 2]])
+            dihedrals = calc_dihedrals(
+                coordinates, [[0, 1, 1, 3], [1, 2, 4, 3], [0, 1, 2, 3]])
+        self.assertTrue(np.isnan(angles[0]))
+        self.assertTrue(math.isclose(angles[1], 90))
+        self.assertTrue(np.isnan(dihedrals[:2]).all())
+        self.assertTrue(math.isclose(dihedrals[2], -90))
+
+        with open('PPh3_opt.out') as file_object:
+            contents = file_object.read()
+        output = io.StringIO()
+        with redirect_stdout(output):
+            bond_angles = BondAngles('PPh3_opt.out', contents,
+                                     (('1 C', '0 P', '0 P'),
+                                      ('2 C', '1 C', '0 P')))
+            data = bond_angles.get_data()
+        self.assertIsNone(data[('1 C', '0 P', '0 P')])
+        self.assertIsNotNone(data[('2 C', '1 C', '0 P')])
+        self.assertIn('bond angle 1 C-0 P-0 P', output.getvalue())
+        print('Degenerate geometric parameter test complete.\n')
+
+    def test_batch_section(self):
+        """
+        Tests that a batch of bond angles matches the expected values and can
+        be found from either end of the angle tuple.
+        """
+        with open('PPh3_opt.out') as file_object:
+            contents = file_object.read()
+        bond_angles = BondAngles('PPh3_opt.out', contents,
+                                 (('0 P', '1 C', '2 C'),
+                                  ('1 C', '2 C', '3 H'),
+                                  ('1 S', '2 S', '3 S')))
+        self.assertTrue(math.isclose(
+            float(bond_angles.get_datum(('2 C', '1 C', '0 P'))), 116.78335,
+            rel_tol=0.0001))
+        self.assertTrue(math.isclose(
+            float(bond_angles.get_datum(('3 H', '2 C', '1 C'))), 119.50915,
+            rel_tol=0.0001))
+        self.assertEqual(bond_angles.get_datum(('1 S', '2 S', '3 S')), None)
+        print('Bond angle batch test complete.\n')
+
+    def test_dihedral_angles(self):
+        """
+        Tests dihedral angles against those in ORCA's internal coordinates,
+        including the optional input key in the JSON input file.
+        """
+        with open('PPh3_opt.out') as file_object:
+            contents = file_object.read()
+        inputs = InputReaderJSON(
+            'PPh3_test_input.json').get_dihedral_angle_inputs()
+        self.assertEqual(inputs[0], ('3 H', '2 C', '1 C', '0 P'))
+        self.assertEqual(InputReaderJSON(
+            'PPh3_test_input_skip.json').get_dihedral_angle_inputs(), ())
+        dihedral_angles = DihedralAngles('PPh3_opt.out', contents, inputs)
+        self.assertTrue(math.isclose(
+            float(dihedral_angles.get_datum(('3 H', '2 C', '1 C', '0 P'))),
+            0.89450, rel_tol=0.001))
+        self.assertTrue(math.isclose(
+            float(dihedral_angles.get_datum(('4 C', '2 C', '1 C', '0 P'))),
+            181.09760 - 360, rel_tol=0.0001))
+        self.assertEqual(
+            dihedral_angles.get_datum(('0 P', '1 C', '2 C', '11 B')), None)
+        print('Dihedral angle test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import unittest
+import math
+from contextlib import redirect_stdout
+
+from orca_data_extraction.src.final_geom import FinalGeometry
+from orca_data_extraction.src.initial_geom import InitialGeometry
+from orca_data_extraction.src.bond_lengths import BondLengths
+from orca_data_extraction.src.section_index import SectionIndex
+
+
+class TestGeometry(unittest.TestCase):
+    """Tests for the Geometry subclasses"""
+
+    def setUp(self):
+        """
+        Create test instances of FinalGeometry and InitialGeometry based on
+        the geometry optimization of triphenylphosphine (PPh3_opt.out).
+        """
+        with open('PPh3_opt.out') as file_object:
+            self.contents = file_object.read()
+        self.test_final = FinalGeometry('PPh3_opt.out', self.contents,
+                                        ('0 P',))
+        self.test_initial = InitialGeometry('PPh3_opt.out', self.contents, ())
+
+    def test_arrays(self):
+        """
+        Tests that the whole coordinate table is parsed into arrays.
+        """
+        coordinates = self.test_final.get_coordinates()
+        self.assertEqual(coordinates.shape, (34, 3))
+        self.assertEqual(len(self.test_final.get_atom_labels()), 34)
+        self.assertEqual(self.test_final.get_atom_row('0 P'), 0)
+        self.assertEqual(self.test_final.get_atom_row('33 H'), 33)
+        self.assertEqual(self.test_final.get_atom_row('1 H'), None)
+        self.assertTrue(math.isclose(coordinates[0, 0], -1.97759,
+                                     rel_tol=0.0001))
+        self.assertTrue(math.isclose(self.test_final.get_masses()[0], 30.974,
+                                     rel_tol=0.0001))
+        self.assertEqual(self.test_final.get_nuclear_charges()[0], 15.0)
+        self.assertEqual(self.test_final.get_fragments()[0], 0.0)
+        # Atoms that were not among the inputs are still parsed.
+        self.assertTrue(math.isclose(
+            self.test_initial.get_coordinates()[0, 1], 2.49748,
+            rel_tol=0.0001))
+        print('Geometry array test complete.\n')
+
+    def test_get_datum(self):
+        """
+        Tests that get_datum keeps giving dicts of strings.
+        """
+        self.assertEqual(self.test_final.get_datum('0 P'),
+                         {'x': '-1.97759', 'y': '2.94534', 'z': '0.09181'})
+        print('Geometry datum test complete.\n')
+
+    def test_shared_parse(self):
+        """
+        Tests that DataSections sharing a SectionIndex parse the final
+        geometry table only once.
+        """
+        with open('PPh3_opt.out') as file_object:
+            contents = file_object.read()
+        section_index = SectionIndex(contents)
+        final_geom = FinalGeometry('PPh3_opt.out', contents, ('0 P',),
+                                   section_index)
+        bond_lengths = BondLengths('PPh3_opt.out', contents, (('0 P', '1 C'),),
+                                   section_index, final_geom)
+        other_final_geom = FinalGeometry('PPh3_opt.out', contents, ('1 C',),
+                                         section_index)
+        self.assertTrue(math.isclose(
+            float(bond_lengths.get_datum(('0 P', '1 C'))), 1.85902,
+            rel_tol=0.0001))
+        # The data are only found when first needed.
+        other_final_geom.load()
+        self.assertIs(final_geom._coordinates,
+                      other_final_geom._coordinates)
+        print('Geometry shared parse test complete.\n')
+
+    def test_missing_atoms_reported(self):
+        """
+        Tests that the atoms which are not found are reported together, with
+        the verb agreeing with their number.
+        """
+        for labels, expected in ((('0 P', '3 C'), '3 C was not found'),
+                                 (('3 C', '5 C', '0 P'),
+                                  '3 C, 5 C were not found')):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                FinalGeometry('PPh3_opt.out', self.contents, labels).load()
+            self.assertIn(f'Error: {expected} in PPh3_opt.out',
+                          output.getvalue())
+        print('Missing atoms geometry test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
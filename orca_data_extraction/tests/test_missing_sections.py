@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import unittest
+
+from orca_data_extraction.src.dipole_moments import DipoleMoments
+from orca_data_extraction.src.homo_lumo_energies import HOMOLUMOEnergies
+from orca_data_extraction.src.polarizability import Polarizability
+
+
+class TestMissingSections(unittest.TestCase):
+    """Tests for sections whose header or trailing marker is missing"""
+
+    def test_found(self):
+        """
+        Tests that the sections are found in PPh3_opt.out, which has dipole
+        moments and orbital energies but no polarizability.
+        """
+        with open('PPh3_opt.out') as file_object:
+            contents = file_object.read()
+        self.assertEqual(
+            DipoleMoments('PPh3_opt.out', contents).get_datum('Tot'),
+            '0.50493')
+        self.assertEqual(
+            HOMOLUMOEnergies('PPh3_opt.out', contents).get_datum('LUMO energy'),
+            '-1.6248')
+        self.assertEqual(
+            Polarizability('PPh3_opt.out', contents).get_datum('alpha'), None)
+        print('Found sections test complete.\n')
+
+    def test_missing_terminator(self):
+        """
+        Tests that many headers without a trailing marker give the standard
+        not-found result (without the regex being run over the text).
+        """
+        contents = ('DIPOLE MOMENT\nTotal Dipole Moment    :\n' +
+                    'THE POLARIZABILITY TENSOR\n' +
+                    'ORBITAL ENERGIES\n') * 20000
+        for data_section in (DipoleMoments, Polarizability,
+                             HOMOLUMOEnergies):
+            self.assertEqual(
+                set(data_section('test.out', contents).get_data().values()),
+                {None})
+        print('Missing terminator test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import json
+import unittest
+
+from orca_data_extraction.src.ndjson_writer import NDJSONWriter
+from orca_data_extraction.src.orca_out_to_json import make_json_record
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class FlushCountingIO(io.StringIO):
+    """StringIO which counts how many times it is flushed."""
+
+    def __init__(self):
+        super().__init__()
+        self.flush_count = 0
+
+    def flush(self):
+        self.flush_count += 1
+        super().flush()
+
+
+class TestNDJSONWriter(unittest.TestCase):
+    """Tests for the newline-delimited JSON writer"""
+
+    def setUp(self):
+        self.sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+
+    def test_write(self):
+        """
+        Tests that each StructureData instance is written as one compact line
+        holding its JSON record, and that the file is flushed as requested.
+        """
+        ndjson_file = FlushCountingIO()
+        ndjson_writer = NDJSONWriter(ndjson_file, flush_interval=0)
+        ndjson_writer.write(self.sd)
+        ndjson_writer.write(self.sd)
+        lines = ndjson_file.getvalue().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertNotIn('": ', lines[0])
+        self.assertEqual(json.loads(lines[1]),
+                         json.loads(json.dumps(make_json_record(self.sd))))
+        self.assertEqual(ndjson_writer.get_record_count(), 2)
+        self.assertEqual(ndjson_file.flush_count, 2)
+
+        ndjson_file = FlushCountingIO()
+        ndjson_writer = NDJSONWriter(ndjson_file, flush_interval=3600)
+        ndjson_writer.write(self.sd)
+        self.assertEqual(ndjson_file.flush_count, 0)
+        print('NDJSON write test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
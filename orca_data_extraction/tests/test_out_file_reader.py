@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import unittest
+
+from orca_data_extraction.src.out_file_reader import open_out_file
+from orca_data_extraction.src.section_index import SectionIndex, get_text
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestOutFileReader(unittest.TestCase):
+    """Tests for the read modes of .out files"""
+
+    def test_mmap_index(self):
+        """
+        Tests that a memory-mapped file is indexed at the same headers, and
+        gives the same blocks, as the file read as text.
+        """
+        with open_out_file('PPh3_opt.out') as contents:
+            text_index = SectionIndex(contents)
+            text_block = text_index.get_block(
+                'CARTESIAN COORDINATES (A.U.)', 'INTERNAL COORDINATES', -1)
+        with open_out_file('PPh3_opt.out', 'mmap') as contents:
+            mmap_index = SectionIndex(contents)
+            self.assertEqual(
+                len(mmap_index.get_offsets('CARTESIAN COORDINATES (A.U.)')),
+                18)
+            self.assertEqual(
+                mmap_index.get_block('CARTESIAN COORDINATES (A.U.)',
+                                     'INTERNAL COORDINATES', -1),
+                text_block)
+        self.assertEqual(get_text(b'a\r\nb\rc', 0, 6), 'a\nb\nc')
+        print('Memory-mapped index test complete.\n')
+
+    def test_mmap_build(self):
+        """
+        Tests that StructureData built from a memory-mapped file has the same
+        data as that built from the file read as text.
+        """
+        text_sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        mmap_sd = StructureDataBuilder('PPh3_test_input.json',
+                                       read_mode='mmap').build('PPh3_opt.out')
+        for section_name, data_section in text_sd.get_data_sections().items():
+            self.assertEqual(mmap_sd.get_data_section_data(section_name),
+                             data_section.get_data())
+        with self.assertRaises(ValueError):
+            StructureDataBuilder('PPh3_test_input.json', read_mode='lines')
+        print('Memory-mapped build test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
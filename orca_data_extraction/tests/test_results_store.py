@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from orca_data_extraction.src.results_store import ResultsStore
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestResultsStore(unittest.TestCase):
+    """Tests for keeping extracted data in an SQLite database"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db_filename = os.path.join(self.directory, 'results.sqlite')
+        self.sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_put_and_query(self):
+        """
+        Tests that the data are stored as typed values in the normalized
+        tables, and that storing a file again replaces its data.
+        """
+        with ResultsStore(self.db_filename, 'spec') as results_store:
+            self.assertFalse(results_store.is_current('PPh3_opt.out'))
+            results_store.put(self.sd)
+            results_store.put(self.sd)
+            self.assertTrue(results_store.is_current('PPh3_opt.out'))
+        with ResultsStore(self.db_filename, 'spec') as results_store:
+            connection = results_store.get_connection()
+            self.assertEqual(
+                connection.execute('SELECT COUNT(*) FROM files').fetchone(),
+                (1,))
+            bond_length = connection.execute(
+                'SELECT tuple_values.value FROM tuple_values '
+                'JOIN sections USING (section_id) '
+                "WHERE sections.name = 'Bond Lengths' "
+                "AND tuple_values.atoms = '0 P,1 C'").fetchall()
+            self.assertEqual(bond_length, [(1.85902,)])
+            x = connection.execute(
+                'SELECT atom_values.value FROM atom_values '
+                'JOIN sections USING (section_id) '
+                "WHERE sections.name = 'Final Geometry' "
+                "AND atom_label = '0 P' AND quantity = 'x'").fetchone()
+            self.assertEqual(
+                x[0], float(self.sd.get_data_section_datum(
+                    'Final Geometry', '0 P')['x']))
+            tot = connection.execute(
+                "SELECT value FROM file_values WHERE label = 'Tot'").fetchone()
+            self.assertEqual(tot, (0.50493,))
+            self.assertEqual(
+                connection.execute(
+                    "SELECT COUNT(*) FROM file_values WHERE label = 'alpha' "
+                    "AND value IS NULL").fetchone(),
+                (1,))
+        with ResultsStore(self.db_filename, 'other spec') as results_store:
+            self.assertFalse(results_store.is_current('PPh3_opt.out'))
+        print('Results store test complete.\n')
+
+    def test_changed_while_read(self):
+        """
+        Tests that a .out file changed while it was being read is stored with
+        its stat key from before it was read, so it is not taken to be up to
+        date.
+        """
+        out_filename = os.path.join(self.directory, 'PPh3_opt.out')
+        shutil.copyfile('PPh3_opt.out', out_filename)
+        sd = StructureDataBuilder('PPh3_test_input.json').build(out_filename)
+        stat = os.stat(out_filename)
+        os.utime(out_filename, ns=(stat.st_atime_ns,
+                                   stat.st_mtime_ns + 10 ** 9))
+        with ResultsStore(self.db_filename, 'spec') as results_store:
+            results_store.put(sd)
+            self.assertFalse(results_store.is_current(out_filename))
+            results_store.put(StructureDataBuilder(
+                'PPh3_test_input.json').build(out_filename))
+            self.assertTrue(results_store.is_current(out_filename))
+        print('Results store changed file test complete.\n')
+
+    def test_failed_put(self):
+        """
+        Tests that if storing the data of a file fails, none of them are
+        stored, and the changes made before it are still committed.
+        """
+        with ResultsStore(self.db_filename, 'spec') as results_store:
+            results_store.put(self.sd)
+            connection = results_store.get_connection()
+            connection.execute(
+                'CREATE TEMP TRIGGER fail BEFORE INSERT ON file_values '
+                "BEGIN SELECT RAISE(ABORT, 'disk full'); END")
+            connection.execute('DELETE FROM files')
+            with self.assertRaises(sqlite3.Error):
+                results_store.put(self.sd)
+            self.assertFalse(results_store.is_current('PPh3_opt.out'))
+        with ResultsStore(self.db_filename, 'spec') as results_store:
+            connection = results_store.get_connection()
+            self.assertEqual(
+                connection.execute(
+                    'SELECT COUNT(*) FROM atom_values').fetchone(), (0,))
+        print('Results store failed put test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import unittest
+from orca_data_extraction.src.section_index import SectionIndex, locate_block
+
+
+class TestSectionIndex(unittest.TestCase):
+    """Tests for the class SectionIndex"""
+
+    def setUp(self):
+        """
+        Create a test instance of SectionIndex based on the geometry
+        optimization of triphenylphosphine (PPh3_opt.out).
+        """
+        with open('PPh3_opt.out') as file_object:
+            self.contents = file_object.read()
+        self.test_index = SectionIndex(self.contents)
+
+    def test_offsets(self):
+        """
+        Tests that every occurrence of a header is found, including headers
+        which are prefixes of other headers.
+        """
+        offsets = self.test_index.get_offsets('CARTESIAN COORDINATES (A.U.)')
+        self.assertEqual(len(offsets), 18)
+        for offset in offsets:
+            self.assertTrue(self.contents.startswith(
+                'CARTESIAN COORDINATES (A.U.)', offset))
+        self.assertEqual(
+            len(self.test_index.get_offsets('INTERNAL COORDINATES')),
+            2 * len(self.test_index.get_offsets(
+                'INTERNAL COORDINATES (ANGSTROEM)'))
+        )
+        # Headers that were not indexed initially are searched for on demand.
+        self.assertEqual(
+            len(self.test_index.get_offsets('CARTESIAN COORDINATES')),
+            len(self.contents.split('CARTESIAN COORDINATES')) - 1
+        )
+        print('Section index offsets test complete.\n')
+
+    def test_get_block(self):
+        """
+        Tests that the first and last blocks are bounded correctly, and that
+        missing blocks give None.
+        """
+        first = self.test_index.get_block(
+            'CARTESIAN COORDINATES (A.U.)', 'INTERNAL COORDINATES', 0)
+        last = self.test_index.get_block(
+            'CARTESIAN COORDINATES (A.U.)', 'INTERNAL COORDINATES', -1)
+        self.assertTrue(first.startswith('CARTESIAN COORDINATES (A.U.)'))
+        self.assertTrue(first.endswith('INTERNAL COORDINATES'))
+        self.assertEqual(first.count('CARTESIAN COORDINATES (A.U.)'), 1)
+        self.assertNotEqual(first, last)
+        self.assertEqual(
+            self.test_index.get_block('THE POLARIZABILITY TENSOR',
+                                      'Timings for individual modules:'),
+            None
+        )
+        print('Section index block test complete.\n')
+
+    def test_locate_block(self):
+        """
+        Tests that locate_block finds the same blocks as the index, counting
+        from either end of the .out file.
+        """
+        for occurrence in (0, 1, -1, -2, -18):
+            self.assertEqual(
+                locate_block(self.contents, 'CARTESIAN COORDINATES (A.U.)',
+                             'INTERNAL COORDINATES (ANGSTROEM)', occurrence),
+                self.test_index.find_block('CARTESIAN COORDINATES (A.U.)',
+                                           'INTERNAL COORDINATES (ANGSTROEM)',
+                                           occurrence)
+            )
+        self.assertEqual(
+            locate_block(self.contents, 'CARTESIAN COORDINATES (A.U.)',
+                         'INTERNAL COORDINATES (ANGSTROEM)', -19),
+            None
+        )
+        print('Locate block test complete.\n')
+
+    def test_incomplete_last_block(self):
+        """
+        Tests that a last block which was cut off is skipped in favour of the
+        one before it.
+        """
+        last_start = self.contents.rfind('CARTESIAN COORDINATES (A.U.)')
+        truncated = self.contents[:last_start + 200]
+        truncated_index = SectionIndex(truncated)
+        expected = self.test_index.find_block(
+            'CARTESIAN COORDINATES (A.U.)', 'INTERNAL COORDINATES', -2)
+        self.assertEqual(
+            truncated_index.find_block('CARTESIAN COORDINATES (A.U.)',
+                                       'INTERNAL COORDINATES', -1),
+            expected
+        )
+        self.assertEqual(
+            locate_block(truncated, 'CARTESIAN COORDINATES (A.U.)',
+                         'INTERNAL COORDINATES', -1),
+            expected
+        )
+        print('Incomplete block test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
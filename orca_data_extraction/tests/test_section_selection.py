@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import json
+import os
+import tempfile
+import unittest
+
+from orca_data_extraction.src.input_reader_json import InputReaderJSON
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestSectionSelection(unittest.TestCase):
+    """Tests for skipping sections and finding their data lazily"""
+
+    def setUp(self):
+        """
+        Create an input file like PPh3_test_input.json, with the sections
+        that do not take inputs switched off.
+        """
+        with open('PPh3_test_input.json') as json_file:
+            inputs = json.load(json_file)
+        inputs.update(polarizability=False, dipole_moments=False,
+                      homo_lumo_energies=False)
+        file_descriptor, self.input_filename = tempfile.mkstemp(
+            suffix='.json')
+        with os.fdopen(file_descriptor, 'w') as json_file:
+            json.dump(inputs, json_file)
+
+    def tearDown(self):
+        os.remove(self.input_filename)
+
+    def test_switches(self):
+        """
+        Tests that sections switched off in the input file are not built, and
+        that the switches are part of the input specification.
+        """
+        sd = StructureDataBuilder(self.input_filename).build('PPh3_opt.out')
+        self.assertNotIn('Polarizability', sd.get_data_sections())
+        self.assertNotIn('HOMO LUMO Energies', sd.get_data_sections())
+        self.assertIn('Mulliken Charges', sd.get_data_sections())
+        self.assertFalse(InputReaderJSON(
+            self.input_filename).get_input_spec()['dipole_moments'])
+        self.assertTrue(InputReaderJSON(
+            'PPh3_test_input.json').get_input_spec()['dipole_moments'])
+        print('Section switch test complete.\n')
+
+    def test_sections_and_lazy(self):
+        """
+        Tests that only the requested sections are built, and that lazy
+        sections give the same data as those found when they are built.
+        """
+        builder = StructureDataBuilder(
+            'PPh3_test_input.json', sections=['Bond Lengths', 'Mulliken Charges'],
+            lazy=True)
+        sd = builder.build('PPh3_opt.out')
+        self.assertEqual(list(sd.get_data_sections()),
+                         ['Bond Lengths', 'Mulliken Charges'])
+        self.assertEqual(
+            sd.get_data_section_datum('Bond Lengths', ('0 P', '1 C')),
+            '1.85902')
+        eager_sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        self.assertEqual(sd.get_data_section_data('Mulliken Charges'),
+                         eager_sd.get_data_section_data('Mulliken Charges'))
+        with self.assertRaises(ValueError):
+            StructureDataBuilder('PPh3_test_input.json', sections=['Bonds'])
+        with self.assertRaises(ValueError):
+            StructureDataBuilder('PPh3_test_input.json', read_mode='mmap',
+                                 lazy=True)
+        print('Section selection test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from orca_data_extraction.src import extraction_cache
+from orca_data_extraction.src.final_geom import FinalGeometry
+from orca_data_extraction.src.initial_geom import InitialGeometry
+from orca_data_extraction.src.mulliken_charges import MullikenCharges
+from orca_data_extraction.src.section_index import SectionIndex
+from orca_data_extraction.src.sidecar_index import (
+    get_sidecar_path, read_indexed_blocks)
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+
+
+class TestSidecarIndex(unittest.TestCase):
+    """Tests for reading blocks of a .out file using a sidecar index"""
+
+    def setUp(self):
+        """Copy PPh3_opt.out into a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.out_filename = os.path.join(self.directory, 'PPh3_opt.out')
+        shutil.copyfile('PPh3_opt.out', self.out_filename)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_read_indexed_blocks(self):
+        """
+        Tests that the blocks are the same as in the whole file, that the
+        sidecar index is written and then used, and that it is not used once
+        the file has changed.
+        """
+        with open('PPh3_opt.out') as file_object:
+            index = SectionIndex(file_object.read())
+        blocks = (FinalGeometry.get_blocks() + MullikenCharges.get_blocks() +
+                  InitialGeometry.get_blocks())
+        sidecar_path = get_sidecar_path(self.out_filename)
+        self.assertFalse(os.path.exists(sidecar_path))
+        for _ in range(2):
+            indexed_index = SectionIndex(
+                read_indexed_blocks(self.out_filename, blocks))
+            for block in blocks:
+                self.assertEqual(indexed_index.get_block(*block),
+                                 index.get_block(*block))
+            self.assertTrue(os.path.exists(sidecar_path))
+
+        # Blocks are read at the offsets in the sidecar index, so changing
+        # these shows that it was used.
+        with open(sidecar_path) as json_file:
+            sidecar = json.load(json_file)
+        sidecar['offsets'] = {header: [] for header in sidecar['offsets']}
+        with open(sidecar_path, 'w') as json_file:
+            json.dump(sidecar, json_file)
+        self.assertEqual(read_indexed_blocks(self.out_filename, blocks), '')
+
+        # Once the file has changed, the sidecar index is made again.
+        with open(self.out_filename, 'a') as file_object:
+            file_object.write('\n')
+        indexed_index = SectionIndex(
+            read_indexed_blocks(self.out_filename, blocks))
+        for block in blocks:
+            self.assertEqual(indexed_index.get_block(*block),
+                             index.get_block(*block))
+        print('Sidecar index test complete.\n')
+
+    def test_indexed_build(self):
+        """
+        Tests that StructureData built using a sidecar index kept in a
+        separate directory has the same data as that built from the file read
+        as text.
+        """
+        index_dir = os.path.join(self.directory, 'indexes')
+        text_sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        builder = StructureDataBuilder('PPh3_test_input.json',
+                                       read_mode='indexed', index_dir=index_dir)
+        for _ in range(2):
+            indexed_sd = builder.build(self.out_filename)
+            for section_name, data_section in \
+                    text_sd.get_data_sections().items():
+                self.assertEqual(
+                    indexed_sd.get_data_section_data(section_name),
+                    data_section.get_data())
+        self.assertTrue(os.path.exists(
+            get_sidecar_path(self.out_filename, index_dir)))
+        self.assertFalse(os.path.exists(get_sidecar_path(self.out_filename)))
+        print('Sidecar index build test complete.\n')
+
+    def test_cached_indexed_build(self):
+        """
+        Tests that a build using a sidecar index with a cache does not read
+        the whole file to hash it, and is then found in the cache.
+        """
+        builder = StructureDataBuilder(
+            'PPh3_test_input.json', os.path.join(self.directory, 'cache'),
+            read_mode='indexed', index_dir=os.path.join(self.directory,
+                                                        'indexes'))
+        with mock.patch.object(extraction_cache, 'content_hash',
+                               wraps=extraction_cache.content_hash) as hashed:
+            indexed_sd = builder.build(self.out_filename)
+            cached_sd = builder.build(self.out_filename)
+        hashed.assert_not_called()
+        for section_name, data_section in \
+                indexed_sd.get_data_sections().items():
+            self.assertEqual(cached_sd.get_data_section_data(section_name),
+                             data_section.get_data())
+        print('Sidecar index cache test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
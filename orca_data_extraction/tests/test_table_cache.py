@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import numpy as np
+
+from orca_data_extraction.src import extraction_cache
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+from orca_data_extraction.src.table_cache import TableCache
+
+
+class TestTableCache(unittest.TestCase):
+    """Tests for reusing the parsed tables of .out files for new inputs"""
+
+    def setUp(self):
+        """
+        Copy PPh3_opt.out into a temporary directory, and write an input file
+        with one more atom for the Mulliken charges than PPh3_test_input.json.
+        """
+        self.directory = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.directory, 'cache')
+        self.out_filename = os.path.join(self.directory, 'PPh3_opt.out')
+        shutil.copyfile('PPh3_opt.out', self.out_filename)
+        with open('PPh3_test_input.json') as json_file:
+            inputs = json.load(json_file)
+        inputs['mulliken_charge_atom_labels'].append('20 H')
+        self.input_filename = os.path.join(self.directory, 'input.json')
+        with open(self.input_filename, 'w') as json_file:
+            json.dump(inputs, json_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_new_inputs(self):
+        """
+        Tests that a build with new inputs takes its data from the stored
+        tables, without reading or hashing the .out file, and gives the same data as a
+        build without a cache.
+        """
+        StructureDataBuilder('PPh3_test_input.json',
+                             cache_dir=self.cache_dir).build(self.out_filename)
+        # The contents are replaced, but the size and modification time are
+        # kept, so the stored tables are still used.
+        stat = os.stat(self.out_filename)
+        with open(self.out_filename, 'w') as file_object:
+            file_object.write(' ' * stat.st_size)
+        os.utime(self.out_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # The file is not read to hash it either.
+        with mock.patch.object(extraction_cache, 'content_hash',
+                               wraps=extraction_cache.content_hash) as hashed:
+            cached_sd = StructureDataBuilder(
+                self.input_filename, cache_dir=self.cache_dir).build(
+                self.out_filename)
+        hashed.assert_not_called()
+        sd = StructureDataBuilder(self.input_filename).build('PPh3_opt.out')
+        for section_name, data_section in sd.get_data_sections().items():
+            self.assertEqual(cached_sd.get_data_section_data(section_name),
+                             data_section.get_data())
+        self.assertIsNotNone(
+            cached_sd.get_data_section_datum('Mulliken Charges', '20 H'))
+        print('Table cache new inputs test complete.\n')
+
+    def test_missing_sections_reported(self):
+        """
+        Tests that sections which are not in the .out file are reported in
+        the same way whether its tables are parsed or taken from the cache.
+        """
+        messages = []
+        # The second build has new inputs, so its data are taken from the
+        # stored tables rather than the stored StructureData instance.
+        for input_filename in ('PPh3_test_input.json', self.input_filename):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                StructureDataBuilder(
+                    input_filename,
+                    cache_dir=self.cache_dir).build(self.out_filename)
+            messages.append(output.getvalue())
+        self.assertIn('Polarizability data not found', messages[0])
+        self.assertEqual(messages[1], messages[0])
+        print('Table cache missing sections test complete.\n')
+
+    def test_round_trip(self):
+        """
+        Tests that coordinate tables, dicts of strings and missing tables are
+        restored exactly, and that other tables are not stored.
+        """
+        table_cache = TableCache(self.cache_dir)
+        coordinates = np.array([[0.1, 0.2, 0.3], [1 / 3, 2 / 3, -1.0]])
+        tables = {
+            ('Geometry._parse_table', 'A', 'B', -1):
+                (('0 P', '1 C'), {'0 P': 0, '1 C': 1}, np.array([15.0, 6.0]),
+                 np.array([0.0, 0.0]), np.array([30.97, 12.011]),
+                 coordinates),
+            ('AtomicCharges._parse_table', 'C', 'D', -1):
+                {'0 P': '0.123', '1 C': '-0.456'},
+            ('DipoleMoments._parse_block', 'E', 'F', 0):
+                {'X': None, 'Tot': '1.5'},
+            ('Polarizability._parse_block', 'G', 'H', -1): None,
+        }
+        table_cache.put(self.out_filename, tables)
+        loaded = table_cache.get(self.out_filename)
+        self.assertEqual(loaded.keys(), tables.keys())
+        geometry = loaded[('Geometry._parse_table', 'A', 'B', -1)]
+        self.assertEqual(geometry[:2], (('0 P', '1 C'), {'0 P': 0, '1 C': 1}))
+        self.assertTrue(np.array_equal(geometry[5], coordinates))
+        self.assertFalse(geometry[5].flags.writeable)
+        self.assertEqual(loaded[('DipoleMoments._parse_block', 'E', 'F', 0)],
+                         {'X': None, 'Tot': '1.5'})
+        self.assertIsNone(
+            loaded[('Polarizability._parse_block', 'G', 'H', -1)])
+
+        with open(self.out_filename, 'a') as file_object:
+            file_object.write('\n')
+        self.assertIsNone(table_cache.get(self.out_filename))
+        table_cache.put(self.out_filename, {('other',): [1, 2]})
+        self.assertIsNone(table_cache.get(self.out_filename))
+        print('Table cache round trip test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
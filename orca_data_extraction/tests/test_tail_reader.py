@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from orca_data_extraction.src import extraction_cache
+from orca_data_extraction.src.dipole_moments import DipoleMoments
+from orca_data_extraction.src.final_geom import FinalGeometry
+from orca_data_extraction.src.initial_geom import InitialGeometry
+from orca_data_extraction.src.mulliken_charges import MullikenCharges
+from orca_data_extraction.src.polarizability import Polarizability
+from orca_data_extraction.src.section_index import SectionIndex
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+from orca_data_extraction.src.tail_reader import read_head_and_tail
+
+
+class CountingFile(io.RawIOBase):
+    """Binary file which counts how many bytes are read from it."""
+
+    def __init__(self, file_object):
+        super().__init__()
+        self.file_object = file_object
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        data = self.file_object.read(size)
+        self.bytes_read += len(data)
+        return data
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self.file_object.seek(offset, whence)
+
+    def fileno(self):
+        return self.file_object.fileno()
+
+
+class TestTailReader(unittest.TestCase):
+    """Tests for reading only the end and start of a .out file"""
+
+    def test_read_head_and_tail(self):
+        """
+        Tests that the blocks are the same as in the whole file, whatever the
+        size of the chunks, and that only a small part of the file is read
+        when every block is found near either end.
+        """
+        with open('PPh3_opt.out') as file_object:
+            contents = file_object.read()
+        index = SectionIndex(contents)
+        blocks = (FinalGeometry.get_blocks() + MullikenCharges.get_blocks() +
+                  InitialGeometry.get_blocks())
+        for chunk_size in (10, 4096):
+            # The polarizability is not in the file, and the dipole moment is
+            # only near its end.
+            for extra_blocks in ((), Polarizability.get_blocks(),
+                                 DipoleMoments.get_blocks()):
+                with open('PPh3_opt.out', 'rb') as file_object:
+                    tail_index = SectionIndex(read_head_and_tail(
+                        file_object, blocks + extra_blocks, chunk_size))
+                for block in blocks + extra_blocks:
+                    self.assertEqual(tail_index.get_block(*block),
+                                     index.get_block(*block))
+        with open('PPh3_opt.out', 'rb') as file_object:
+            self.assertLess(
+                len(read_head_and_tail(file_object, blocks, 4096)),
+                len(contents) // 4)
+        print('Tail reader test complete.\n')
+
+    def test_default_spec_read_size(self):
+        """
+        Tests that only a small part of an optimization is read for every
+        section asked for by the input file, even though the polarizability
+        is not in the file and the dipole moment is only near its end.
+        """
+        builder = StructureDataBuilder('PPh3_test_input.json')
+        blocks = tuple(block for _, data_section, _ in
+                       builder.get_section_specs()
+                       for block in data_section.get_blocks())
+        with open('PPh3_opt.out', 'rb') as file_object:
+            counting_file = CountingFile(file_object)
+            read_head_and_tail(counting_file, blocks, 4096)
+        self.assertLess(counting_file.bytes_read,
+                        os.path.getsize('PPh3_opt.out') // 2)
+        print('Tail reader read size test complete.\n')
+
+    def test_tail_build(self):
+        """
+        Tests that StructureData built from the end and start of the file has
+        the same data as that built from the file read as text.
+        """
+        text_sd = StructureDataBuilder('PPh3_test_input.json').build(
+            'PPh3_opt.out')
+        tail_sd = StructureDataBuilder(
+            'PPh3_test_input.json', read_mode='tail').build('PPh3_opt.out')
+        for section_name, data_section in text_sd.get_data_sections().items():
+            self.assertEqual(tail_sd.get_data_section_data(section_name),
+                             data_section.get_data())
+        print('Tail reader build test complete.\n')
+
+    def test_cached_tail_build(self):
+        """
+        Tests that a build from the end and start of the file with a cache
+        does not read the whole file to hash it, and is then found in the
+        cache.
+        """
+        cache_dir = tempfile.mkdtemp()
+        try:
+            builder = StructureDataBuilder('PPh3_test_input.json', cache_dir,
+                                           read_mode='tail')
+            with mock.patch.object(
+                    extraction_cache, 'content_hash',
+                    wraps=extraction_cache.content_hash) as hashed:
+                tail_sd = builder.build('PPh3_opt.out')
+                cached_sd = builder.build('PPh3_opt.out')
+            hashed.assert_not_called()
+        finally:
+            shutil.rmtree(cache_dir)
+        for section_name, data_section in tail_sd.get_data_sections().items():
+            self.assertEqual(cached_sd.get_data_section_data(section_name),
+                             data_section.get_data())
+        print('Tail reader cache test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+__author__ = "Peter Waddell"
+__copyright__ = "Copyright 2024"
+__credits__ = ["Peter Waddell"]
+__version__ = "0.1.1"
+__date__ = "2024/12/30"
+__maintainer__ = "Peter Waddell"
+__email__ = "pmwaddell9@gmail.com"
+__status__ = "Prototype"
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest import mock
+
+from orca_data_extraction.src import xlsx_writer as xlsx_writer_module
+from orca_data_extraction.src.csv_writer import get_data_columns
+from orca_data_extraction.src.structure_data_builder import StructureDataBuilder
+from orca_data_extraction.src.xlsx_writer import XLSXWriter
+
+
+@unittest.skipUnless(importlib.util.find_spec('xlsxwriter'),
+                     'xlsxwriter is not installed')
+class TestXLSXWriter(unittest.TestCase):
+    """Tests for the streaming .xlsx writer"""
+
+    def setUp(self):
+        builder = StructureDataBuilder('PPh3_test_input.json')
+        self.section_specs = builder.get_section_specs()
+        self.sd = builder.build('PPh3_opt.out')
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_write(self):
+        """
+        Tests that each StructureData instance is written as a row of numbers
+        below the two header rows, on one sheet or one sheet per section.
+        """
+        filename = os.path.join(self.directory, 'data.xlsx')
+        with XLSXWriter(filename, self.section_specs) as xlsx_writer:
+            xlsx_writer.write(self.sd)
+            xlsx_writer.write(self.sd)
+        self.assertEqual(xlsx_writer.get_row_count(), 2)
+        with zipfile.ZipFile(filename) as xlsx_file:
+            workbook = xlsx_file.read('xl/workbook.xml').decode('utf-8')
+            sheet = xlsx_file.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        self.assertIn('name="Sheet 1"', workbook)
+        self.assertEqual(sheet.count('<row '), 4)
+        self.assertEqual(sheet.count('<v>1.85902</v>'), 2)
+        self.assertIn('Bond Lengths', sheet)
+
+        filename = os.path.join(self.directory, 'sections.xlsx')
+        with XLSXWriter(filename, self.section_specs,
+                        split_sections=True) as xlsx_writer:
+            xlsx_writer.write(self.sd)
+        with zipfile.ZipFile(filename) as xlsx_file:
+            workbook = xlsx_file.read('xl/workbook.xml').decode('utf-8')
+        for section_name, _, _ in self.section_specs:
+            self.assertIn(f'name="{section_name}"', workbook)
+        print('XLSX write test complete.\n')
+
+    def test_sheet_limits(self):
+        """
+        Tests that a section with more columns than a sheet can hold is split
+        across numbered sheets, and that rows beyond the last one a sheet can
+        hold are refused.
+        """
+        column_counts = {}
+        for _, section_name, _, _ in get_data_columns(self.section_specs):
+            column_counts[section_name] = \
+                column_counts.get(section_name, 0) + 1
+        filename = os.path.join(self.directory, 'sections.xlsx')
+        # Each sheet holds the .out filenames and 3 data columns.
+        with mock.patch.object(xlsx_writer_module, 'MAX_COLUMNS', 4), \
+                mock.patch.object(xlsx_writer_module, 'MAX_ROWS', 3):
+            with XLSXWriter(filename, self.section_specs,
+                            split_sections=True) as xlsx_writer:
+                xlsx_writer.write(self.sd)
+                with self.assertRaises(ValueError):
+                    xlsx_writer.write(self.sd)
+        with zipfile.ZipFile(filename) as xlsx_file:
+            workbook = xlsx_file.read('xl/workbook.xml').decode('utf-8')
+        for section_name, column_count in column_counts.items():
+            if column_count <= 3:
+                self.assertIn(f'name="{section_name}"', workbook)
+                continue
+            for sheet_number in range(1, (column_count + 2) // 3 + 1):
+                self.assertIn(f'name="{section_name} {sheet_number}"',
+                              workbook)
+        self.assertTrue(any(count > 3 for count in column_counts.values()))
+        print('XLSX sheet limits test complete.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()